@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Measure resident memory of the conjugation cache per 10k conjugations.
+
+Each variant runs in a fresh interpreter: synthetic PostgREST pages are
+parsed into Conjugation models and loaded, through the keyset-paged path,
+either into the previous model-holding cache or into the current cache of
+compact ConjugationRecords. The RSS growth is reported per 10k rows.
+
+Linux only (reads /proc/self/statm).
+
+Usage:
+    python scripts/benchmarks/bench_cache_memory.py
+    python scripts/benchmarks/bench_cache_memory.py --conjugations 80000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import subprocess
+import sys
+import uuid
+from bisect import bisect_right
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "gpt-4o-mini")
+os.environ.setdefault("REASONING_MODEL", "o3-mini")
+
+from src.cache.conjugation_cache import ConjugationCache  # noqa: E402
+from src.schemas.verbs import Conjugation, Tense  # noqa: E402
+
+PAGE_SIZE = 1000
+ENDINGS = ("e", "es", "e", "ons", "ez", "ent")
+
+
+class LegacyConjugationCache(ConjugationCache):
+    """The previous cache: Pydantic models in a key index and per-verb dicts."""
+
+    async def load(self, repository):
+        self._conjugations = {}
+        self._by_verb = {}
+        self._verb_views = {}
+        after = None
+        while True:
+            page = await repository.get_conjugations_page(after=after, limit=PAGE_SIZE)
+            for conj in page:
+                key = (
+                    conj.infinitive,
+                    conj.auxiliary.value,
+                    conj.reflexive,
+                    conj.tense.value,
+                )
+                self._conjugations[key] = conj
+                verb_key = key[:3]
+                self._by_verb.setdefault(verb_key, {})[conj.tense] = conj
+            if len(page) < PAGE_SIZE:
+                break
+            after = page[-1].id
+        self._loaded = True
+
+
+class SyntheticRepository:
+    """Serves JSON pages the way PostgREST would (fresh strings per row)."""
+
+    def __init__(self, count: int):
+        now = datetime.now(UTC).isoformat()
+        tenses = [t.value for t in Tense]
+        rows = []
+        for i in range(count):
+            stem = f"verb{i // len(tenses)}"
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "infinitive": f"{stem}er",
+                    "auxiliary": "avoir",
+                    "reflexive": False,
+                    "tense": tenses[i % len(tenses)],
+                    "first_person_singular": stem + ENDINGS[0],
+                    "second_person_singular": stem + ENDINGS[1],
+                    "third_person_singular": stem + ENDINGS[2],
+                    "first_person_plural": stem + ENDINGS[3],
+                    "second_person_plural": stem + ENDINGS[4],
+                    "third_person_plural": stem + ENDINGS[5],
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        rows.sort(key=lambda row: row["id"])
+        self._rows = rows
+        self._ids = [row["id"] for row in rows]
+
+    async def get_conjugations_page(self, after=None, until=None, limit=PAGE_SIZE):
+        start = 0 if after is None else bisect_right(self._ids, str(after))
+        end = len(self._ids) if until is None else bisect_right(self._ids, str(until))
+        # Round-trip through JSON so every page brings fresh strings
+        rows = json.loads(json.dumps(self._rows[start : min(end, start + limit)]))
+        return [Conjugation.model_validate(row) for row in rows]
+
+    async def count_conjugations(self) -> int:
+        return len(self._rows)
+
+
+def rss_bytes() -> int:
+    """Current resident set size."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def measure(variant: str, count: int) -> int:
+    """RSS growth from loading `count` conjugations into the cache."""
+    repository = SyntheticRepository(count)
+    cache = LegacyConjugationCache() if variant == "models" else ConjugationCache()
+    gc.collect()
+    before = rss_bytes()
+
+    await cache.load(repository)
+
+    gc.collect()
+    return rss_bytes() - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--conjugations", type=int, default=40000)
+    parser.add_argument(
+        "--child", choices=["models", "records"], help=argparse.SUPPRESS
+    )
+    args = parser.parse_args()
+
+    if args.child:
+        print(asyncio.run(measure(args.child, args.conjugations)))
+        return
+
+    results = {}
+    for variant in ("models", "records"):
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                variant,
+                "--conjugations",
+                str(args.conjugations),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[variant] = int(output.strip().splitlines()[-1])
+
+    per_10k = {k: v / args.conjugations * 10_000 / 2**20 for k, v in results.items()}
+    print(f"conjugations:         {args.conjugations}")
+    print(f"Pydantic models:      {per_10k['models']:8.2f} MiB RSS per 10k")
+    print(f"ConjugationRecords:   {per_10k['records']:8.2f} MiB RSS per 10k")
+    print(f"reduction:            {1 - per_10k['records'] / per_10k['models']:8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Benchmark IP allowlist checks with large CIDR lists.
+
+Compares the previous per-request linear scan (re-parsing every entry with
+ipaddress.ip_network) against the precompiled IpAllowlist cached per key.
+
+Usage:
+    python scripts/benchmarks/bench_ip_allowlist.py
+    python scripts/benchmarks/bench_ip_allowlist.py --entries 1000 --checks 2000
+"""
+
+import argparse
+import ipaddress
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.schemas.api_keys import IpAllowlist  # noqa: E402
+
+
+def linear_check_ip_allowed(client_ip: str, allowed_ips: list[str] | None) -> bool:
+    """The previous check_ip_allowed implementation (parses on every call)."""
+    if not allowed_ips:
+        return True
+    if client_ip in allowed_ips:
+        return True
+    try:
+        client_addr = ipaddress.ip_address(client_ip)
+        for allowed_ip in allowed_ips:
+            try:
+                if client_addr in ipaddress.ip_network(allowed_ip, strict=False):
+                    return True
+            except (ValueError, TypeError):
+                continue
+        return False
+    except (ValueError, TypeError):
+        return False
+
+
+def build_allowlist(entries: int) -> list[str]:
+    """Mixed IPv4/IPv6 CIDR allowlist of the requested size."""
+    rng = random.Random(42)
+    allowed = []
+    for i in range(entries):
+        if i % 4 == 3:
+            allowed.append(f"2001:db8:{rng.randrange(65536):x}::/48")
+        else:
+            prefix = rng.choice([16, 24, 28, 32])
+            addr = ipaddress.ip_address(rng.getrandbits(32))
+            allowed.append(str(ipaddress.ip_network(f"{addr}/{prefix}", strict=False)))
+    return allowed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=1000)
+    parser.add_argument("--checks", type=int, default=2000)
+    args = parser.parse_args()
+
+    allowed_ips = build_allowlist(args.entries)
+    rng = random.Random(7)
+    clients = [
+        str(ipaddress.ip_address(rng.getrandbits(32))) for _ in range(args.checks)
+    ]
+
+    start = time.perf_counter()
+    compiled = IpAllowlist(allowed_ips)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    linear_results = [linear_check_ip_allowed(ip, allowed_ips) for ip in clients]
+    linear = (time.perf_counter() - start) / args.checks
+
+    start = time.perf_counter()
+    compiled_results = [compiled.allows(ip) for ip in clients]
+    indexed = (time.perf_counter() - start) / args.checks
+
+    assert linear_results == compiled_results, "compiled allowlist disagrees"
+
+    print(f"allowlist entries:    {args.entries}")
+    print(f"checks:               {args.checks} ({sum(compiled_results)} allowed)")
+    print(f"compile (once/key):   {compile_time * 1e3:10.2f} ms")
+    print(f"linear scan:          {linear * 1e6:10.2f} µs/check")
+    print(f"compiled bisect:      {indexed * 1e6:10.2f} µs/check")
+    print(f"speedup:              {linear / indexed:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
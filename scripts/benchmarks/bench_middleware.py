@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+"""
+Benchmark per-request overhead of the auth and endpoint-access middleware.
+
+Drives a minimal FastAPI app serving /api/v1/problems/random directly over
+ASGI (no network, stubbed API key service) and compares the previous
+BaseHTTPMiddleware-based stack against the pure-ASGI middleware.
+
+Usage:
+    python scripts/benchmarks/bench_middleware.py
+    python scripts/benchmarks/bench_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "gpt-4o-mini")
+os.environ.setdefault("REASONING_MODEL", "o3-mini")
+os.environ.setdefault("ENVIRONMENT", "staging")
+os.environ.setdefault("CORS_ORIGINS", '["https://example.com"]')
+
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from src.core.auth import ApiKeyAuthMiddleware  # noqa: E402
+from src.core.config import get_settings  # noqa: E402
+from src.core.endpoint_access import (  # noqa: E402
+    PUBLIC_ENDPOINTS,
+    EndpointAccessMiddleware,
+)
+
+PATH = "/api/v1/problems/random"
+
+
+class _StubKey:
+    def model_dump(self):
+        return {"name": "bench", "permissions_scope": ["read"]}
+
+
+class _StubService:
+    async def authenticate_api_key(self, api_key, client_ip):
+        return _StubKey()
+
+
+async def _create_stub_service():
+    return _StubService()
+
+
+class LegacyEndpointAccessMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware endpoint filter."""
+
+    async def dispatch(self, request: Request, call_next):
+        settings = get_settings()
+        if settings.is_development:
+            return await call_next(request)
+        path = request.url.path
+        if not any(path.startswith(e) or path == e for e in PUBLIC_ENDPOINTS):
+            raise RuntimeError("unexpected block")
+        return await call_next(request)
+
+
+class LegacyApiKeyAuthMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware auth flow (happy path only)."""
+
+    async def dispatch(self, request: Request, call_next):
+        settings = get_settings()
+        path = request.url.path
+        patterns = ["/health", "/metrics"]
+        if path == "/":
+            return await call_next(request)
+        if not settings.is_production:
+            patterns.extend(["/docs", "/redoc", "/openapi.json"])
+        if any(path.startswith(p) for p in patterns):
+            return await call_next(request)
+
+        api_key = request.headers.get("X-API-Key")
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        client_ip = (
+            forwarded_for.split(",")[0].strip() if forwarded_for else "127.0.0.1"
+        )
+        service = await _create_stub_service()
+        key = await service.authenticate_api_key(api_key, client_ip)
+        request.state.api_key_info = key.model_dump()
+        request.state.client_ip = client_ip
+        return await call_next(request)
+
+
+def build_app(auth_cls=None, access_cls=None) -> FastAPI:
+    """Minimal app with the same middleware order as src.main."""
+    app = FastAPI()
+
+    @app.get(PATH)
+    async def random_problem():
+        return {"id": "bench", "statements": []}
+
+    if access_cls:
+        app.add_middleware(access_cls)
+    if auth_cls:
+        app.add_middleware(auth_cls)
+    return app
+
+
+async def run(app: FastAPI, requests: int) -> float:
+    """Issue requests over raw ASGI and return seconds per request."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"x-api-key", b"sk_live_bench"),
+            (b"x-forwarded-for", b"203.0.113.7"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message
+
+    # Warm up routing, validation and settings caches
+    for _ in range(200):
+        await app(dict(scope), receive, send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+async def main_async(requests: int):
+    with patch("src.core.auth.create_api_key_service", _create_stub_service):
+        bare = await run(build_app(), requests)
+        legacy = await run(
+            build_app(LegacyApiKeyAuthMiddleware, LegacyEndpointAccessMiddleware),
+            requests,
+        )
+        current = await run(
+            build_app(ApiKeyAuthMiddleware, EndpointAccessMiddleware), requests
+        )
+
+    print(f"requests:             {requests} x GET {PATH}")
+    print(f"no middleware:        {bare * 1e6:10.1f} µs/request")
+    print(
+        f"BaseHTTPMiddleware:   {legacy * 1e6:10.1f} µs/request "
+        f"(+{(legacy - bare) * 1e6:.1f} µs)"
+    )
+    print(
+        f"pure ASGI:            {current * 1e6:10.1f} µs/request "
+        f"(+{(current - bare) * 1e6:.1f} µs)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
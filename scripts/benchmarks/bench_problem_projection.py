@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+"""
+Measure the bytes read per problem for each ProblemProjection.
+
+Builds a stored problem row with a generation trace shaped like the ones the
+generator writes (four sentences, each with its prompt and reasoning), then
+reports the JSON bytes PostgREST returns per row and per pool refill batch
+for each projection, the time to validate a row into a Problem, and the size
+of the /problems/random response bodies.
+
+Usage:
+    python scripts/benchmarks/bench_problem_projection.py
+    python scripts/benchmarks/bench_problem_projection.py --prompt-kb 6 --batch 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "gpt-4o-mini")
+os.environ.setdefault("REASONING_MODEL", "o3-mini")
+
+from src.api.models.problems import ProblemResponse  # noqa: E402
+from src.repositories.problem_repository import PROJECTION_COLUMNS  # noqa: E402
+from src.schemas.llm_response import (  # noqa: E402
+    LLMResponse,
+    ProblemGenerationTrace,
+    SentenceGenerationTrace,
+)
+from src.schemas.problems import Problem, ProblemProjection  # noqa: E402
+
+
+def make_trace(prompt_kb: int, reasoning_kb: int) -> dict:
+    """A four sentence generation trace as stored in problems.generation_trace."""
+    trace = ProblemGenerationTrace(
+        model="gpt-4o-mini",
+        prompt_version="2.1",
+        total_generation_time_ms=8421.5,
+    )
+    for i in range(4):
+        trace.add_sentence_trace(
+            SentenceGenerationTrace(
+                sentence_index=i,
+                is_correct=i == 0,
+                error_type=None if i == 0 else "wrong_conjugation",
+                llm_response=LLMResponse(
+                    content="{}",
+                    model="gpt-4o-mini",
+                    response_id=f"resp_{uuid.uuid4().hex}",
+                    duration_ms=2100.0,
+                    prompt_tokens=prompt_kb * 256,
+                    completion_tokens=180,
+                    total_tokens=prompt_kb * 256 + 180,
+                    reasoning_tokens=reasoning_kb * 256,
+                    reasoning_content="Le pronom COI précède « en ». "
+                    * (reasoning_kb * 32),
+                ),
+                prompt_text="Generate a French sentence using parler. "
+                * (prompt_kb * 25),
+            )
+        )
+    return trace.to_dict()
+
+
+def make_row(trace: dict) -> dict:
+    """A problems table row as PostgREST returns it for select=*."""
+    now = datetime.now(UTC).isoformat()
+    return {
+        "id": str(uuid.uuid4()),
+        "created_at": now,
+        "updated_at": now,
+        "last_served_at": now,
+        "generation_request_id": str(uuid.uuid4()),
+        "problem_type": "grammar",
+        "title": "Grammar: parler",
+        "instructions": "Choose the correctly formed French sentence.",
+        "correct_answer_index": 0,
+        "target_language_code": "eng",
+        "statements": [
+            {
+                "content": f"Je ne lui en parle pas ({i}).",
+                "is_correct": i == 0,
+                "translation": "I don't talk to him about it.",
+                "explanation": "Les pronoms COI précèdent « en ».",
+            }
+            for i in range(4)
+        ],
+        "topic_tags": ["grammar", "pronouns", "negation"],
+        "source_statement_ids": [str(uuid.uuid4()) for _ in range(4)],
+        "metadata": {"grammatical_focus": ["indirect_objects"], "verb": "parler"},
+        "generation_trace": trace,
+    }
+
+
+def project(row: dict, projection: ProblemProjection) -> dict:
+    """The row as returned for the projection's select clause."""
+    columns = PROJECTION_COLUMNS[projection]
+    if columns == "*":
+        return dict(row)
+    return {name.strip(): row[name.strip()] for name in columns.split(",")}
+
+
+def timed_validate(row: dict, calls: int) -> float:
+    """Return seconds per Problem.model_validate."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        Problem.model_validate(row)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--prompt-kb", type=int, default=4, help="Prompt size per sentence"
+    )
+    parser.add_argument(
+        "--reasoning-kb", type=int, default=2, help="Reasoning size per sentence"
+    )
+    parser.add_argument("--batch", type=int, default=50, help="Pool refill batch")
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    row = make_row(make_trace(args.prompt_kb, args.reasoning_kb))
+    full_bytes = len(json.dumps(project(row, ProblemProjection.FULL)))
+
+    print(
+        f"{'projection':>10}  {'bytes/row':>10}  {'KB/batch':>9}  "
+        f"{'vs full':>8}  {'validate':>10}"
+    )
+    for projection in (ProblemProjection.FULL, ProblemProjection.SERVING):
+        projected = project(row, projection)
+        size = len(json.dumps(projected))
+        validate = timed_validate(projected, args.calls)
+        print(
+            f"{projection.value:>10}  {size:>10,}  "
+            f"{size * args.batch / 1024:>9.1f}  {size / full_bytes:>7.1%}  "
+            f"{validate * 1e6:>7.1f} µs"
+        )
+
+    problem = Problem.model_validate(row)
+    print()
+    for include_metadata in (False, True):
+        body = ProblemResponse.render(problem, include_metadata=include_metadata)
+        print(f"/problems/random include_metadata={include_metadata}: {len(body):,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+Benchmark building the /problems/random response body per request.
+
+Compares FastAPI's response model path (build a ProblemResponse, re-validate
+and encode it through the route's response field, then JSONResponse) with
+ProblemResponse.render on request (database fallback) and with a body
+pre-rendered by the problem pool (wrap the bytes in a Response).
+
+Usage:
+    python scripts/benchmarks/bench_problem_response.py
+    python scripts/benchmarks/bench_problem_response.py --calls 50000 --trace-kb 8
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "gpt-4o-mini")
+os.environ.setdefault("REASONING_MODEL", "o3-mini")
+
+from fastapi import Response  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from src.api.models.problems import ProblemResponse  # noqa: E402
+from src.schemas.problems import Problem, ProblemType  # noqa: E402
+
+
+def make_problem(trace_kb: int) -> Problem:
+    """A grammar problem shaped like the generated ones."""
+    now = datetime.now(UTC)
+    return Problem(
+        id=uuid.uuid4(),
+        problem_type=ProblemType.GRAMMAR,
+        title="Grammar: parler",
+        instructions="Choose the correctly formed French sentence.",
+        correct_answer_index=0,
+        target_language_code="eng",
+        statements=[
+            {
+                "content": f"Je ne lui en parle pas ({i}).",
+                "is_correct": i == 0,
+                "translation": "I don't talk to him about it.",
+                "explanation": "Les pronoms COI précèdent « en ».",
+            }
+            for i in range(4)
+        ],
+        topic_tags=["grammar", "pronouns", "negation"],
+        source_statement_ids=[uuid.uuid4() for _ in range(4)],
+        metadata={"grammatical_focus": ["indirect_objects"], "verb": "parler"},
+        generation_trace={"reasoning": "x" * (trace_kb * 1024)},
+        created_at=now,
+        updated_at=now,
+        last_served_at=None,
+    )
+
+
+async def response_model_path(field, problem: Problem, include_metadata: bool):
+    """What FastAPI did for the endpoint's return value."""
+    model = ProblemResponse.from_problem(problem, include_metadata=include_metadata)
+    content = await serialize_response(field=field, response_content=model)
+    return JSONResponse(content)
+
+
+async def render_path(problem: Problem, include_metadata: bool):
+    body = ProblemResponse.render(problem, include_metadata=include_metadata)
+    return Response(content=body, media_type="application/json")
+
+
+async def pooled_path(body: bytes):
+    return Response(content=body, media_type="application/json")
+
+
+async def timed(make, calls: int) -> float:
+    """Return seconds per response."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        await make()
+    return (time.perf_counter() - start) / calls
+
+
+async def main_async(calls: int, trace_kb: int):
+    field = create_model_field(
+        name="Response_get_random_problem", type_=ProblemResponse
+    )
+    problem = make_problem(trace_kb)
+
+    print(
+        f"{'metadata':>8}  {'response model':>15}  {'render':>10}  "
+        f"{'pre-rendered':>13}  {'speedup':>8}"
+    )
+    for include_metadata in (False, True):
+        body = ProblemResponse.render(problem, include_metadata=include_metadata)
+        legacy = await timed(
+            lambda: response_model_path(field, problem, include_metadata), calls
+        )
+        rendered = await timed(lambda: render_path(problem, include_metadata), calls)
+        pooled = await timed(lambda: pooled_path(body), calls)
+
+        print(
+            f"{include_metadata!s:>8}  {legacy * 1e6:>12.1f} µs  "
+            f"{rendered * 1e6:>7.1f} µs  {pooled * 1e6:>10.2f} µs  "
+            f"{legacy / pooled:>7.0f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument(
+        "--trace-kb", type=int, default=4, help="Size of the generation trace"
+    )
+    args = parser.parse_args()
+    asyncio.run(main_async(args.calls, args.trace_kb))
+
+
+if __name__ == "__main__":
+    main()
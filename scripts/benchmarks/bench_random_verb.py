@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Benchmark VerbCache.get_random_verb with and without partitioned pools.
+
+Loads synthetic verbs (a mix of COD/COI capabilities plus some test verbs)
+into a VerbCache and compares the previous filter-per-call selection against
+the precomputed random selection partitions.
+
+Usage:
+    python scripts/benchmarks/bench_random_verb.py
+    python scripts/benchmarks/bench_random_verb.py --sizes 1000 50000 --calls 20000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "gpt-4o-mini")
+os.environ.setdefault("REASONING_MODEL", "o3-mini")
+
+from src.cache.verb_cache import VerbCache  # noqa: E402
+from src.schemas.verbs import AuxiliaryType, Verb, VerbClassification  # noqa: E402
+
+# (requires_cod, requires_coi) combinations used by problem generation
+FILTERS = [(False, False), (True, False), (False, True), (True, True)]
+
+
+class LegacyVerbCache(VerbCache):
+    """The previous get_random_verb, filtering the language list per call."""
+
+    async def get_random_verb(
+        self,
+        target_language_code: str = "eng",
+        requires_cod: bool = False,
+        requires_coi: bool = False,
+    ) -> Verb | None:
+        if not self._loaded:
+            self._misses += 1
+            return None
+
+        all_verbs = self._indexes.by_language.get(target_language_code, {}).values()
+        verbs = [v for v in all_verbs if not v.is_test]
+        if requires_cod:
+            verbs = [v for v in verbs if v.can_have_cod]
+        if requires_coi:
+            verbs = [v for v in verbs if v.can_have_coi]
+
+        if not verbs:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return random.choice(verbs)
+
+
+def make_verbs(count: int) -> list[Verb]:
+    """Synthetic verbs; about 2% are test verbs."""
+    rng = random.Random(42)
+    now = datetime.now(UTC)
+    return [
+        Verb(
+            id=uuid.uuid4(),
+            infinitive=f"verbe{i}er",
+            auxiliary=AuxiliaryType.AVOIR,
+            reflexive=False,
+            target_language_code="eng",
+            translation=f"to verb {i}",
+            past_participle=f"verbe{i}é",
+            present_participle=f"verbe{i}ant",
+            classification=VerbClassification.FIRST_GROUP,
+            is_irregular=False,
+            can_have_cod=rng.random() < 0.6,
+            can_have_coi=rng.random() < 0.3,
+            is_test=rng.random() < 0.02,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+class _Repository:
+    def __init__(self, verbs: list[Verb]):
+        self._verbs = verbs
+
+    async def get_all_verbs(self, limit=10000):
+        return self._verbs
+
+
+async def run(cache: VerbCache, calls: int) -> float:
+    """Return seconds per get_random_verb call, cycling through filters."""
+    start = time.perf_counter()
+    for i in range(calls):
+        cod, coi = FILTERS[i % len(FILTERS)]
+        await cache.get_random_verb("eng", requires_cod=cod, requires_coi=coi)
+    return (time.perf_counter() - start) / calls
+
+
+async def main_async(sizes: list[int], calls: int):
+    print(f"{'verbs':>8}  {'filter per call':>18}  {'partitioned':>14}  {'speedup':>8}")
+    for size in sizes:
+        repository = _Repository(make_verbs(size))
+        legacy = LegacyVerbCache()
+        current = VerbCache()
+        await legacy.load(repository)
+        await current.load(repository)
+
+        # The legacy path is O(n) per call; keep the large runs bounded
+        legacy_calls = max(100, min(calls, 20_000_000 // size))
+        legacy_time = await run(legacy, legacy_calls)
+        current_time = await run(current, calls)
+
+        print(
+            f"{size:>8}  {legacy_time * 1e6:>15.1f} µs  "
+            f"{current_time * 1e6:>11.2f} µs  {legacy_time / current_time:>7.0f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 50000])
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.sizes, args.calls))
+
+
+if __name__ == "__main__":
+    main()
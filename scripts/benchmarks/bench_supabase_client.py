@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark Supabase client acquisition on the request hot path.
+
+Compares building a fresh client per request (the old behaviour of
+get_supabase_client) with reusing the pooled per-event-loop client.
+No network I/O is performed - this isolates client construction cost
+(httpx clients, SSL contexts, auth/storage sub-clients).
+
+Usage:
+    python scripts/benchmarks/bench_supabase_client.py
+    python scripts/benchmarks/bench_supabase_client.py --requests 500
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the path so we can import src
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Settings require these; the benchmark never talks to a real service
+os.environ.setdefault("LLM_PROVIDER", "openai")
+os.environ.setdefault("STANDARD_MODEL", "benchmark")
+os.environ.setdefault("REASONING_MODEL", "benchmark")
+os.environ.setdefault("SUPABASE_URL", "https://benchmark.supabase.co")
+os.environ.setdefault(
+    "SUPABASE_SERVICE_ROLE_KEY",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.eyJyb2xlIjoic2VydmljZV9yb2xlIn0.bench",
+)
+
+
+async def bench(requests: int) -> None:
+    from src.clients.supabase import (
+        close_supabase_client,
+        create_supabase_client,
+        get_supabase_client,
+    )
+
+    # Per-request construction (previous behaviour)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await create_supabase_client()
+    per_request = (time.perf_counter() - start) / requests
+
+    # Pooled client (first call builds it, the rest reuse it)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await get_supabase_client()
+    pooled = (time.perf_counter() - start) / requests
+    await close_supabase_client()
+
+    print(f"requests:                 {requests}")
+    print(f"per-request construction: {per_request * 1e6:10.1f} µs/request")
+    print(f"pooled client:            {pooled * 1e6:10.1f} µs/request")
+    print(f"speedup:                  {per_request / pooled:10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(bench(args.requests))
+
+
+if __name__ == "__main__":
+    main()
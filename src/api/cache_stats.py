@@ -5,6 +5,9 @@ import logging
 from fastapi import APIRouter
 
 from src.cache import api_key_cache, conjugation_cache, verb_cache
+from src.cache.problem_pool import problem_pool
+from src.cache.single_flight import conjugation_loads, verb_loads
+from src.cache.snapshot import cache_warmup
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +35,19 @@ router = APIRouter(tags=["Cache"])
                             "hits": 15234,
                             "misses": 45,
                             "hit_rate": "99.71%",
+                            "lookups": {
+                                "by_id": {"hits": 9120, "misses": 12},
+                                "random": {"hits": 6114, "misses": 33},
+                            },
+                            "memory_bytes": 2893312,
+                            "last_load": {
+                                "rows": 1542,
+                                "pages": 6,
+                                "seconds": 0.214,
+                                "rows_per_second": 7205.6,
+                                "pages_per_second": 28.0,
+                                "attempts": 1,
+                            },
                         },
                         "conjugation_cache": {
                             "loaded": True,
@@ -40,6 +56,19 @@ router = APIRouter(tags=["Cache"])
                             "hits": 8562,
                             "misses": 12,
                             "hit_rate": "99.86%",
+                            "lookups": {
+                                "by_key": {"hits": 1210, "misses": 12},
+                                "by_verb": {"hits": 7352, "misses": 0},
+                            },
+                            "memory_bytes": 6121472,
+                            "last_load": {
+                                "rows": 10794,
+                                "pages": 14,
+                                "seconds": 0.982,
+                                "rows_per_second": 10991.9,
+                                "pages_per_second": 14.3,
+                                "attempts": 1,
+                            },
                         },
                         "api_key_cache": {
                             "loaded": True,
@@ -48,6 +77,63 @@ router = APIRouter(tags=["Cache"])
                             "hits": 25678,
                             "misses": 3,
                             "hit_rate": "99.99%",
+                            "verified_entries": 3,
+                            "verified_hits": 25410,
+                            "verified_misses": 268,
+                            "negative_entries": 12,
+                            "negative_hits": 4210,
+                            "negative_stores": 57,
+                            "negative_evictions": 0,
+                            "lookups": {
+                                "by_prefix": {"hits": 25678, "misses": 3},
+                                "verified": {"hits": 25410, "misses": 268},
+                            },
+                            "memory_bytes": 18944,
+                            "last_load": {
+                                "rows": 3,
+                                "pages": 4,
+                                "seconds": 0.041,
+                                "rows_per_second": 73.2,
+                                "pages_per_second": 97.6,
+                                "attempts": 1,
+                            },
+                        },
+                        "single_flight": {
+                            "verbs": {
+                                "in_flight": 0,
+                                "loads": 45,
+                                "coalesced": 12,
+                                "errors": 0,
+                                "rejected": 0,
+                                "coalesced_rate": "21.05%",
+                            },
+                            "conjugations": {
+                                "in_flight": 0,
+                                "loads": 12,
+                                "coalesced": 3,
+                                "errors": 0,
+                                "rejected": 0,
+                                "coalesced_rate": "20.00%",
+                            },
+                        },
+                        "problem_pool": {
+                            "running": True,
+                            "depth": 143,
+                            "size": 200,
+                            "served": 48211,
+                            "fallbacks": 4,
+                            "served_rate": "99.99%",
+                            "expired": 310,
+                            "refills": 982,
+                            "failed_refills": 0,
+                            "last_refill_seconds": 0.0231,
+                        },
+                        "warmup": {
+                            "source": "snapshot",
+                            "snapshot_version": 4182,
+                            "seconds": 0.312,
+                            "warming": False,
+                            "refreshing": False,
                         },
                     }
                 }
@@ -65,4 +151,10 @@ async def get_cache_stats():
         "verb_cache": verb_cache.get_stats(),
         "conjugation_cache": conjugation_cache.get_stats(),
         "api_key_cache": api_key_cache.get_stats(),
+        "single_flight": {
+            "verbs": verb_loads.get_stats(),
+            "conjugations": conjugation_loads.get_stats(),
+        },
+        "problem_pool": problem_pool.get_stats(),
+        "warmup": cache_warmup.get_stats(),
     }
@@ -1,16 +1,14 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter, Depends, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse
 
+from ..cache.snapshot import cache_warmup
 from ..core.config import Settings, get_settings
+from ..core.limiter import limiter
 
 router = APIRouter(tags=["Health"])
 
-# Get limiter instance
-limiter = Limiter(key_func=get_remote_address)
-
 
 @router.get(
     "/",
@@ -125,3 +123,73 @@ async def health_check(request: Request, settings: Settings = Depends(get_settin
         "environment": settings.environment,
         "rate_limit": f"{settings.rate_limit_requests}/minute",
     }
+
+
+@router.get(
+    "/health/ready",
+    summary="Readiness check",
+    description="""
+    Readiness check: whether the in-memory caches needed to serve requests
+    quickly are loaded.
+
+    `/health` answers as soon as the process is up (liveness). With
+    `CACHE_WARMUP_MODE=background` the caches are warmed after startup, API
+    keys first; until the API key and verb caches are in, this endpoint
+    returns 503 and requests are served from bounded database fallbacks.
+
+    Use Cases:
+    - Load balancer / Fly health checks that route only to warm machines
+    - Deployment checks waiting for a new machine to be ready
+
+    Rate Limit: 100 requests per minute
+    Authentication: Not required
+    """,
+    responses={
+        200: {
+            "description": "Caches are warm",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "ready",
+                        "ready": True,
+                        "caches": {
+                            "api_keys": True,
+                            "verbs": True,
+                            "conjugations": True,
+                        },
+                        "warming": False,
+                        "error": None,
+                    }
+                }
+            },
+        },
+        503: {
+            "description": "Caches are still warming",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "warming",
+                        "ready": False,
+                        "caches": {
+                            "api_keys": True,
+                            "verbs": False,
+                            "conjugations": False,
+                        },
+                        "warming": True,
+                        "error": None,
+                    }
+                }
+            },
+        },
+    },
+)
+@limiter.limit("100/minute")
+async def readiness_check(request: Request):
+    """Readiness endpoint."""
+    readiness = cache_warmup.readiness()
+    if readiness["ready"]:
+        return {"status": "ready", **readiness}
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "warming", **readiness},
+    )
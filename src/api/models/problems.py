@@ -141,6 +141,11 @@ class ProblemResponse(BaseModel):
 
         return cls(**response_data)
 
+    @classmethod
+    def render(cls, problem, include_metadata: bool = False) -> bytes:
+        """JSON response body for a problem (what FastAPI would send for it)."""
+        return cls.from_problem(problem, include_metadata).model_dump_json().encode()
+
 
 class ProblemGenerationEnqueuedResponse(BaseModel):
     """Response model for async problem generation (202 Accepted)."""
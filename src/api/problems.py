@@ -4,28 +4,38 @@ import logging
 from collections.abc import AsyncGenerator
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 
 from src.api.models.problems import (
     ProblemGenerationEnqueuedResponse,
     ProblemRandomRequest,
     ProblemResponse,
 )
+from src.cache.problem_pool import problem_pool
 from src.core.auth import get_current_api_key
 from src.core.dependencies import get_problem_service
+from src.core.limiter import limiter
+from src.schemas.problems import ProblemProjection
 from src.services.problem_service import ProblemService
 from src.services.queue_service import QueueService
 
 logger = logging.getLogger(__name__)
 
-# Get limiter instance
-limiter = Limiter(key_func=get_remote_address)
-
 API_PREFIX = "/problems"
 router = APIRouter(prefix=API_PREFIX, tags=["Problems"])
 
+# Most problems returned by one /random?count=N request
+MAX_RANDOM_PROBLEMS = 50
+
 
 async def get_queue_service() -> AsyncGenerator[QueueService, None]:
     """
@@ -42,9 +52,52 @@ async def get_queue_service() -> AsyncGenerator[QueueService, None]:
         await service.close()
 
 
+async def _serve_problems(
+    service: ProblemService, count: int | None, include_metadata: bool
+) -> dict[UUID, bytes]:
+    """
+    Response bodies for up to `count` distinct problems (one when None).
+
+    Taken from the problem pool first; the rest are claimed from the database
+    in one query. Keyed by problem ID, in serving order (internal helper).
+
+    Pooled problems have no generation trace, so requests with metadata skip
+    the pool and read every column.
+    """
+    wanted = count or 1
+    served: dict[UUID, bytes] = {}
+
+    if include_metadata:
+        projection = ProblemProjection.FULL
+    else:
+        projection = ProblemProjection.SERVING
+        while len(served) < wanted and (pooled := problem_pool.take()) is not None:
+            body = pooled.payload
+            if body is None:
+                body = ProblemResponse.render(pooled.problem)
+            served.setdefault(pooled.problem.id, body)
+
+    if len(served) < wanted:
+        if count is None:
+            problem = await service.get_least_recently_served_problem(
+                projection=projection
+            )
+            problems = [problem] if problem is not None else []
+        else:
+            problems = await service.get_least_recently_served_problems(
+                wanted - len(served), projection=projection
+            )
+        for problem in problems:
+            served.setdefault(
+                problem.id, ProblemResponse.render(problem, include_metadata)
+            )
+
+    return served
+
+
 @router.get(
     "/random",
-    response_model=ProblemResponse,
+    response_model=ProblemResponse | list[ProblemResponse],
     summary="Get random problem from database",
     description="""
     Retrieve a random problem from the database.
@@ -58,6 +111,9 @@ async def get_queue_service() -> AsyncGenerator[QueueService, None]:
 
     Query Parameters:
     - include_metadata: Include source_statement_ids and metadata in response (default: false)
+    - count: Return a list of up to this many distinct problems (1-50) instead
+      of a single problem, e.g. for the start of a quiz session. Fewer are
+      returned when fewer problems exist.
 
     Required Permission: read, write, or admin
     """,
@@ -111,29 +167,40 @@ async def get_queue_service() -> AsyncGenerator[QueueService, None]:
 async def get_random_problem(
     request: Request,
     include_metadata: bool = False,
+    count: int | None = Query(
+        None,
+        ge=1,
+        le=MAX_RANDOM_PROBLEMS,
+        description="Return a list of this many distinct problems",
+    ),
     current_key: dict = Depends(get_current_api_key),
     service: ProblemService = Depends(get_problem_service),
-) -> ProblemResponse:
+) -> Response:
     """
     Get a random problem from the database.
 
-    Fetches a random existing problem without generating new content.
+    Fetches a random existing problem without generating new content. Served
+    from the prefetched problem pool when it is enabled (without metadata),
+    with the body rendered ahead of time; the JSON is sent as-is, skipping
+    response model validation (ProblemResponse.render produces the same body).
     """
     try:
-        # Get least recently served problem
-        problem = await service.get_least_recently_served_problem()
+        # Get least recently served problems
+        served = await _serve_problems(service, count, include_metadata)
 
-        if problem is None:
+        if not served:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="No problems available",
             )
 
         logger.info(
-            f"Retrieved LRU problem {problem.id} for API key {current_key.get('name', 'unknown')}"
+            f"Retrieved LRU problems {', '.join(map(str, served))} for API key {current_key.get('name', 'unknown')}"
         )
 
-        return ProblemResponse.from_problem(problem, include_metadata=include_metadata)
+        bodies = list(served.values())
+        body = bodies[0] if count is None else b"[" + b",".join(bodies) + b"]"
+        return Response(content=body, media_type="application/json")
 
     except HTTPException:
         raise
@@ -307,7 +374,13 @@ async def get_problem(
 ) -> ProblemResponse:
     """Get a problem by ID."""
     try:
-        problem = await service.get_problem_by_id(problem_id)
+        # The generation trace is only returned with metadata
+        problem = await service.get_problem_by_id(
+            problem_id,
+            projection=ProblemProjection.FULL
+            if include_metadata
+            else ProblemProjection.SERVING,
+        )
 
         if problem is None:
             raise HTTPException(
@@ -18,6 +18,7 @@ from src.core.exceptions import (
     NotFoundError,
     RepositoryError,
     ServiceError,
+    ServiceUnavailableError,
 )
 from src.services.verb_service import VerbService
 
@@ -194,6 +195,12 @@ async def download_verb(
     except (RepositoryError, ServiceError) as e:
         # Pass through with the status code from the exception
         raise HTTPException(status_code=e.status_code, detail=str(e))
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)} if e.retry_after else None,
+        )
     except AppException as e:
         # Catch-all for other custom app exceptions
         raise HTTPException(
@@ -313,6 +320,12 @@ async def get_random_verb(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except (RepositoryError, ServiceError) as e:
         raise HTTPException(status_code=e.status_code, detail=str(e))
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)} if e.retry_after else None,
+        )
     except AppException as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
@@ -476,6 +489,12 @@ async def get_verb_by_infinitive(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except (RepositoryError, ServiceError) as e:
         raise HTTPException(status_code=e.status_code, detail=str(e))
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)} if e.retry_after else None,
+        )
     except AppException:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -657,6 +676,12 @@ async def get_verb_conjugations(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except (RepositoryError, ServiceError) as e:
         raise HTTPException(status_code=e.status_code, detail=str(e))
+    except ServiceUnavailableError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after)} if e.retry_after else None,
+        )
     except AppException:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
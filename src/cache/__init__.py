@@ -2,6 +2,7 @@
 
 from src.cache.api_key_cache import ApiKeyCache, api_key_cache
 from src.cache.conjugation_cache import ConjugationCache, conjugation_cache
+from src.cache.single_flight import SingleFlight
 from src.cache.verb_cache import VerbCache, verb_cache
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "conjugation_cache",
     "ApiKeyCache",
     "api_key_cache",
+    "SingleFlight",
 ]
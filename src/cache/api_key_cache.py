@@ -1,62 +1,154 @@
 """In-memory cache for API keys."""
 
 import asyncio
+import hashlib
+import hmac
 import logging
+import secrets
+import time
+from collections import OrderedDict
 from uuid import UUID
 
 from opentelemetry import trace
 
-from src.schemas.api_keys import ApiKey
+from src.cache.metrics import CacheLookups, estimate_memory, timed_load
+from src.cache.paged_loader import add_in_batches, load_paged
+from src.schemas.api_keys import ApiKey, IpAllowlist
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Verified-credential cache defaults
+DEFAULT_VERIFIED_TTL_SECONDS = 300.0
+DEFAULT_VERIFIED_MAX_ENTRIES = 10_000
 
-class ApiKeyCache:
+# Negative (unknown/inactive prefix) cache defaults
+DEFAULT_NEGATIVE_TTL_SECONDS = 30.0
+DEFAULT_NEGATIVE_MAX_ENTRIES = 10_000
+
+
+class _ApiKeyIndexes:
     """
-    In-memory cache for API keys.
+    One generation of the API key cache's indexes.
 
-    Optimized for authentication lookups by key_prefix.
-    This is the hottest path in the application.
+    Loads build a new generation off to the side and publish it by swapping
+    the cache's reference, so authentication never sees a partly built one
+    (and never rejects a valid key mid-reload).
     """
 
+    __slots__ = ("by_id", "by_prefix", "by_hash", "ip_allowlists")
+
     def __init__(self):
         # Primary index: by UUID
-        self._keys_by_id: dict[UUID, ApiKey] = {}
+        self.by_id: dict[UUID, ApiKey] = {}
 
         # Authentication index: by key_prefix (first 12 chars)
-        self._keys_by_prefix: dict[str, ApiKey] = {}
+        self.by_prefix: dict[str, ApiKey] = {}
 
         # Authentication index: by key_hash (for verification)
-        self._keys_by_hash: dict[str, ApiKey] = {}
+        self.by_hash: dict[str, ApiKey] = {}
+
+        # Compiled IP allowlists: by UUID (built once per key version)
+        self.ip_allowlists: dict[UUID, IpAllowlist] = {}
+
+    def add(self, api_key: ApiKey):
+        """Add an API key to all indexes."""
+        self.by_id[api_key.id] = api_key
+        self.by_prefix[api_key.key_prefix] = api_key
+        self.by_hash[api_key.key_hash] = api_key
+        self.ip_allowlists[api_key.id] = IpAllowlist(api_key.allowed_ips)
+
+    def remove(self, api_key: ApiKey):
+        """Remove an API key from all indexes."""
+        self.by_id.pop(api_key.id, None)
+        self.by_prefix.pop(api_key.key_prefix, None)
+        self.by_hash.pop(api_key.key_hash, None)
+        self.ip_allowlists.pop(api_key.id, None)
+
+
+class ApiKeyCache:
+    """
+    In-memory cache for API keys.
+
+    Optimized for authentication lookups by key_prefix.
+    This is the hottest path in the application.
+
+    Also remembers plain text keys that recently passed bcrypt verification,
+    keyed by an HMAC-SHA256 digest under a per-process secret, so repeat
+    callers skip the ~200ms hash check. Entries expire after a TTL and are
+    evicted as soon as their key is refreshed or invalidated.
+
+    Prefixes the database confirmed as unknown or inactive are remembered for
+    a short TTL as well, so clients spraying made-up keys are answered from
+    memory instead of costing one database query per request.
+    """
+
+    def __init__(
+        self,
+        verified_ttl_seconds: float = DEFAULT_VERIFIED_TTL_SECONDS,
+        verified_max_entries: int = DEFAULT_VERIFIED_MAX_ENTRIES,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+        negative_max_entries: int = DEFAULT_NEGATIVE_MAX_ENTRIES,
+    ):
+        # Current generation of key indexes, replaced wholesale on load
+        self._indexes = _ApiKeyIndexes()
+
+        # Verified-credential index: HMAC digest -> (key_id, key_hash, expires_at)
+        # Never stores plain text keys; the secret is regenerated on each start.
+        self._verified: OrderedDict[bytes, tuple[UUID, str, float]] = OrderedDict()
+        self._verified_by_key: dict[UUID, set[bytes]] = {}
+        self._verified_secret = secrets.token_bytes(32)
+        self._verified_ttl = verified_ttl_seconds
+        self._verified_max_entries = verified_max_entries
+
+        # Negative index: key_prefix -> expires_at, for prefixes not in the database
+        self._negative: OrderedDict[str, float] = OrderedDict()
+        self._negative_ttl = negative_ttl_seconds
+        self._negative_max_entries = negative_max_entries
 
         self._loaded = False
         self._lock = asyncio.Lock()
 
+        # Stats from the most recent paged load
+        self._last_load: dict | None = None
+
         # Metrics
-        self._hits = 0
-        self._misses = 0
+        self._lookups = CacheLookups()
+        self._verified_hits = 0
+        self._verified_misses = 0
+        self._negative_hits = 0
+        self._negative_stores = 0
+        self._negative_evictions = 0
 
     async def load(self, repository):
         """Load all API keys into cache at startup."""
-        with tracer.start_as_current_span("api_key_cache.load"):
+        with tracer.start_as_current_span("api_key_cache.load"), timed_load("api_keys"):
             async with self._lock:
-                # Duck typing: check for the method we need instead of isinstance
-                if not hasattr(repository, "get_all_api_keys"):
-                    raise TypeError("Repository must have get_all_api_keys method")
-
+                # Duck typing: prefer keyset pages, fall back to a single query
                 logger.info("Loading API keys into cache...")
-                api_keys = await repository.get_all_api_keys(
-                    limit=1000, include_inactive=True
-                )
-
-                self._keys_by_id.clear()
-                self._keys_by_prefix.clear()
-                self._keys_by_hash.clear()
-
-                for key in api_keys:
-                    self._add_key_to_indexes(key)
-
+                if hasattr(repository, "get_api_keys_page"):
+                    api_keys, self._last_load = await load_paged(
+                        "API keys",
+                        repository.get_api_keys_page,
+                        repository.count_api_keys,
+                    )
+                elif hasattr(repository, "get_all_api_keys"):
+                    api_keys = await repository.get_all_api_keys(
+                        limit=1000, include_inactive=True
+                    )
+                else:
+                    raise TypeError(
+                        "Repository must have get_api_keys_page or "
+                        "get_all_api_keys method"
+                    )
+
+                indexes = _ApiKeyIndexes()
+                await add_in_batches(api_keys, indexes.add)
+
+                # Publish with a single reference swap
+                self._indexes = indexes
+                self._prune_verified(indexes)
+                self._negative.clear()
                 self._loaded = True
                 active_count = sum(1 for k in api_keys if k.is_active)
                 logger.info(
@@ -66,29 +158,69 @@ class ApiKeyCache:
 
     def _add_key_to_indexes(self, api_key: ApiKey):
         """Add an API key to all indexes (internal helper)."""
-        self._keys_by_id[api_key.id] = api_key
-        self._keys_by_prefix[api_key.key_prefix] = api_key
-        self._keys_by_hash[api_key.key_hash] = api_key
+        self._indexes.add(api_key)
+        self._negative.pop(api_key.key_prefix, None)
 
     def _remove_key_from_indexes(self, api_key: ApiKey):
         """Remove an API key from all indexes (internal helper)."""
-        self._keys_by_id.pop(api_key.id, None)
-        self._keys_by_prefix.pop(api_key.key_prefix, None)
-        self._keys_by_hash.pop(api_key.key_hash, None)
+        self._indexes.remove(api_key)
+        self._evict_verified(api_key.id)
+
+    def _prune_verified(self, indexes: _ApiKeyIndexes):
+        """
+        Drop verified credentials a new generation invalidates (internal helper).
+
+        Credentials survive a reload while their key is still active with the
+        same hash, so periodic reloads do not send every client back through
+        bcrypt.
+        """
+        for digest, (key_id, key_hash, _) in list(self._verified.items()):
+            key = indexes.by_id.get(key_id)
+            if key is None or not key.is_active or key.key_hash != key_hash:
+                self._drop_verified_entry(digest, key_id)
+
+    def _credential_digest(self, api_key_plain: str) -> bytes:
+        """Keyed digest of a presented key (internal helper)."""
+        return hmac.digest(
+            self._verified_secret, api_key_plain.encode("utf-8"), hashlib.sha256
+        )
+
+    def _evict_verified(self, key_id: UUID):
+        """Drop all verified credentials for a key (internal helper)."""
+        for digest in self._verified_by_key.pop(key_id, ()):
+            self._verified.pop(digest, None)
+
+    def _drop_verified_entry(self, digest: bytes, key_id: UUID):
+        """Drop a single verified credential (internal helper)."""
+        self._verified.pop(digest, None)
+        digests = self._verified_by_key.get(key_id)
+        if digests is not None:
+            digests.discard(digest)
+            if not digests:
+                del self._verified_by_key[key_id]
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a full load has completed."""
+        return self._loaded
 
     async def get_by_id(self, key_id: UUID) -> ApiKey | None:
         """Get an API key by ID from cache."""
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_id")
             return None
 
-        key = self._keys_by_id.get(key_id)
+        key = self._indexes.by_id.get(key_id)
         if key:
-            self._hits += 1
+            self._lookups.hit("by_id")
         else:
-            self._misses += 1
+            self._lookups.miss("by_id")
         return key
 
+    async def get_all(self) -> list[ApiKey]:
+        """Get every cached API key, active or not (e.g. to write a snapshot)."""
+        return list(self._indexes.by_id.values())
+
     async def get_by_prefix(self, key_prefix: str) -> ApiKey | None:
         """
         Get an API key by prefix from cache.
@@ -96,37 +228,129 @@ class ApiKeyCache:
         This is the most common lookup path during authentication.
         """
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_prefix")
             return None
 
-        key = self._keys_by_prefix.get(key_prefix)
+        key = self._indexes.by_prefix.get(key_prefix)
         if key and key.is_active:
-            self._hits += 1
+            self._lookups.hit("by_prefix")
             return key
 
-        self._misses += 1
+        self._lookups.miss("by_prefix")
         return None
 
     async def get_by_hash(self, key_hash: str) -> ApiKey | None:
         """Get an API key by hash from cache."""
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_hash")
             return None
 
-        key = self._keys_by_hash.get(key_hash)
+        key = self._indexes.by_hash.get(key_hash)
         if key and key.is_active:
-            self._hits += 1
+            self._lookups.hit("by_hash")
             return key
 
-        self._misses += 1
+        self._lookups.miss("by_hash")
         return None
 
+    async def get_ip_allowlist(self, api_key: ApiKey) -> IpAllowlist:
+        """
+        Get the compiled IP allowlist for an API key.
+
+        Uses the version compiled at load/refresh time; a key that is not the
+        cached version (e.g. fetched from the database) is compiled on demand.
+        """
+        allowlist = self._indexes.ip_allowlists.get(api_key.id)
+        if allowlist is not None and self._indexes.by_id.get(api_key.id) is api_key:
+            return allowlist
+        return IpAllowlist(api_key.allowed_ips)
+
+    async def is_verified(self, api_key_plain: str, api_key: ApiKey) -> bool:
+        """
+        Check whether a plain text key recently passed verification for api_key.
+
+        A hit lets the caller skip bcrypt. The entry must still belong to the
+        same key id and stored hash, so a rotated hash never matches.
+        """
+        digest = self._credential_digest(api_key_plain)
+        entry = self._verified.get(digest)
+        if entry is None:
+            self._verified_misses += 1
+            return False
+
+        key_id, key_hash, expires_at = entry
+        if (
+            expires_at <= time.monotonic()
+            or key_id != api_key.id
+            or key_hash != api_key.key_hash
+        ):
+            self._drop_verified_entry(digest, key_id)
+            self._verified_misses += 1
+            return False
+
+        self._verified.move_to_end(digest)
+        self._verified_hits += 1
+        return True
+
+    async def mark_verified(self, api_key_plain: str, api_key: ApiKey):
+        """Remember that a plain text key passed bcrypt verification for api_key."""
+        # Skip keys that were refreshed or invalidated while bcrypt was running
+        if self._indexes.by_id.get(api_key.id) is not api_key:
+            return
+
+        digest = self._credential_digest(api_key_plain)
+        self._verified[digest] = (
+            api_key.id,
+            api_key.key_hash,
+            time.monotonic() + self._verified_ttl,
+        )
+        self._verified.move_to_end(digest)
+        self._verified_by_key.setdefault(api_key.id, set()).add(digest)
+
+        # Bounded: evict least recently used entries
+        while len(self._verified) > self._verified_max_entries:
+            old_digest, (old_key_id, _, _) = self._verified.popitem(last=False)
+            self._drop_verified_entry(old_digest, old_key_id)
+
+    async def is_known_invalid(self, key_prefix: str) -> bool:
+        """
+        Check whether a prefix was recently confirmed unknown or inactive.
+
+        A hit lets the caller reject the key without querying the database.
+        """
+        expires_at = self._negative.get(key_prefix)
+        if expires_at is None:
+            return False
+
+        if expires_at <= time.monotonic():
+            del self._negative[key_prefix]
+            return False
+
+        self._negative_hits += 1
+        return True
+
+    async def mark_invalid(self, key_prefix: str):
+        """Remember that the database has no active key for this prefix."""
+        # Skip prefixes that became valid while the database lookup was running
+        key = self._indexes.by_prefix.get(key_prefix)
+        if key is not None and key.is_active:
+            return
+
+        self._negative[key_prefix] = time.monotonic() + self._negative_ttl
+        self._negative.move_to_end(key_prefix)
+        self._negative_stores += 1
+
+        # Bounded: evict oldest entries
+        while len(self._negative) > self._negative_max_entries:
+            self._negative.popitem(last=False)
+            self._negative_evictions += 1
+
     async def refresh_key(self, api_key: ApiKey):
         """Add or update an API key in the cache."""
         async with self._lock:
             # Remove old version if it exists
-            if api_key.id in self._keys_by_id:
-                old_key = self._keys_by_id[api_key.id]
+            old_key = self._indexes.by_id.get(api_key.id)
+            if old_key is not None:
                 self._remove_key_from_indexes(old_key)
 
             # Add new version
@@ -136,8 +360,8 @@ class ApiKeyCache:
     async def invalidate_key(self, key_id: UUID):
         """Remove an API key from the cache."""
         async with self._lock:
-            if key_id in self._keys_by_id:
-                key = self._keys_by_id[key_id]
+            key = self._indexes.by_id.get(key_id)
+            if key is not None:
                 self._remove_key_from_indexes(key)
                 logger.debug(f"Invalidated API key {key_id} from cache")
 
@@ -148,20 +372,54 @@ class ApiKeyCache:
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        hits, misses = self._lookups.hits, self._lookups.misses
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
 
-        active_keys = sum(1 for k in self._keys_by_id.values() if k.is_active)
+        active_keys = sum(1 for k in self._indexes.by_id.values() if k.is_active)
 
         return {
             "loaded": self._loaded,
-            "total_keys": len(self._keys_by_id),
+            "total_keys": len(self._indexes.by_id),
             "active_keys": active_keys,
-            "hits": self._hits,
-            "misses": self._misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.2f}%",
+            "verified_entries": len(self._verified),
+            "verified_hits": self._verified_hits,
+            "verified_misses": self._verified_misses,
+            "negative_entries": len(self._negative),
+            "negative_hits": self._negative_hits,
+            "negative_stores": self._negative_stores,
+            "negative_evictions": self._negative_evictions,
+            "lookups": {
+                **self._lookups.by_pattern(),
+                "verified": {
+                    "hits": self._verified_hits,
+                    "misses": self._verified_misses,
+                },
+            },
+            "memory_bytes": self.approximate_memory(),
+            "last_load": self._last_load,
         }
 
+    def approximate_memory(self) -> int:
+        """Approximate bytes held by the cached keys, their indexes and verifications."""
+        indexes = self._indexes
+        return estimate_memory(
+            indexes.by_id.values(),
+            len(indexes.by_id),
+            [
+                indexes.by_id,
+                indexes.by_prefix,
+                indexes.by_hash,
+                indexes.ip_allowlists,
+                self._verified,
+                self._verified_by_key,
+                self._negative,
+            ],
+        )
+
 
 # Global singleton instance
 api_key_cache = ApiKeyCache()
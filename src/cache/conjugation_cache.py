@@ -5,105 +5,139 @@ import logging
 
 from opentelemetry import trace
 
+from src.cache.metrics import CacheLookups, estimate_memory, timed_load
+from src.cache.paged_loader import add_in_batches, load_paged
+from src.cache.records import ConjugationRecord
 from src.schemas.verbs import Conjugation, Tense
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# (infinitive, auxiliary, reflexive)
+VerbKey = tuple[str, str, bool]
+
+
+class _ConjugationIndexes:
+    """
+    One generation of the conjugation cache's indexes.
+
+    Loads build a new generation off to the side and publish it by swapping
+    the cache's reference, so readers never see a partly built one.
+    """
+
+    __slots__ = ("by_verb", "verb_views", "count")
+
+    def __init__(self):
+        # Index: (infinitive, auxiliary, reflexive) -> {tense: ConjugationRecord}
+        # in insertion order (replacing a tense keeps its position)
+        self.by_verb: dict[VerbKey, dict[Tense, ConjugationRecord]] = {}
+        self.count = 0
+
+        # Immutable per-verb views handed out by get_conjugations_for_verb,
+        # built on first read and dropped whenever the verb changes
+        self.verb_views: dict[VerbKey, tuple[ConjugationRecord, ...]] = {}
+
+    def add(self, conjugation: Conjugation | ConjugationRecord):
+        """Add a conjugation to all indexes."""
+        if not isinstance(conjugation, ConjugationRecord):
+            conjugation = ConjugationRecord.from_model(conjugation)
+
+        verb_key = (
+            conjugation.infinitive,
+            conjugation.auxiliary.value,
+            conjugation.reflexive,
+        )
+        tenses = self.by_verb.get(verb_key)
+        if tenses is None:
+            tenses = self.by_verb[verb_key] = {}
+        if conjugation.tense not in tenses:
+            self.count += 1
+        tenses[conjugation.tense] = conjugation
+        self.verb_views.pop(verb_key, None)
+
+    def remove(self, conjugation: Conjugation | ConjugationRecord):
+        """Remove a conjugation from all indexes."""
+        verb_key = (
+            conjugation.infinitive,
+            conjugation.auxiliary.value,
+            conjugation.reflexive,
+        )
+        tenses = self.by_verb.get(verb_key)
+        if tenses is not None:
+            if tenses.pop(conjugation.tense, None) is not None:
+                self.count -= 1
+            if not tenses:
+                del self.by_verb[verb_key]
+            self.verb_views.pop(verb_key, None)
+
 
 class ConjugationCache:
     """
     In-memory cache for conjugations.
 
-    Indexed by (infinitive, auxiliary, reflexive, tense) for fast lookup.
-    Also provides bulk lookup by verb.
+    Indexed by (infinitive, auxiliary, reflexive) and then tense, for single
+    and bulk lookup by verb. Rows are held as compact ConjugationRecords that
+    quack like Conjugation; use to_model() where a real model is needed.
+
+    Readers take no lock: a load swaps in a new _ConjugationIndexes
+    generation, and single-row changes apply in one synchronous step.
     """
 
     def __init__(self):
-        # Index: (infinitive, auxiliary, reflexive, tense) -> Conjugation
-        self._conjugations: dict[tuple[str, str, bool, str], Conjugation] = {}
-
-        # Index: (infinitive, auxiliary, reflexive) -> list[Conjugation]
-        self._by_verb: dict[tuple[str, str, bool], list[Conjugation]] = {}
+        # Current generation of indexes, replaced wholesale on load
+        self._indexes = _ConjugationIndexes()
 
         self._loaded = False
         self._lock = asyncio.Lock()
 
+        # Stats from the most recent paged load
+        self._last_load: dict | None = None
+
         # Metrics
-        self._hits = 0
-        self._misses = 0
+        self._lookups = CacheLookups()
 
     async def load(self, repository):
         """Load all conjugations into cache at startup."""
-        with tracer.start_as_current_span("conjugation_cache.load"):
+        with (
+            tracer.start_as_current_span("conjugation_cache.load"),
+            timed_load("conjugations"),
+        ):
             async with self._lock:
-                # Duck typing: check for the methods we need instead of isinstance
-                if not hasattr(repository, "get_all_conjugations"):
-                    raise TypeError("Repository must have get_all_conjugations method")
-
+                # Duck typing: prefer keyset pages, fall back to a single query
                 logger.info("Loading conjugations into cache...")
-
-                # Fetch all conjugations in a single query (avoids N+1 problem)
-                conjugations = await repository.get_all_conjugations(limit=10000)
-
-                self._conjugations.clear()
-                self._by_verb.clear()
-
-                for conj in conjugations:
-                    self._add_conjugation_to_indexes(conj)
-
+                if hasattr(repository, "get_conjugations_page"):
+
+                    async def fetch_records(**kwargs) -> list[ConjugationRecord]:
+                        # Compact each page on arrival so its models can be freed
+                        page = await repository.get_conjugations_page(**kwargs)
+                        return [ConjugationRecord.from_model(c) for c in page]
+
+                    conjugations, self._last_load = await load_paged(
+                        "conjugations", fetch_records, repository.count_conjugations
+                    )
+                elif hasattr(repository, "get_all_conjugations"):
+                    conjugations = await repository.get_all_conjugations(limit=10000)
+                else:
+                    raise TypeError(
+                        "Repository must have get_conjugations_page or "
+                        "get_all_conjugations method"
+                    )
+
+                indexes = _ConjugationIndexes()
+                await add_in_batches(conjugations, indexes.add)
+
+                # Publish with a single reference swap
+                self._indexes = indexes
                 self._loaded = True
                 logger.info(
                     f"✅ Loaded {len(conjugations)} conjugations into cache "
-                    f"({len(self._by_verb)} unique verbs)"
+                    f"({len(indexes.by_verb)} unique verbs)"
                 )
 
-    def _add_conjugation_to_indexes(self, conjugation: Conjugation):
-        """Add a conjugation to all indexes (internal helper)."""
-        # Primary index
-        key = (
-            conjugation.infinitive,
-            conjugation.auxiliary.value,
-            conjugation.reflexive,
-            conjugation.tense.value,
-        )
-        self._conjugations[key] = conjugation
-
-        # Verb index
-        verb_key = (
-            conjugation.infinitive,
-            conjugation.auxiliary.value,
-            conjugation.reflexive,
-        )
-        if verb_key not in self._by_verb:
-            self._by_verb[verb_key] = []
-
-        # Replace if already exists, otherwise append
-        existing = [c for c in self._by_verb[verb_key] if c.tense != conjugation.tense]
-        existing.append(conjugation)
-        self._by_verb[verb_key] = existing
-
-    def _remove_conjugation_from_indexes(self, conjugation: Conjugation):
-        """Remove a conjugation from all indexes (internal helper)."""
-        # Primary index
-        key = (
-            conjugation.infinitive,
-            conjugation.auxiliary.value,
-            conjugation.reflexive,
-            conjugation.tense.value,
-        )
-        self._conjugations.pop(key, None)
-
-        # Verb index
-        verb_key = (
-            conjugation.infinitive,
-            conjugation.auxiliary.value,
-            conjugation.reflexive,
-        )
-        if verb_key in self._by_verb:
-            self._by_verb[verb_key] = [
-                c for c in self._by_verb[verb_key] if c.tense != conjugation.tense
-            ]
+    @property
+    def loaded(self) -> bool:
+        """Whether a full load has completed."""
+        return self._loaded
 
     async def get_conjugation(
         self,
@@ -111,18 +145,18 @@ class ConjugationCache:
         auxiliary: str,
         reflexive: bool,
         tense: Tense,
-    ) -> Conjugation | None:
+    ) -> ConjugationRecord | None:
         """Get a specific conjugation from cache."""
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_key")
             return None
 
-        key = (infinitive, auxiliary, reflexive, tense.value)
-        conj = self._conjugations.get(key)
+        tenses = self._indexes.by_verb.get((infinitive, auxiliary, reflexive))
+        conj = tenses.get(tense) if tenses else None
         if conj:
-            self._hits += 1
+            self._lookups.hit("by_key")
         else:
-            self._misses += 1
+            self._lookups.miss("by_key")
         return conj
 
     async def get_conjugations_for_verb(
@@ -130,30 +164,61 @@ class ConjugationCache:
         infinitive: str,
         auxiliary: str,
         reflexive: bool,
-    ) -> list[Conjugation]:
-        """Get all conjugations for a verb from cache."""
+    ) -> tuple[ConjugationRecord, ...]:
+        """
+        Get all conjugations for a verb from cache.
+
+        Returns a shared immutable tuple, so repeated calls do not allocate.
+        """
         if not self._loaded:
-            return []
+            return ()
 
+        indexes = self._indexes
         verb_key = (infinitive, auxiliary, reflexive)
-        conjs = self._by_verb.get(verb_key, [])
-        if conjs:
-            self._hits += 1
-        return conjs.copy()  # Return a copy to prevent external modification
+        conjs = indexes.verb_views.get(verb_key)
+        if conjs is None:
+            tenses = indexes.by_verb.get(verb_key)
+            if not tenses:
+                return ()
+            conjs = indexes.verb_views[verb_key] = tuple(tenses.values())
+        self._lookups.hit("by_verb")
+        return conjs
+
+    async def get_all(self) -> list[ConjugationRecord]:
+        """Get every cached conjugation (e.g. to write a snapshot)."""
+        return [
+            conj
+            for tenses in self._indexes.by_verb.values()
+            for conj in tenses.values()
+        ]
 
     async def refresh_conjugation(self, conjugation: Conjugation):
         """Add or update a conjugation in the cache."""
         async with self._lock:
-            # Remove old version if it exists
-            self._remove_conjugation_from_indexes(conjugation)
-
-            # Add new version
-            self._add_conjugation_to_indexes(conjugation)
+            # Same key as any previous version, so this replaces it in place
+            self._indexes.add(conjugation)
             logger.debug(
                 f"Refreshed conjugation {conjugation.infinitive} "
                 f"({conjugation.tense.value}) in cache"
             )
 
+    async def invalidate_conjugation(
+        self,
+        infinitive: str,
+        auxiliary: str,
+        reflexive: bool,
+        tense: Tense,
+    ):
+        """Remove a single conjugation from cache."""
+        async with self._lock:
+            tenses = self._indexes.by_verb.get((infinitive, auxiliary, reflexive))
+            conjugation = tenses.get(tense) if tenses else None
+            if conjugation is not None:
+                self._indexes.remove(conjugation)
+                logger.debug(
+                    f"Invalidated conjugation {infinitive} ({tense.value}) from cache"
+                )
+
     async def invalidate_verb_conjugations(
         self,
         infinitive: str,
@@ -162,11 +227,10 @@ class ConjugationCache:
     ):
         """Remove all conjugations for a verb from cache."""
         async with self._lock:
-            verb_key = (infinitive, auxiliary, reflexive)
-            if verb_key in self._by_verb:
-                conjugations = self._by_verb[verb_key]
-                for conj in conjugations:
-                    self._remove_conjugation_from_indexes(conj)
+            tenses = self._indexes.by_verb.get((infinitive, auxiliary, reflexive))
+            if tenses is not None:
+                for conj in list(tenses.values()):
+                    self._indexes.remove(conj)
                 logger.debug(f"Invalidated conjugations for {infinitive} from cache")
 
     async def reload(self, repository):
@@ -176,18 +240,31 @@ class ConjugationCache:
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        hits, misses = self._lookups.hits, self._lookups.misses
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
 
         return {
             "loaded": self._loaded,
-            "total_conjugations": len(self._conjugations),
-            "unique_verbs": len(self._by_verb),
-            "hits": self._hits,
-            "misses": self._misses,
+            "total_conjugations": self._indexes.count,
+            "unique_verbs": len(self._indexes.by_verb),
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.2f}%",
+            "lookups": self._lookups.by_pattern(),
+            "memory_bytes": self.approximate_memory(),
+            "last_load": self._last_load,
         }
 
+    def approximate_memory(self) -> int:
+        """Approximate bytes held by the cached conjugations and their indexes."""
+        indexes = self._indexes
+        return estimate_memory(
+            (conj for tenses in indexes.by_verb.values() for conj in tenses.values()),
+            indexes.count,
+            [indexes.by_verb, indexes.verb_views],
+        )
+
 
 # Global singleton instance
 conjugation_cache = ConjugationCache()
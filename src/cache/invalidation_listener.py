@@ -0,0 +1,314 @@
+"""Postgres LISTEN/NOTIFY driven cache invalidation."""
+
+import asyncio
+import json
+import logging
+import random
+from uuid import UUID
+
+import asyncpg
+from opentelemetry import trace
+
+from src.schemas.verbs import Tense
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Channel the cache invalidation triggers publish on
+CHANNEL = "cache_invalidation"
+
+# Reconnect backoff bounds (seconds)
+DEFAULT_BACKOFF_INITIAL = 0.5
+DEFAULT_BACKOFF_MAX = 30.0
+
+# Pending notifications before falling back to a full resync
+DEFAULT_MAX_PENDING = 10_000
+
+
+class CacheInvalidationListener:
+    """
+    Keeps the in-memory caches in step with changes made by any replica.
+
+    Triggers on verbs, conjugations and api_keys publish one small payload
+    per changed row (table, operation and key columns, never the full row).
+    Each change is applied incrementally: the row is re-read through the
+    repository and passed to refresh_*, or removed with invalidate_*.
+
+    Notifications are lost while the connection is down, so every reconnect
+    (and any notification that cannot be applied) triggers a full reload of
+    all caches instead.
+    """
+
+    def __init__(
+        self,
+        verb_cache,
+        conjugation_cache,
+        api_key_cache,
+        backoff_initial: float = DEFAULT_BACKOFF_INITIAL,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        keepalive_interval: float = 30.0,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ):
+        self.verb_cache = verb_cache
+        self.conjugation_cache = conjugation_cache
+        self.api_key_cache = api_key_cache
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.keepalive_interval = keepalive_interval
+
+        self._dsn: str | None = None
+        self._verb_repository = None
+        self._api_key_repository = None
+
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_pending)
+        self._resync_needed = False
+        self._connected = False
+        self._listen_task: asyncio.Task | None = None
+        self._apply_task: asyncio.Task | None = None
+
+        # Metrics
+        self._received = 0
+        self._applied = 0
+        self._failed = 0
+        self._resyncs = 0
+        self._reconnects = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the listener is running."""
+        return self._listen_task is not None and not self._listen_task.done()
+
+    async def start(self, dsn: str, verb_repository, api_key_repository) -> None:
+        """Start listening for cache invalidation notifications."""
+        if self.running:
+            logger.warning("Cache invalidation listener already running")
+            return
+
+        self._dsn = dsn
+        self._verb_repository = verb_repository
+        self._api_key_repository = api_key_repository
+        self._apply_task = asyncio.create_task(
+            self._apply_loop(), name="cache-invalidation-apply"
+        )
+        self._listen_task = asyncio.create_task(
+            self._listen_loop(), name="cache-invalidation-listen"
+        )
+        logger.info(f"Cache invalidation listener started (channel={CHANNEL})")
+
+    async def stop(self) -> None:
+        """Stop listening and drop pending notifications."""
+        for task in (self._listen_task, self._apply_task):
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *(t for t in (self._listen_task, self._apply_task) if t is not None),
+            return_exceptions=True,
+        )
+        self._listen_task = None
+        self._apply_task = None
+        self._connected = False
+        logger.info("Cache invalidation listener stopped")
+
+    async def _listen_loop(self) -> None:
+        """Hold a LISTEN connection open, reconnecting with backoff."""
+        attempt = 0
+        connected_before = False
+
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self._dsn)
+                closed = asyncio.Event()
+                connection.add_termination_listener(lambda _conn: closed.set())
+                await connection.add_listener(CHANNEL, self._on_notification)
+
+                self._connected = True
+                attempt = 0
+                if connected_before:
+                    # Changes made while disconnected were never delivered
+                    self._reconnects += 1
+                    logger.info("Cache invalidation listener reconnected")
+                    self._request_resync()
+                connected_before = True
+
+                while not closed.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            closed.wait(), timeout=self.keepalive_interval
+                        )
+                    except TimeoutError:
+                        # Detect half-open connections
+                        await connection.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener connection error: {e}")
+            finally:
+                self._connected = False
+                if connection is not None and not connection.is_closed():
+                    try:
+                        await connection.close(timeout=5)
+                    except Exception:
+                        connection.terminate()
+
+            delay = min(self.backoff_max, self.backoff_initial * 2**attempt)
+            attempt += 1
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        """asyncpg callback: queue a change for the apply loop."""
+        self._received += 1
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Malformed cache invalidation payload: {payload[:200]}")
+            self._request_resync()
+            return
+
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            logger.warning("Cache invalidation queue full, falling back to resync")
+            self._request_resync()
+
+    def _request_resync(self) -> None:
+        """Schedule a full reload of all caches (internal helper)."""
+        self._resync_needed = True
+        # Wake the apply loop even when no change is queued
+        try:
+            self._queue.put_nowait({"table": None, "op": "RESYNC"})
+        except asyncio.QueueFull:
+            pass
+
+    async def _apply_loop(self) -> None:
+        """Apply queued changes in arrival order."""
+        while True:
+            change = await self._queue.get()
+
+            if self._resync_needed:
+                # A full reload supersedes everything queued so far
+                self._drain_queue()
+                await self.resync()
+                continue
+
+            if change.get("op") == "RESYNC":
+                continue
+
+            try:
+                await self.apply(change)
+                self._applied += 1
+            except Exception as e:
+                self._failed += 1
+                logger.warning(f"Failed to apply cache change {change}: {e}")
+                self._request_resync()
+
+    def _drain_queue(self) -> None:
+        """Discard queued changes (internal helper)."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def resync(self) -> None:
+        """Reload every cache from the database."""
+        self._resync_needed = False
+        with tracer.start_as_current_span("cache_invalidation.resync"):
+            try:
+                await asyncio.gather(
+                    self.verb_cache.reload(self._verb_repository),
+                    self.conjugation_cache.reload(self._verb_repository),
+                    self.api_key_cache.reload(self._api_key_repository),
+                )
+                self._resyncs += 1
+            except Exception as e:
+                logger.error(f"Cache resync failed: {e}", exc_info=True)
+                self._request_resync()
+                await asyncio.sleep(self.backoff_max)
+
+    async def apply(self, change: dict) -> None:
+        """Apply a single row change to the matching cache."""
+        table = change.get("table")
+        op = change.get("op")
+
+        with tracer.start_as_current_span(
+            "cache_invalidation.apply", attributes={"table": table, "op": op}
+        ):
+            if op == "TRUNCATE":
+                self._request_resync()
+            elif table == "verbs":
+                await self._apply_verb(change)
+            elif table == "conjugations":
+                await self._apply_conjugation(change)
+            elif table == "api_keys":
+                await self._apply_api_key(change)
+            else:
+                logger.debug(f"Ignoring cache change for table {table}")
+
+    async def _apply_verb(self, change: dict) -> None:
+        """Refresh or invalidate one verb (internal helper)."""
+        row = change.get("new") or change.get("old") or {}
+        verb_id = UUID(row["id"])
+
+        if change["op"] != "DELETE":
+            verb = await self._verb_repository.get_verb(verb_id)
+            if verb is not None:
+                await self.verb_cache.refresh_verb(verb)
+                return
+        await self.verb_cache.invalidate_verb(verb_id)
+
+    async def _apply_conjugation(self, change: dict) -> None:
+        """Refresh or invalidate one conjugation (internal helper)."""
+        old, new = change.get("old"), change.get("new")
+
+        # Drop the previous version when it was deleted or re-keyed
+        if old and (new is None or _conjugation_key(old) != _conjugation_key(new)):
+            await self.conjugation_cache.invalidate_conjugation(*_conjugation_key(old))
+
+        if new:
+            key = _conjugation_key(new)
+            conjugation = await self._verb_repository.get_conjugation(*key)
+            if conjugation is not None:
+                await self.conjugation_cache.refresh_conjugation(conjugation)
+            else:
+                await self.conjugation_cache.invalidate_conjugation(*key)
+
+    async def _apply_api_key(self, change: dict) -> None:
+        """Refresh or invalidate one API key (internal helper)."""
+        row = change.get("new") or change.get("old") or {}
+        key_id = UUID(row["id"])
+
+        if change["op"] != "DELETE":
+            api_key = await self._api_key_repository.get_api_key(key_id)
+            if api_key is not None:
+                await self.api_key_cache.refresh_key(api_key)
+                return
+        await self.api_key_cache.invalidate_key(key_id)
+
+    def get_stats(self) -> dict:
+        """Get listener statistics."""
+        return {
+            "running": self.running,
+            "connected": self._connected,
+            "pending": self._queue.qsize(),
+            "received": self._received,
+            "applied": self._applied,
+            "failed": self._failed,
+            "resyncs": self._resyncs,
+            "reconnects": self._reconnects,
+        }
+
+
+def _conjugation_key(row: dict) -> tuple[str, str, bool, Tense]:
+    """(infinitive, auxiliary, reflexive, tense) from a payload row."""
+    return (row["infinitive"], row["auxiliary"], row["reflexive"], Tense(row["tense"]))
+
+
+def _create_listener() -> CacheInvalidationListener:
+    """Build the listener around the global cache instances."""
+    from src.cache.api_key_cache import api_key_cache
+    from src.cache.conjugation_cache import conjugation_cache
+    from src.cache.verb_cache import verb_cache
+
+    return CacheInvalidationListener(verb_cache, conjugation_cache, api_key_cache)
+
+
+# Global singleton instance
+cache_invalidation_listener = _create_listener()
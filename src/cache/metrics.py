@@ -0,0 +1,197 @@
+"""Observability metrics for the in-memory caches."""
+
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from enum import Enum
+from itertools import islice
+
+logger = logging.getLogger(__name__)
+
+# Import OpenTelemetry only if enabled
+OTEL_ENABLED = bool(os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"))
+
+# Entries measured in depth when estimating a cache's memory footprint
+MEMORY_SAMPLE_SIZE = 200
+
+# get_stats() key holding each cache's entry count
+_ENTRY_COUNT_KEYS = {
+    "verbs": "total_verbs",
+    "conjugations": "total_conjugations",
+    "api_keys": "total_keys",
+}
+
+_CONTAINERS = (dict, list, tuple, set, frozenset)
+
+
+class CacheLookups:
+    """Hit and miss counts per access pattern (by_id, by_prefix, random, ...)."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self):
+        # (pattern, hit) -> count
+        self._counts: Counter[tuple[str, bool]] = Counter()
+
+    def hit(self, pattern: str):
+        self._counts[pattern, True] += 1
+
+    def miss(self, pattern: str):
+        self._counts[pattern, False] += 1
+
+    @property
+    def hits(self) -> int:
+        return sum(n for (_, hit), n in self._counts.items() if hit)
+
+    @property
+    def misses(self) -> int:
+        return sum(n for (_, hit), n in self._counts.items() if not hit)
+
+    def by_pattern(self) -> dict[str, dict[str, int]]:
+        """Hits and misses for each access pattern seen so far."""
+        patterns: dict[str, dict[str, int]] = {}
+        for (pattern, hit), n in sorted(self._counts.items()):
+            counts = patterns.setdefault(pattern, {"hits": 0, "misses": 0})
+            counts["hits" if hit else "misses"] += n
+        return patterns
+
+
+def _deep_size(obj, seen: set[int]) -> int:
+    """Bytes held by obj and everything it references (internal helper)."""
+    if id(obj) in seen or isinstance(obj, Enum | type):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, _CONTAINERS):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif not isinstance(obj, str | bytes | int | float):
+        if hasattr(obj, "__dict__"):
+            size += _deep_size(vars(obj), seen)
+        for cls in type(obj).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ("__dict__", "__weakref__"):
+                    size += _deep_size(getattr(obj, name, None), seen)
+    return size
+
+
+def _container_size(container) -> int:
+    """Bytes held by an index's containers, not the entries in them (internal helper)."""
+    size = sys.getsizeof(container)
+    values = container.values() if isinstance(container, dict) else container
+    for value in values:
+        if isinstance(value, _CONTAINERS):
+            size += _container_size(value)
+    return size
+
+
+def estimate_memory(entries: Iterable, count: int, indexes: Iterable) -> int:
+    """
+    Approximate bytes held by a cache.
+
+    The first MEMORY_SAMPLE_SIZE of `count` entries are measured in depth and
+    scaled up; index containers (dicts, lists, sets and nested ones) are
+    measured without descending into the entries they point to.
+    """
+    size = sum(_container_size(index) for index in indexes)
+    sample = list(islice(entries, MEMORY_SAMPLE_SIZE))
+    if sample:
+        seen: set[int] = set()
+        sampled = sum(_deep_size(entry, seen) for entry in sample)
+        size += sampled * count // len(sample)
+    return size
+
+
+def _caches() -> dict:
+    """The global caches by metric label (imported late: they import this module)."""
+    from src.cache.api_key_cache import api_key_cache
+    from src.cache.conjugation_cache import conjugation_cache
+    from src.cache.verb_cache import verb_cache
+
+    return {
+        "verbs": verb_cache,
+        "conjugations": conjugation_cache,
+        "api_keys": api_key_cache,
+    }
+
+
+if OTEL_ENABLED:  # pragma: no cover
+    from opentelemetry import metrics
+    from opentelemetry.metrics import Histogram, Observation
+
+    meter = metrics.get_meter("cache")
+
+    def _observe_lookups(options):
+        """Callback for the lookups counter."""
+        for name, cache in _caches().items():
+            for pattern, counts in cache.get_stats()["lookups"].items():
+                for key, result in (("hits", "hit"), ("misses", "miss")):
+                    yield Observation(
+                        counts[key],
+                        {"cache": name, "pattern": pattern, "result": result},
+                    )
+
+    def _observe_entries(options):
+        """Callback for the entries gauge."""
+        for name, cache in _caches().items():
+            yield Observation(
+                cache.get_stats()[_ENTRY_COUNT_KEYS[name]], {"cache": name}
+            )
+
+    def _observe_memory(options):
+        """Callback for the memory gauge."""
+        for name, cache in _caches().items():
+            yield Observation(cache.get_stats()["memory_bytes"], {"cache": name})
+
+    meter.create_observable_counter(
+        name="cache.lookups",
+        callbacks=[_observe_lookups],
+        description="Cache lookups by cache, access pattern and result (hit/miss)",
+        unit="1",
+    )
+    meter.create_observable_gauge(
+        name="cache.entries",
+        callbacks=[_observe_entries],
+        description="Entries held by each cache",
+        unit="1",
+    )
+    meter.create_observable_gauge(
+        name="cache.memory",
+        callbacks=[_observe_memory],
+        description="Approximate memory held by each cache",
+        unit="By",
+    )
+    load_duration_histogram: Histogram = meter.create_histogram(
+        name="cache.load.duration",
+        description="Time taken to load a cache from the database or a snapshot",
+        unit="s",
+    )
+
+else:  # pragma: no cover
+
+    class _DummyHistogram:  # pragma: no cover
+        def record(self, *args, **kwargs):  # pragma: no cover
+            pass  # pragma: no cover
+
+    load_duration_histogram = _DummyHistogram()
+
+
+@contextmanager
+def timed_load(cache: str) -> Iterator[None]:
+    """Record how long a cache load takes, and whether it succeeded."""
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "success"
+    finally:
+        load_duration_histogram.record(
+            time.perf_counter() - start, {"cache": cache, "outcome": outcome}
+        )
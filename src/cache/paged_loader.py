@@ -0,0 +1,134 @@
+"""Parallel, keyset-paginated loading for cache warm-up."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from opentelemetry import trace
+
+from src.core.config import get_settings
+from src.core.exceptions import RepositoryError
+from src.repositories.pagination import split_uuid_range
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Seconds to wait before retrying, multiplied by the attempt number
+RETRY_DELAY_SECONDS = 1.0
+
+# Rows indexed between yields to the event loop while building a cache generation
+INDEX_BATCH_SIZE = 1000
+
+# fetch_page(after=..., until=..., limit=...) -> parsed rows ordered by id
+FetchPage = Callable[..., Awaitable[list[Any]]]
+
+
+async def _fetch_range(
+    fetch_page: FetchPage, after, until, page_size: int
+) -> tuple[list[Any], int]:
+    """Page through one id range until a short page (internal helper)."""
+    rows: list[Any] = []
+    pages = 0
+    while True:
+        page = await fetch_page(after=after, until=until, limit=page_size)
+        pages += 1
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows, pages
+        after = page[-1].id
+
+
+async def load_paged(
+    name: str,
+    fetch_page: FetchPage,
+    count: Callable[[], Awaitable[int]],
+    page_size: int | None = None,
+    parallelism: int | None = None,
+    max_attempts: int | None = None,
+) -> tuple[list[Any], dict]:
+    """
+    Load every row of a table for a cache.
+
+    The uuid key space is split into `parallelism` ranges that are paged
+    concurrently; each page is parsed by `fetch_page` as it arrives. The
+    total is checked against `count()`. Errors and count mismatches retry
+    the whole load, and after `max_attempts` a RepositoryError is raised
+    rather than serving a silently truncated cache.
+
+    Returns:
+        The rows, and stats for the successful attempt (rows, pages,
+        seconds, rows_per_second, pages_per_second, attempts).
+    """
+    settings = get_settings()
+    page_size = page_size or settings.cache_load_page_size
+    parallelism = parallelism or settings.cache_load_parallelism
+    max_attempts = max_attempts or settings.cache_load_max_attempts
+    ranges = split_uuid_range(parallelism)
+
+    problem = ""
+    for attempt in range(1, max_attempts + 1):
+        with tracer.start_as_current_span(
+            "cache.load_paged", attributes={"table": name, "attempt": attempt}
+        ):
+            start = time.perf_counter()
+            try:
+                expected, *results = await asyncio.gather(
+                    count(),
+                    *(
+                        _fetch_range(fetch_page, after, until, page_size)
+                        for after, until in ranges
+                    ),
+                )
+            except Exception as e:
+                problem = f"{type(e).__name__}: {e}"
+            else:
+                seconds = max(time.perf_counter() - start, 1e-6)
+                rows = [row for range_rows, _ in results for row in range_rows]
+                pages = sum(range_pages for _, range_pages in results)
+
+                if len(rows) == expected:
+                    stats = {
+                        "rows": len(rows),
+                        "pages": pages,
+                        "seconds": round(seconds, 3),
+                        "rows_per_second": round(len(rows) / seconds, 1),
+                        "pages_per_second": round(pages / seconds, 1),
+                        "attempts": attempt,
+                    }
+                    logger.info(
+                        f"Loaded {len(rows)} {name} in {pages} pages "
+                        f"({seconds:.2f}s, {stats['rows_per_second']:.0f} rows/s, "
+                        f"{stats['pages_per_second']:.1f} pages/s)"
+                    )
+                    return rows, stats
+
+                problem = (
+                    f"loaded {len(rows)} rows but count query returned {expected} "
+                    "(rows changed during the load, or page size exceeds "
+                    "PostgREST max_rows)"
+                )
+
+        logger.warning(
+            f"Loading {name} failed (attempt {attempt}/{max_attempts}): {problem}"
+        )
+        if attempt < max_attempts:
+            await asyncio.sleep(RETRY_DELAY_SECONDS * attempt)
+
+    raise RepositoryError(
+        f"Failed to load {name} after {max_attempts} attempts: {problem}"
+    )
+
+
+async def add_in_batches(rows: list[Any], add: Callable[[Any], None]) -> None:
+    """
+    Call add(row) for every row, yielding to the event loop between batches.
+
+    Used to build a new cache generation off to the side: requests keep being
+    served from the current one instead of waiting for the whole build.
+    """
+    for start in range(0, len(rows), INDEX_BATCH_SIZE):
+        for row in rows[start : start + INDEX_BATCH_SIZE]:
+            add(row)
+        await asyncio.sleep(0)
@@ -0,0 +1,321 @@
+"""Prefetched pool of least recently served problems for /problems/random."""
+
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable
+
+from src.schemas.problems import Problem, ProblemProjection
+
+logger = logging.getLogger(__name__)
+
+# Import OpenTelemetry only if enabled
+OTEL_ENABLED = bool(os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"))
+
+# problem -> JSON response body (without metadata)
+Renderer = Callable[[Problem], bytes]
+
+
+class PooledProblem:
+    """A pooled problem with its response body rendered ahead of time."""
+
+    __slots__ = ("problem", "claimed_at", "payload")
+
+    def __init__(
+        self,
+        problem: Problem,
+        claimed_at: float,
+        payload: bytes | None = None,
+    ):
+        self.problem = problem
+        self.claimed_at = claimed_at
+        # None if no body was rendered
+        self.payload = payload
+
+
+class ProblemPool:
+    """
+    Serves problems from memory, refilled in batches by a background task.
+
+    The refiller claims least recently served problems in batches (each claim
+    stamps last_served_at, see ProblemRepository.claim_next_problems) and
+    queues them in a bounded buffer. take() hands them out in LRU order with
+    no I/O and wakes the refiller once the pool drops below half full.
+
+    Problems held longer than max_age seconds are dropped rather than served,
+    so edits and deletions are picked up within that bound. Dropped problems
+    were already stamped as served and simply come round again later.
+
+    When the table holds fewer problems than the pool, a claim comes back
+    short and would return the problems already held. Those are skipped, and
+    after a short batch take() stops waking the refiller until the next
+    expiry interval, so a small table costs one claim per interval rather
+    than one per request.
+
+    Problems are claimed with ProblemProjection.SERVING, without their
+    generation trace, so the pool only serves responses without metadata.
+    With a renderer, the response body is rendered by the refiller, so serving
+    a pooled problem is a buffer pop.
+    """
+
+    def __init__(
+        self,
+        size: int = 200,
+        refill_batch: int = 50,
+        max_age: float = 60.0,
+        render: Renderer | None = None,
+    ):
+        self.size = size
+        self.refill_batch = refill_batch
+        self.max_age = max_age
+        self.render = render
+
+        # Oldest claim first
+        self._buffer: deque[PooledProblem] = deque()
+
+        self._repository = None
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+
+        # monotonic() before which take() does not wake the refiller
+        self._refill_after = 0.0
+
+        # Metrics
+        self._served = 0
+        self._fallbacks = 0
+        self._expired = 0
+        self._refills = 0
+        self._failed_refills = 0
+        self._render_errors = 0
+        self._last_refill_seconds: float | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background refiller is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def depth(self) -> int:
+        """Problems currently held."""
+        return len(self._buffer)
+
+    @property
+    def low_water(self) -> int:
+        """Depth below which take() wakes the refiller."""
+        return self.size // 2
+
+    def take(self) -> PooledProblem | None:
+        """
+        Take the next problem (O(1), no I/O).
+
+        Returns:
+            A pooled problem, or None when the pool is not running or is empty
+            (the caller falls back to the database)
+        """
+        if not self.running:
+            return None
+
+        self._expire()
+        if self._buffer:
+            pooled = self._buffer.popleft()
+            self._served += 1
+        else:
+            pooled = None
+            self._fallbacks += 1
+            _fallback_counter.add(1)
+
+        if (
+            len(self._buffer) < self.low_water
+            and time.monotonic() >= self._refill_after
+        ):
+            self._wake.set()
+        return pooled
+
+    async def start(
+        self,
+        repository,
+        size: int | None = None,
+        refill_batch: int | None = None,
+        max_age: float | None = None,
+        render: Renderer | None = None,
+    ) -> None:
+        """Start the background refiller using the given ProblemRepository."""
+        if self.running:
+            logger.warning("Problem pool already running")
+            return
+
+        if size is not None:
+            self.size = size
+        if refill_batch is not None:
+            self.refill_batch = refill_batch
+        if max_age is not None:
+            self.max_age = max_age
+        if render is not None:
+            self.render = render
+
+        self._repository = repository
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="problem-pool-refiller")
+        logger.info(
+            f"Problem pool started (size={self.size}, batch={self.refill_batch}, "
+            f"max_age={self.max_age}s)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background refiller and drop the pooled problems."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._wake = None
+        self._refill_after = 0.0
+        self._buffer.clear()
+        logger.info("Problem pool stopped")
+
+    async def _run(self) -> None:
+        """Refill when woken below the low-water mark, and expire on an interval."""
+        while True:
+            await self.refill()
+            # asyncio.timeout rather than wait_for: a wake that coincides with
+            # stop() must not swallow the cancellation
+            try:
+                async with asyncio.timeout(self.max_age / 2):
+                    await self._wake.wait()
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            self._expire()
+
+    async def refill(self) -> int:
+        """
+        Claim batches of problems until the pool is full.
+
+        Stops early when the database returns a short batch (fewer problems
+        than the pool holds) or on an error, which is retried on the next wake.
+        Problems already held are skipped, and a short batch holds off the
+        next refill until the expiry interval.
+
+        Returns:
+            Number of problems added.
+        """
+        added = 0
+        held = {pooled.problem.id for pooled in self._buffer}
+        while (wanted := min(self.refill_batch, self.size - len(self._buffer))) > 0:
+            start = time.perf_counter()
+            try:
+                problems = await self._repository.claim_next_problems(
+                    wanted, ProblemProjection.SERVING
+                )
+            except Exception as e:
+                self._failed_refills += 1
+                _record_refill(time.perf_counter() - start, "error")
+                logger.error(f"Failed to refill problem pool: {e}")
+                break
+
+            seconds = time.perf_counter() - start
+            self._refills += 1
+            self._last_refill_seconds = seconds
+            _record_refill(seconds, "success")
+
+            now = time.monotonic()
+            new = [problem for problem in problems if problem.id not in held]
+            held.update(problem.id for problem in new)
+            self._buffer.extend(
+                PooledProblem(problem, now, self._render(problem)) for problem in new
+            )
+            added += len(new)
+            if len(new) < wanted:
+                self._refill_after = now + self.max_age / 2
+                break
+        else:
+            self._refill_after = 0.0
+        return added
+
+    def _render(self, problem: Problem) -> bytes | None:
+        """Response body for a problem (internal helper)."""
+        if self.render is None:
+            return None
+        try:
+            return self.render(problem)
+        except Exception as e:
+            # Served anyway: the endpoint renders it on request
+            self._render_errors += 1
+            logger.warning(f"Failed to pre-render problem {problem.id}: {e}")
+            return None
+
+    def _expire(self) -> None:
+        """Drop problems held longer than max_age (internal helper)."""
+        cutoff = time.monotonic() - self.max_age
+        while self._buffer and self._buffer[0].claimed_at < cutoff:
+            self._buffer.popleft()
+            self._expired += 1
+
+    def get_stats(self) -> dict:
+        """Get problem pool statistics."""
+        requests = self._served + self._fallbacks
+        return {
+            "running": self.running,
+            "depth": len(self._buffer),
+            "size": self.size,
+            "served": self._served,
+            "fallbacks": self._fallbacks,
+            "served_rate": f"{self._served / requests * 100:.2f}%"
+            if requests
+            else "0.00%",
+            "expired": self._expired,
+            "refills": self._refills,
+            "failed_refills": self._failed_refills,
+            "render_errors": self._render_errors,
+            "last_refill_seconds": round(self._last_refill_seconds, 4)
+            if self._last_refill_seconds is not None
+            else None,
+        }
+
+
+# Global singleton instance
+problem_pool = ProblemPool()
+
+
+if OTEL_ENABLED:  # pragma: no cover
+    from opentelemetry import metrics
+    from opentelemetry.metrics import Observation
+
+    meter = metrics.get_meter("problem_pool")
+
+    def _get_depth(options):
+        """Callback for the pool depth gauge."""
+        if problem_pool.running:
+            yield Observation(problem_pool.depth)
+
+    meter.create_observable_gauge(
+        name="problem_pool.depth",
+        callbacks=[_get_depth],
+        description="Problems held in the serving pool",
+        unit="1",
+    )
+    _fallback_counter = meter.create_counter(
+        name="problem_pool.fallbacks",
+        description="Problem requests served from the database because the pool was empty",
+        unit="1",
+    )
+    _refill_histogram = meter.create_histogram(
+        name="problem_pool.refill.duration",
+        description="Time taken to claim one batch of problems into the pool",
+        unit="s",
+    )
+
+    def _record_refill(seconds: float, outcome: str) -> None:
+        _refill_histogram.record(seconds, {"outcome": outcome})
+
+else:  # pragma: no cover
+
+    class _DummyCounter:  # pragma: no cover
+        def add(self, *args, **kwargs):  # pragma: no cover
+            pass  # pragma: no cover
+
+    _fallback_counter = _DummyCounter()
+
+    def _record_refill(seconds: float, outcome: str) -> None:  # pragma: no cover
+        pass  # pragma: no cover
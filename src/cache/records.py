@@ -0,0 +1,103 @@
+"""Compact in-memory records for cached rows."""
+
+import sys
+from datetime import datetime
+from uuid import UUID
+
+from src.schemas.verbs import AuxiliaryType, Conjugation, Tense
+
+# Conjugated form fields, in person order
+FORM_FIELDS = (
+    "first_person_singular",
+    "second_person_singular",
+    "third_person_singular",
+    "first_person_plural",
+    "second_person_plural",
+    "third_person_plural",
+)
+
+
+def _intern(value: str | None) -> str | None:
+    """Share one copy of repeated strings (internal helper)."""
+    return sys.intern(value) if value is not None else None
+
+
+class ConjugationRecord:
+    """
+    Slot-based stand-in for a cached Conjugation.
+
+    Has the same attributes as the model, so services and prompt helpers read
+    it directly, but no per-instance __dict__ or Pydantic bookkeeping.
+    Infinitives and forms are interned, so the strings repeated across tenses
+    and persons (e.g. "parle" for je and il) are stored once. Call to_model()
+    where a real Conjugation is required.
+    """
+
+    __slots__ = (
+        "id",
+        "infinitive",
+        "auxiliary",
+        "reflexive",
+        "tense",
+        *FORM_FIELDS,
+        "created_at",
+        "updated_at",
+    )
+
+    id: UUID
+    infinitive: str
+    auxiliary: AuxiliaryType
+    reflexive: bool
+    tense: Tense
+    first_person_singular: str | None
+    second_person_singular: str | None
+    third_person_singular: str | None
+    first_person_plural: str | None
+    second_person_plural: str | None
+    third_person_plural: str | None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, conjugation: Conjugation) -> "ConjugationRecord":
+        """Build a record from a validated Conjugation."""
+        record = cls.__new__(cls)
+        record.id = conjugation.id
+        record.infinitive = sys.intern(conjugation.infinitive)
+        record.auxiliary = conjugation.auxiliary
+        record.reflexive = conjugation.reflexive
+        record.tense = conjugation.tense
+        for field in FORM_FIELDS:
+            setattr(record, field, _intern(getattr(conjugation, field)))
+        record.created_at = conjugation.created_at
+        record.updated_at = conjugation.updated_at
+        return record
+
+    @property
+    def forms(self) -> tuple[str | None, ...]:
+        """Conjugated forms in FORM_FIELDS order."""
+        return (
+            self.first_person_singular,
+            self.second_person_singular,
+            self.third_person_singular,
+            self.first_person_plural,
+            self.second_person_plural,
+            self.third_person_plural,
+        )
+
+    def to_model(self) -> Conjugation:
+        """Materialize the Conjugation model (no re-validation)."""
+        return Conjugation.model_construct(
+            **{field: getattr(self, field) for field in self.__slots__}
+        )
+
+    def model_dump(self, **kwargs) -> dict:
+        """Same as Conjugation.model_dump()."""
+        return self.to_model().model_dump(**kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"ConjugationRecord(infinitive={self.infinitive!r}, "
+            f"auxiliary={self.auxiliary.value!r}, reflexive={self.reflexive}, "
+            f"tense={self.tense.value!r})"
+        )
@@ -0,0 +1,92 @@
+"""Single-flight deduplication of concurrent cache-miss loads."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from src.core.config import settings
+from src.core.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one load per key at a time.
+
+    The first caller for a key starts the load; callers arriving while it is
+    in flight wait for the same result (or exception) instead of issuing an
+    identical query. The load runs as its own task, so a waiter that is
+    cancelled (e.g. a disconnected client) does not abort it for the others.
+    Nothing is remembered once the load finishes: the caches hold results.
+
+    With max_in_flight set, at most that many distinct loads run at once and
+    callers for further keys are rejected with a 503. This bounds the database
+    fallback while the caches are still warming (or if they fail to load).
+    """
+
+    def __init__(self, name: str, max_in_flight: int | None = None):
+        self.name = name
+        self.max_in_flight = max_in_flight
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+        # Metrics
+        self._loads = 0
+        self._coalesced = 0
+        self._errors = 0
+        self._rejected = 0
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        """Return load()'s result, sharing a load already in flight for key."""
+        task = self._in_flight.get(key)
+        if task is None:
+            if (
+                self.max_in_flight is not None
+                and len(self._in_flight) >= self.max_in_flight
+            ):
+                self._rejected += 1
+                raise ServiceUnavailableError(
+                    f"Too many concurrent {self.name} lookups, retry shortly",
+                    retry_after=1,
+                )
+            task = asyncio.ensure_future(load())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self._loads += 1
+        else:
+            self._coalesced += 1
+            logger.debug(f"Coalesced {self.name} load for {key!r}")
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        """Forget a finished load (internal helper)."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so a load nobody awaits any more is not
+        # reported as "never retrieved"
+        if not task.cancelled() and task.exception() is not None:
+            self._errors += 1
+
+    def get_stats(self) -> dict:
+        """Get coalescing statistics."""
+        calls = self._loads + self._coalesced
+        coalesced_rate = (self._coalesced / calls * 100) if calls > 0 else 0
+
+        return {
+            "in_flight": len(self._in_flight),
+            "loads": self._loads,
+            "coalesced": self._coalesced,
+            "errors": self._errors,
+            "rejected": self._rejected,
+            "coalesced_rate": f"{coalesced_rate:.2f}%",
+        }
+
+
+# Cache-miss loads (database fallbacks) in VerbService and ApiKeyService
+verb_loads = SingleFlight("verbs", settings.cache_fallback_max_in_flight)
+conjugation_loads = SingleFlight("conjugations", settings.cache_fallback_max_in_flight)
+api_key_loads = SingleFlight("api_keys", settings.cache_fallback_max_in_flight)
@@ -0,0 +1,595 @@
+"""
+Versioned on-disk snapshot of the verb, conjugation and API key caches.
+
+File layout (integers are little-endian u32 unless noted):
+
+    magic        8 bytes, b"LQSCACHE"
+    header size
+    header       JSON: format, cache_version, created_at, checksum (crc32 of
+                 the body), and the offsets of the string table and of each
+                 section within the body
+    padding      to an 8 byte boundary
+    body         string table: offsets (count + 1) then the UTF-8 blob,
+                 then one row-major cell array per section
+
+Every cell is an index into the string table, which holds each distinct
+value once (index 0 is None). Columns of kind "s" store the string itself,
+kind "j" its JSON encoding. Files are memory-mapped on read and the cell
+arrays are used in place; each distinct string is decoded once and shared by
+every row that holds it.
+
+The cache_version stamp is the database's get_cache_version() at the time
+the cached rows were read. It advances on every change to the cached tables,
+so a snapshot whose stamp still matches holds exactly the current data.
+"""
+
+import asyncio
+import json
+import logging
+import mmap
+import os
+import sys
+import tempfile
+import time
+import zlib
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from opentelemetry import trace
+from pydantic import BaseModel
+
+from src.cache.api_key_cache import api_key_cache
+from src.cache.conjugation_cache import conjugation_cache
+from src.cache.records import ConjugationRecord
+from src.cache.verb_cache import verb_cache
+from src.schemas.api_keys import ApiKey
+from src.schemas.verbs import Conjugation, Verb
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+MAGIC = b"LQSCACHE"
+FORMAT_VERSION = 1
+
+# Sections and the models their rows validate into
+SECTION_MODELS: dict[str, type[BaseModel]] = {
+    "verbs": Verb,
+    "conjugations": Conjugation,
+    "api_keys": ApiKey,
+}
+
+_PREAMBLE_SIZE = len(MAGIC) + 4
+
+# Caches that must be loaded before the service reports ready: every request
+# authenticates, and most read verbs. Conjugations may finish later; their
+# misses fall back to the database.
+READY_CACHES = ("api_keys", "verbs")
+
+# Background warm-up retries: first delay in seconds, doubled up to the maximum
+WARMUP_RETRY_SECONDS = 2.0
+WARMUP_MAX_RETRY_SECONDS = 60.0
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is corrupt or incompatible."""
+
+
+def _u32_array(values=()) -> array:
+    """Unsigned 32-bit array (internal helper)."""
+    return array("I", values)
+
+
+def _to_little_endian(values: array) -> bytes:
+    """Serialize a u32 array as little-endian (internal helper)."""
+    if sys.byteorder != "little":
+        values = array("I", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+@contextmanager
+def _u32_cells(buffer: memoryview) -> Iterator[memoryview | array]:
+    """Read little-endian u32s, in place where possible (internal helper)."""
+    if sys.byteorder != "little":
+        values = array("I", bytes(buffer))
+        values.byteswap()
+        yield values
+        return
+    # Released on exit, so the file can be unmapped afterwards
+    with buffer.cast("I") as values:
+        yield values
+
+
+def _pad(size: int, alignment: int) -> int:
+    """Bytes needed to align `size` (internal helper)."""
+    return -size % alignment
+
+
+class _StringTable:
+    """Distinct strings by first appearance; index 0 stands for None."""
+
+    def __init__(self):
+        self._index: dict[str, int] = {}
+        self._encoded: list[bytes] = [b""]
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return 0
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self._encoded)
+            self._encoded.append(value.encode())
+        return index
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+    def to_bytes(self) -> tuple[bytes, bytes]:
+        """Offsets (count + 1) and the concatenated blob."""
+        offsets = _u32_array([0])
+        position = 0
+        for encoded in self._encoded:
+            position += len(encoded)
+            offsets.append(position)
+        return _to_little_endian(offsets), b"".join(self._encoded)
+
+
+def write_snapshot(
+    path: str | Path,
+    cache_version: int,
+    verbs: list[Verb],
+    conjugations: list[Conjugation | ConjugationRecord],
+    api_keys: list[ApiKey],
+) -> dict:
+    """
+    Write a snapshot atomically and return its summary.
+
+    The file replaces any previous snapshot only once fully written. It is
+    created readable by the owner only, as it includes API key hashes.
+    """
+    path = Path(path)
+    strings = _StringTable()
+    cells: dict[str, tuple[list[list[str]], array, int]] = {}
+
+    for name, rows in (
+        ("verbs", verbs),
+        ("conjugations", conjugations),
+        ("api_keys", api_keys),
+    ):
+        fields = list(SECTION_MODELS[name].model_fields)
+        dumped = [row.model_dump(mode="json") for row in rows]
+        columns = [
+            [
+                field,
+                "s" if all(isinstance(d[field], str | None) for d in dumped) else "j",
+            ]
+            for field in fields
+        ]
+        section_cells = _u32_array()
+        for row in dumped:
+            for field, kind in columns:
+                value = row[field]
+                if kind == "j" and value is not None:
+                    value = json.dumps(value, separators=(",", ":"))
+                section_cells.append(strings.add(value))
+        cells[name] = (columns, section_cells, len(dumped))
+
+    offsets, blob = strings.to_bytes()
+    body = bytearray(offsets)
+    string_table = {
+        "count": len(strings),
+        "offsets": 0,
+        "blob": len(body),
+        "size": len(blob),
+    }
+    body += blob
+    body += b"\0" * _pad(len(body), 4)
+
+    sections = {}
+    for name, (columns, section_cells, row_count) in cells.items():
+        sections[name] = {"columns": columns, "rows": row_count, "offset": len(body)}
+        body += _to_little_endian(section_cells)
+
+    created_at = datetime.now(UTC)
+    header = json.dumps(
+        {
+            "format": FORMAT_VERSION,
+            "cache_version": cache_version,
+            "created_at": created_at.isoformat(),
+            "checksum": zlib.crc32(body),
+            "strings": string_table,
+            "sections": sections,
+        },
+        separators=(",", ":"),
+    ).encode()
+    header += b" " * _pad(_PREAMBLE_SIZE + len(header), 8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as f:
+        try:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(4, "little"))
+            f.write(header)
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        except BaseException:
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
+
+    return {
+        "path": str(path),
+        "cache_version": cache_version,
+        "created_at": created_at.isoformat(),
+        "bytes": _PREAMBLE_SIZE + len(header) + len(body),
+        "strings": len(strings),
+        "rows": {name: section["rows"] for name, section in sections.items()},
+    }
+
+
+class CacheSnapshot:
+    """
+    A memory-mapped snapshot file.
+
+    Also quacks like the repositories the caches load from (get_all_verbs,
+    get_all_conjugations, get_all_api_keys), so `cache.load(snapshot)` fills
+    a cache from it. Use as a context manager, or call close().
+    """
+
+    def __init__(self, path: str | Path, verify: bool = True):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError(f"Snapshot {self.path} is empty") from e
+        self._view = memoryview(self._mmap)
+        self._strings: list[str | None] | None = None
+
+        try:
+            self._parse_header(verify)
+        except BaseException:
+            self.close()
+            raise
+
+    def _parse_header(self, verify: bool):
+        """Read and check the header (internal helper)."""
+        view = self._view
+        if len(view) < _PREAMBLE_SIZE or bytes(view[: len(MAGIC)]) != MAGIC:
+            raise SnapshotError(f"{self.path} is not a cache snapshot")
+
+        header_size = int.from_bytes(view[len(MAGIC) : _PREAMBLE_SIZE], "little")
+        body_start = _PREAMBLE_SIZE + header_size
+        try:
+            self.header = json.loads(bytes(view[_PREAMBLE_SIZE:body_start]))
+        except ValueError as e:
+            raise SnapshotError(f"Snapshot {self.path} has a corrupt header") from e
+
+        if self.header.get("format") != FORMAT_VERSION:
+            raise SnapshotError(
+                f"Snapshot {self.path} has format {self.header.get('format')}, "
+                f"expected {FORMAT_VERSION}"
+            )
+
+        self._body = view[body_start:]
+        if verify and zlib.crc32(self._body) != self.header["checksum"]:
+            raise SnapshotError(f"Snapshot {self.path} failed its checksum")
+
+    @property
+    def cache_version(self) -> int:
+        """Database cache version the snapshot was taken at."""
+        return self.header["cache_version"]
+
+    @property
+    def created_at(self) -> datetime:
+        """When the snapshot was written."""
+        return datetime.fromisoformat(self.header["created_at"])
+
+    @property
+    def size(self) -> int:
+        """File size in bytes."""
+        return len(self._mmap)
+
+    def row_counts(self) -> dict[str, int]:
+        """Rows per section."""
+        return {
+            name: section["rows"] for name, section in self.header["sections"].items()
+        }
+
+    def _load_strings(self) -> list[str | None]:
+        """Decode each distinct string once (internal helper)."""
+        if self._strings is None:
+            table = self.header["strings"]
+            count = table["count"]
+            start = table["offsets"]
+            with (
+                self._body[start : start + (count + 1) * 4] as raw,
+                _u32_cells(raw) as offsets,
+                self._body[table["blob"] : table["blob"] + table["size"]] as blob,
+            ):
+                self._strings = [None] + [
+                    str(blob[offsets[i] : offsets[i + 1]], "utf-8")
+                    for i in range(1, count)
+                ]
+        return self._strings
+
+    def rows(self, name: str) -> Iterator[dict[str, Any]]:
+        """Yield a section's rows as JSON-mode dicts."""
+        section = self.header["sections"][name]
+        columns = section["columns"]
+        width = len(columns)
+        if not section["rows"] or not width:
+            return
+
+        strings = self._load_strings()
+        start = section["offset"]
+        decoded: dict[int, Any] = {}
+
+        with (
+            self._body[start : start + section["rows"] * width * 4] as raw,
+            _u32_cells(raw) as cells,
+        ):
+            for offset in range(0, len(cells), width):
+                row = {}
+                for (field, kind), index in zip(
+                    columns, cells[offset : offset + width], strict=True
+                ):
+                    if kind == "s" or index == 0:
+                        row[field] = strings[index]
+                    else:
+                        # Decode each distinct JSON value once
+                        if index not in decoded:
+                            decoded[index] = json.loads(strings[index])
+                        row[field] = decoded[index]
+                yield row
+
+    def verbs(self) -> list[Verb]:
+        """All verbs in the snapshot."""
+        return [Verb.model_validate(row) for row in self.rows("verbs")]
+
+    def conjugations(self) -> list[ConjugationRecord]:
+        """All conjugations in the snapshot, as cache records."""
+        return [
+            ConjugationRecord.from_model(Conjugation.model_validate(row))
+            for row in self.rows("conjugations")
+        ]
+
+    def api_keys(self) -> list[ApiKey]:
+        """All API keys in the snapshot, active or not."""
+        return [ApiKey.model_validate(row) for row in self.rows("api_keys")]
+
+    # Repository interface for cache.load(); a snapshot always holds the whole
+    # table, so limits are ignored
+
+    async def get_all_verbs(self, **_) -> list[Verb]:
+        return self.verbs()
+
+    async def get_all_conjugations(self, **_) -> list[ConjugationRecord]:
+        return self.conjugations()
+
+    async def get_all_api_keys(self, **_) -> list[ApiKey]:
+        return self.api_keys()
+
+    def close(self):
+        """Unmap the file."""
+        for name in ("_body", "_view"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "CacheSnapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+async def fetch_cache_version(client) -> int:
+    """Current version of the cached tables (get_cache_version() RPC)."""
+    result = await client.rpc("get_cache_version").execute()
+    return int(result.data)
+
+
+async def save_snapshot(path: str | Path, cache_version: int) -> dict:
+    """Write the current contents of the caches to a snapshot."""
+    with tracer.start_as_current_span("cache_snapshot.save"):
+        verbs, conjugations, api_keys = await asyncio.gather(
+            verb_cache.get_all(), conjugation_cache.get_all(), api_key_cache.get_all()
+        )
+        return await asyncio.to_thread(
+            write_snapshot, path, cache_version, verbs, conjugations, api_keys
+        )
+
+
+class CacheWarmup:
+    """
+    Fills the caches at startup, from the snapshot whenever it is usable.
+
+    - Snapshot stamp matches the database: load everything from the snapshot.
+    - Snapshot is stale: load verbs and conjugations from it, API keys from
+      the database (so revocations apply immediately), then reload all caches
+      from the database and rewrite the snapshot in the background.
+    - No usable snapshot: load from the database and write one.
+
+    API keys are loaded first, then verbs and conjugations together. load()
+    blocks until done; start() warms in a background task instead, retrying
+    until it succeeds, and readiness() reports when the hot caches are in.
+    """
+
+    def __init__(self):
+        self._refresh_task: asyncio.Task | None = None
+        self._warmup_task: asyncio.Task | None = None
+        self.error: str | None = None
+        self.source: str | None = None
+        self.snapshot_version: int | None = None
+        self.seconds: float | None = None
+
+    async def load(
+        self, client, verb_repository, api_key_repository, snapshot_path=None
+    ) -> str:
+        """Warm all caches; returns "snapshot", "stale snapshot" or "database"."""
+        with tracer.start_as_current_span("cache_warmup.load") as span:
+            start = time.perf_counter()
+            self.source = await self._load(
+                client, verb_repository, api_key_repository, snapshot_path
+            )
+            self.seconds = time.perf_counter() - start
+            span.set_attribute("cache.source", self.source)
+            logger.info(f"Caches warmed from {self.source} in {self.seconds:.2f}s")
+            return self.source
+
+    async def _load(self, client, verb_repository, api_key_repository, path) -> str:
+        if not path:
+            await self._load_from_database(verb_repository, api_key_repository)
+            return "database"
+
+        try:
+            version = await fetch_cache_version(client)
+        except Exception as e:
+            logger.warning(f"Cache version check failed, snapshot is untrusted: {e}")
+            version = None
+
+        try:
+            snapshot = CacheSnapshot(path)
+        except FileNotFoundError:
+            logger.info(f"No cache snapshot at {path}")
+            snapshot = None
+        except SnapshotError as e:
+            logger.warning(f"Ignoring cache snapshot: {e}")
+            snapshot = None
+
+        if snapshot is None:
+            await self._load_from_database(verb_repository, api_key_repository)
+            if version is not None:
+                await self._save(path, version)
+            return "database"
+
+        with snapshot:
+            self.snapshot_version = snapshot.cache_version
+            if version is not None and snapshot.cache_version == version:
+                await self._load_caches(snapshot, snapshot)
+                return "snapshot"
+
+            logger.info(
+                f"Cache snapshot is stale (version {snapshot.cache_version}, "
+                f"database {version}); refreshing in the background"
+            )
+            await self._load_caches(snapshot, api_key_repository)
+
+        self._refresh_task = asyncio.create_task(
+            self._refresh(client, verb_repository, api_key_repository, path),
+            name="cache-snapshot-refresh",
+        )
+        return "stale snapshot"
+
+    async def _load_from_database(self, verb_repository, api_key_repository):
+        await self._load_caches(verb_repository, api_key_repository)
+
+    async def _load_caches(self, verb_source, api_key_source):
+        """Load API keys, then verbs and conjugations concurrently."""
+        await api_key_cache.load(api_key_source)
+        await asyncio.gather(
+            verb_cache.load(verb_source),
+            conjugation_cache.load(verb_source),
+        )
+
+    def start(self, client, verb_repository, api_key_repository, snapshot_path=None):
+        """Warm all caches in a background task, retrying until they load."""
+        self._warmup_task = asyncio.create_task(
+            self._warm(client, verb_repository, api_key_repository, snapshot_path),
+            name="cache-warmup",
+        )
+
+    async def _warm(self, client, verb_repository, api_key_repository, path):
+        delay = WARMUP_RETRY_SECONDS
+        while True:
+            try:
+                await self.load(client, verb_repository, api_key_repository, path)
+                self.error = None
+                return
+            except Exception as e:
+                self.error = f"{type(e).__name__}: {e}"
+                logger.error(
+                    f"Cache warm-up failed, retrying in {delay:.0f}s: {e}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, WARMUP_MAX_RETRY_SECONDS)
+
+    async def _refresh(self, client, verb_repository, api_key_repository, path):
+        """Reload stale caches from the database and rewrite the snapshot."""
+        try:
+            # Read the version first: changes during the reload make it stale
+            version = await fetch_cache_version(client)
+        except Exception as e:
+            logger.warning(f"Cache version check failed, not saving a snapshot: {e}")
+            version = None
+
+        try:
+            await asyncio.gather(
+                verb_cache.reload(verb_repository),
+                conjugation_cache.reload(verb_repository),
+            )
+            if version is not None:
+                await self._save(path, version)
+        except Exception as e:
+            logger.error(f"Background cache refresh failed: {e}", exc_info=True)
+
+    async def _save(self, path, version: int):
+        try:
+            summary = await save_snapshot(path, version)
+            self.snapshot_version = version
+            logger.info(f"Wrote cache snapshot: {summary}")
+        except Exception as e:
+            logger.warning(f"Failed to write cache snapshot to {path}: {e}")
+
+    async def stop(self):
+        """Cancel a background warm-up or refresh still in progress."""
+        for task in (self._warmup_task, self._refresh_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._warmup_task = None
+        self._refresh_task = None
+
+    @property
+    def warming(self) -> bool:
+        """Whether a background warm-up is still running."""
+        return self._warmup_task is not None and not self._warmup_task.done()
+
+    def readiness(self) -> dict:
+        """Whether the hot caches are loaded, with per-cache detail."""
+        caches = {
+            "api_keys": api_key_cache.loaded,
+            "verbs": verb_cache.loaded,
+            "conjugations": conjugation_cache.loaded,
+        }
+        return {
+            "ready": all(caches[name] for name in READY_CACHES),
+            "caches": caches,
+            "warming": self.warming,
+            "error": self.error,
+        }
+
+    def get_stats(self) -> dict:
+        """Where the caches were last warmed from."""
+        return {
+            "source": self.source,
+            "snapshot_version": self.snapshot_version,
+            "seconds": round(self.seconds, 3) if self.seconds is not None else None,
+            "warming": self.warming,
+            "refreshing": self._refresh_task is not None
+            and not self._refresh_task.done(),
+        }
+
+
+# Global instance
+cache_warmup = CacheWarmup()
@@ -2,68 +2,142 @@
 
 import asyncio
 import logging
+import random
 from uuid import UUID
 
 from opentelemetry import trace
 
+from src.cache.metrics import CacheLookups, estimate_memory, timed_load
+from src.cache.paged_loader import add_in_batches, load_paged
 from src.schemas.verbs import Verb
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# (target_language_code, requires_cod, requires_coi)
+RandomPoolKey = tuple[str, bool, bool]
 
-class VerbCache:
+# (infinitive, reflexive, target_language_code)
+InfinitiveKey = tuple[str, bool, str]
+
+REFLEXIVE_PREFIX = "se "
+
+
+def _split_reflexive(infinitive: str) -> tuple[str, bool]:
+    """("se coucher") -> ("coucher", True) (internal helper)."""
+    if infinitive.startswith(REFLEXIVE_PREFIX):
+        return infinitive[len(REFLEXIVE_PREFIX) :], True
+    return infinitive, False
+
+
+class _RandomPool:
     """
-    In-memory cache for verbs with multiple indexes for different access patterns.
+    Array of verbs supporting O(1) add, remove and random choice.
 
-    Thread-safe using asyncio.Lock for concurrent access.
+    Removal swaps the last verb into the freed slot, so order is not kept.
+    Adding a verb already in the pool replaces it in its slot.
     """
 
+    __slots__ = ("verbs", "positions")
+
     def __init__(self):
-        # Primary index: by UUID
-        self._verbs_by_id: dict[UUID, Verb] = {}
+        self.verbs: list[Verb] = []
+        self.positions: dict[UUID, int] = {}
+
+    def add(self, verb: Verb):
+        index = self.positions.get(verb.id)
+        if index is not None:
+            self.verbs[index] = verb
+            return
+        self.positions[verb.id] = len(self.verbs)
+        self.verbs.append(verb)
+
+    def remove(self, verb_id: UUID):
+        index = self.positions.pop(verb_id, None)
+        if index is None:
+            return
+        last = self.verbs.pop()
+        if index < len(self.verbs):
+            self.verbs[index] = last
+            self.positions[last.id] = index
+
+    def choice(self) -> Verb | None:
+        if not self.verbs:
+            return None
+        return self.verbs[random.randrange(len(self.verbs))]
 
-        # Secondary index: by (infinitive, auxiliary, reflexive, target_language_code)
-        self._verbs_by_key: dict[tuple[str, str, bool, str], Verb] = {}
 
-        # Index for random selection: by target_language_code
-        self._verbs_by_language: dict[str, list[Verb]] = {}
+def _in_repository_order(verbs: list[Verb]) -> list[Verb]:
+    """
+    Verbs ordered as get_all_verbs returns them: infinitive ASC, created_at DESC.
 
-        self._loaded = False
-        self._lock = asyncio.Lock()
+    Pages arrive in id order; indexing in this order keeps the per-language
+    lists sorted by infinitive and puts the newest variant first in each
+    by_infinitive bucket, matching the database lookups.
+    """
+    ordered = sorted(verbs, key=lambda v: v.created_at, reverse=True)
+    ordered.sort(key=lambda v: v.infinitive)
+    return ordered
 
-        # Metrics
-        self._hits = 0
-        self._misses = 0
 
-    async def load(self, repository):
-        """Load all verbs into cache at startup."""
-        with tracer.start_as_current_span("verb_cache.load"):
-            async with self._lock:
-                # Duck typing: check for the method we need instead of isinstance
-                if not hasattr(repository, "get_all_verbs"):
-                    raise TypeError("Repository must have get_all_verbs method")
+def _infinitive_key(verb: Verb) -> InfinitiveKey:
+    """by_infinitive key for a verb (internal helper)."""
+    return (verb.infinitive, verb.reflexive, verb.target_language_code)
 
-                logger.info("Loading verbs into cache...")
-                verbs = await repository.get_all_verbs(limit=10000)
 
-                self._verbs_by_id.clear()
-                self._verbs_by_key.clear()
-                self._verbs_by_language.clear()
+def _random_pool_keys(verb: Verb) -> list[RandomPoolKey]:
+    """Random-selection partitions a verb belongs to (test verbs: none)."""
+    if verb.is_test:
+        return []
+    lang = verb.target_language_code
+    keys = [(lang, False, False)]
+    if verb.can_have_cod:
+        keys.append((lang, True, False))
+    if verb.can_have_coi:
+        keys.append((lang, False, True))
+    if verb.can_have_cod and verb.can_have_coi:
+        keys.append((lang, True, True))
+    return keys
 
-                for verb in verbs:
-                    self._add_verb_to_indexes(verb)
 
-                self._loaded = True
-                logger.info(
-                    f"✅ Loaded {len(verbs)} verbs into cache "
-                    f"({len(self._verbs_by_language)} languages)"
-                )
+class _VerbIndexes:
+    """
+    One generation of the verb cache's indexes.
 
-    def _add_verb_to_indexes(self, verb: Verb):
-        """Add a verb to all indexes (internal helper)."""
+    Loads build a new generation off to the side and publish it by swapping
+    the cache's reference, so readers see either the old or the new
+    generation in full, never a partly built one.
+    """
+
+    __slots__ = (
+        "by_id",
+        "by_key",
+        "by_language",
+        "by_infinitive",
+        "random_pools",
+    )
+
+    def __init__(self):
+        # Primary index: by UUID
+        self.by_id: dict[UUID, Verb] = {}
+
+        # Secondary index: by (infinitive, auxiliary, reflexive, target_language_code)
+        self.by_key: dict[tuple[str, str, bool, str], Verb] = {}
+
+        # By target_language_code (insertion ordered, keyed by id for O(1) removal)
+        self.by_language: dict[str, dict[UUID, Verb]] = {}
+
+        # Lookup by infinitive alone: by (infinitive, reflexive, target_language_code)
+        self.by_infinitive: dict[InfinitiveKey, dict[UUID, Verb]] = {}
+
+        # Random selection partitions, excluding test verbs:
+        # by (target_language_code, requires_cod, requires_coi)
+        self.random_pools: dict[RandomPoolKey, _RandomPool] = {}
+
+    def add(self, verb: Verb):
+        """Add a verb to all indexes."""
         # Primary index
-        self._verbs_by_id[verb.id] = verb
+        self.by_id[verb.id] = verb
 
         # Secondary index
         key = (
@@ -72,17 +146,41 @@ class VerbCache:
             verb.reflexive,
             verb.target_language_code,
         )
-        self._verbs_by_key[key] = verb
+        self.by_key[key] = verb
 
         # Language index
-        if verb.target_language_code not in self._verbs_by_language:
-            self._verbs_by_language[verb.target_language_code] = []
-        self._verbs_by_language[verb.target_language_code].append(verb)
+        if verb.target_language_code not in self.by_language:
+            self.by_language[verb.target_language_code] = {}
+        self.by_language[verb.target_language_code][verb.id] = verb
+
+        # Infinitive index, newest variant first
+        key = _infinitive_key(verb)
+        verbs = self.by_infinitive.get(key)
+        if verbs is None:
+            self.by_infinitive[key] = {verb.id: verb}
+        else:
+            out_of_order = next(reversed(verbs.values())).created_at < verb.created_at
+            verbs[verb.id] = verb
+            if out_of_order:
+                self.by_infinitive[key] = dict(
+                    sorted(
+                        verbs.items(),
+                        key=lambda item: item[1].created_at,
+                        reverse=True,
+                    )
+                )
+
+        # Random selection partitions
+        for pool_key in _random_pool_keys(verb):
+            pool = self.random_pools.get(pool_key)
+            if pool is None:
+                pool = self.random_pools[pool_key] = _RandomPool()
+            pool.add(verb)
 
-    def _remove_verb_from_indexes(self, verb: Verb):
-        """Remove a verb from all indexes (internal helper)."""
+    def remove(self, verb: Verb):
+        """Remove a verb from all indexes."""
         # Primary index
-        self._verbs_by_id.pop(verb.id, None)
+        self.by_id.pop(verb.id, None)
 
         # Secondary index
         key = (
@@ -91,26 +189,93 @@ class VerbCache:
             verb.reflexive,
             verb.target_language_code,
         )
-        self._verbs_by_key.pop(key, None)
+        self.by_key.pop(key, None)
 
         # Language index
-        if verb.target_language_code in self._verbs_by_language:
-            lang_list = self._verbs_by_language[verb.target_language_code]
-            self._verbs_by_language[verb.target_language_code] = [
-                v for v in lang_list if v.id != verb.id
-            ]
+        if verb.target_language_code in self.by_language:
+            self.by_language[verb.target_language_code].pop(verb.id, None)
+
+        # Infinitive index
+        key = _infinitive_key(verb)
+        verbs = self.by_infinitive.get(key)
+        if verbs is not None:
+            verbs.pop(verb.id, None)
+            if not verbs:
+                del self.by_infinitive[key]
+
+        # Random selection partitions
+        for pool_key in _random_pool_keys(verb):
+            pool = self.random_pools.get(pool_key)
+            if pool is not None:
+                pool.remove(verb.id)
+
+
+class VerbCache:
+    """
+    In-memory cache for verbs with multiple indexes for different access patterns.
+
+    Writers serialize on an asyncio.Lock; readers take no lock. A load builds
+    a new _VerbIndexes generation and swaps it in, while refresh and
+    invalidate update the current generation in one synchronous step.
+    """
+
+    def __init__(self):
+        # Current generation of indexes, replaced wholesale on load
+        self._indexes = _VerbIndexes()
+
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+        # Stats from the most recent paged load
+        self._last_load: dict | None = None
+
+        # Metrics
+        self._lookups = CacheLookups()
+
+    async def load(self, repository):
+        """Load all verbs into cache at startup."""
+        with tracer.start_as_current_span("verb_cache.load"), timed_load("verbs"):
+            async with self._lock:
+                # Duck typing: prefer keyset pages, fall back to a single query
+                logger.info("Loading verbs into cache...")
+                if hasattr(repository, "get_verbs_page"):
+                    verbs, self._last_load = await load_paged(
+                        "verbs", repository.get_verbs_page, repository.count_verbs
+                    )
+                elif hasattr(repository, "get_all_verbs"):
+                    verbs = await repository.get_all_verbs(limit=10000)
+                else:
+                    raise TypeError(
+                        "Repository must have get_verbs_page or get_all_verbs method"
+                    )
+
+                indexes = _VerbIndexes()
+                await add_in_batches(_in_repository_order(verbs), indexes.add)
+
+                # Publish with a single reference swap
+                self._indexes = indexes
+                self._loaded = True
+                logger.info(
+                    f"✅ Loaded {len(verbs)} verbs into cache "
+                    f"({len(indexes.by_language)} languages)"
+                )
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a full load has completed."""
+        return self._loaded
 
     async def get_by_id(self, verb_id: UUID) -> Verb | None:
         """Get a verb by ID from cache."""
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_id")
             return None
 
-        verb = self._verbs_by_id.get(verb_id)
+        verb = self._indexes.by_id.get(verb_id)
         if verb:
-            self._hits += 1
+            self._lookups.hit("by_id")
         else:
-            self._misses += 1
+            self._lookups.miss("by_id")
         return verb
 
     async def get_by_infinitive(
@@ -122,15 +287,15 @@ class VerbCache:
     ) -> Verb | None:
         """Get a verb by its unique key from cache."""
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_key")
             return None
 
         key = (infinitive, auxiliary, reflexive, target_language_code)
-        verb = self._verbs_by_key.get(key)
+        verb = self._indexes.by_key.get(key)
         if verb:
-            self._hits += 1
+            self._lookups.hit("by_key")
         else:
-            self._misses += 1
+            self._lookups.miss("by_key")
         return verb
 
     async def get_by_infinitive_simple(
@@ -145,25 +310,18 @@ class VerbCache:
         Handles both reflexive and non-reflexive forms of the same verb (e.g., "appeler" vs "se appeler").
         """
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("by_infinitive")
             return None
 
-        # Check if this is a reflexive verb (starts with "se ")
-        is_reflexive_query = infinitive.startswith("se ")
-        base_infinitive = infinitive[3:] if is_reflexive_query else infinitive
-
-        # Search through all verbs for this language
-        verbs = self._verbs_by_language.get(target_language_code, [])
-        for verb in verbs:
-            # Match based on base infinitive and reflexive flag
-            if (
-                verb.infinitive == base_infinitive
-                and verb.reflexive == is_reflexive_query
-            ):
-                self._hits += 1
-                return verb
-
-        self._misses += 1
+        base_infinitive, is_reflexive_query = _split_reflexive(infinitive)
+        verbs = self._indexes.by_infinitive.get(
+            (base_infinitive, is_reflexive_query, target_language_code)
+        )
+        if verbs:
+            self._lookups.hit("by_infinitive")
+            return next(iter(verbs.values()))
+
+        self._lookups.miss("by_infinitive")
         return None
 
     async def get_all_by_language(self, target_language_code: str) -> list[Verb]:
@@ -171,10 +329,14 @@ class VerbCache:
         if not self._loaded:
             return []
 
-        verbs = self._verbs_by_language.get(target_language_code, [])
+        verbs = self._indexes.by_language.get(target_language_code, {})
         if verbs:
-            self._hits += 1
-        return verbs.copy()  # Return a copy to prevent external modification
+            self._lookups.hit("by_language")
+        return list(verbs.values())  # Return a copy to prevent external modification
+
+    async def get_all(self) -> list[Verb]:
+        """Get every cached verb (e.g. to write a snapshot)."""
+        return list(self._indexes.by_id.values())
 
     async def get_random_verb(
         self,
@@ -192,46 +354,38 @@ class VerbCache:
         Excludes test verbs (is_test=True) from selection.
         """
         if not self._loaded:
-            self._misses += 1
+            self._lookups.miss("random")
             return None
 
-        all_verbs = self._verbs_by_language.get(target_language_code, [])
-        # Filter out test verbs
-        verbs = [v for v in all_verbs if not v.is_test]
-
-        # Filter by COD/COI capability if required
-        if requires_cod:
-            verbs = [v for v in verbs if v.can_have_cod]
-        if requires_coi:
-            verbs = [v for v in verbs if v.can_have_coi]
-
-        if not verbs:
-            self._misses += 1
+        pool = self._indexes.random_pools.get(
+            (target_language_code, requires_cod, requires_coi)
+        )
+        verb = pool.choice() if pool is not None else None
+        if verb is None:
+            self._lookups.miss("random")
             return None
 
-        import random
-
-        self._hits += 1
-        return random.choice(verbs)
+        self._lookups.hit("random")
+        return verb
 
     async def refresh_verb(self, verb: Verb):
         """Add or update a verb in the cache."""
         async with self._lock:
             # Remove old version if it exists
-            if verb.id in self._verbs_by_id:
-                old_verb = self._verbs_by_id[verb.id]
-                self._remove_verb_from_indexes(old_verb)
+            old_verb = self._indexes.by_id.get(verb.id)
+            if old_verb is not None:
+                self._indexes.remove(old_verb)
 
             # Add new version
-            self._add_verb_to_indexes(verb)
+            self._indexes.add(verb)
             logger.debug(f"Refreshed verb {verb.infinitive} in cache")
 
     async def invalidate_verb(self, verb_id: UUID):
         """Remove a verb from the cache."""
         async with self._lock:
-            if verb_id in self._verbs_by_id:
-                verb = self._verbs_by_id[verb_id]
-                self._remove_verb_from_indexes(verb)
+            verb = self._indexes.by_id.get(verb_id)
+            if verb is not None:
+                self._indexes.remove(verb)
                 logger.debug(f"Invalidated verb {verb_id} from cache")
 
     async def reload(self, repository):
@@ -241,18 +395,40 @@ class VerbCache:
 
     def get_stats(self) -> dict:
         """Get cache statistics."""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
+        hits, misses = self._lookups.hits, self._lookups.misses
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total > 0 else 0
 
         return {
             "loaded": self._loaded,
-            "total_verbs": len(self._verbs_by_id),
-            "languages": len(self._verbs_by_language),
-            "hits": self._hits,
-            "misses": self._misses,
+            "total_verbs": len(self._indexes.by_id),
+            "languages": len(self._indexes.by_language),
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.2f}%",
+            "lookups": self._lookups.by_pattern(),
+            "memory_bytes": self.approximate_memory(),
+            "last_load": self._last_load,
         }
 
+    def approximate_memory(self) -> int:
+        """Approximate bytes held by the cached verbs and their indexes."""
+        indexes = self._indexes
+        pools = indexes.random_pools.values()
+        return estimate_memory(
+            indexes.by_id.values(),
+            len(indexes.by_id),
+            [
+                indexes.by_id,
+                indexes.by_key,
+                indexes.by_language,
+                indexes.by_infinitive,
+                indexes.random_pools,
+                *(pool.verbs for pool in pools),
+                *(pool.positions for pool in pools),
+            ],
+        )
+
 
 # Global singleton instance
 verb_cache = VerbCache()
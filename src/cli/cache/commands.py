@@ -7,7 +7,14 @@ import logging
 import asyncclick as click
 
 from src.cache import api_key_cache, conjugation_cache, verb_cache
+from src.cache.snapshot import (
+    CacheSnapshot,
+    SnapshotError,
+    fetch_cache_version,
+    save_snapshot,
+)
 from src.clients.supabase import get_supabase_client
+from src.core.config import get_settings
 from src.repositories.api_keys_repository import ApiKeyRepository
 from src.repositories.verb_repository import VerbRepository
 
@@ -104,3 +111,86 @@ async def reload_cache(ctx, cache_name: str):
     except Exception as e:
         logger.error(f"Error reloading cache: {e}", exc_info=True)
         click.echo(f"❌ Error: {e}")
+
+
+def _snapshot_path(path: str | None) -> str:
+    """Explicit path, else CACHE_SNAPSHOT_PATH (internal helper)."""
+    path = path or get_settings().cache_snapshot_path
+    if not path:
+        raise click.UsageError("Pass --path or set CACHE_SNAPSHOT_PATH")
+    return path
+
+
+@click.command("build")
+@click.option("--path", help="Snapshot file (default: CACHE_SNAPSHOT_PATH)")
+@click.pass_context
+async def snapshot_build(ctx, path: str | None):
+    """
+    Build a cache snapshot from the database.
+
+    Loads verbs, conjugations and API keys, stamped with the current cache
+    version, and atomically replaces the snapshot file.
+    """
+    path = _snapshot_path(path)
+    try:
+        client = await get_supabase_client()
+        verb_repo = VerbRepository(client)
+        api_key_repo = ApiKeyRepository(client)
+
+        # Stamp before loading: changes made during the load make it stale
+        version = await fetch_cache_version(client)
+
+        click.echo("🔄 Loading caches from database...")
+        await verb_cache.load(verb_repo)
+        await conjugation_cache.load(verb_repo)
+        await api_key_cache.load(api_key_repo)
+
+        summary = await save_snapshot(path, version)
+        click.echo(f"✅ Wrote {summary['path']} ({summary['bytes']:,} bytes)")
+        click.echo(f"   Cache Version: {summary['cache_version']}")
+        for name, rows in summary["rows"].items():
+            click.echo(f"   {name + ':':<14} {rows}")
+
+    except Exception as e:
+        logger.error(f"Error building cache snapshot: {e}", exc_info=True)
+        click.echo(f"❌ Error: {e}")
+
+
+@click.command("inspect")
+@click.option("--path", help="Snapshot file (default: CACHE_SNAPSHOT_PATH)")
+@click.option(
+    "--check/--no-check",
+    default=True,
+    help="Compare the stamp with the database cache version",
+)
+@click.pass_context
+async def snapshot_inspect(ctx, path: str | None, check: bool):
+    """
+    Show a cache snapshot's version stamp, age and contents.
+    """
+    path = _snapshot_path(path)
+    try:
+        with CacheSnapshot(path) as snapshot:
+            click.echo(f"\n📦 Cache Snapshot: {path}\n")
+            click.echo(f"   Format:        {snapshot.header['format']}")
+            click.echo(f"   Cache Version: {snapshot.cache_version}")
+            click.echo(f"   Created:       {snapshot.created_at.isoformat()}")
+            click.echo(f"   Size:          {snapshot.size:,} bytes")
+            for name, rows in snapshot.row_counts().items():
+                click.echo(f"   {name + ':':<14} {rows}")
+            version = snapshot.cache_version
+    except FileNotFoundError:
+        click.echo(f"❌ No snapshot at {path}")
+        return
+    except SnapshotError as e:
+        click.echo(f"❌ Unusable snapshot: {e}")
+        return
+
+    if check:
+        try:
+            current = await fetch_cache_version(await get_supabase_client())
+        except Exception as e:
+            click.echo(f"   Status:        unknown ({e})")
+            return
+        status = "current" if current == version else f"stale (database: {current})"
+        click.echo(f"   Status:        {status}")
@@ -17,6 +17,8 @@ from src.cli.api_keys.commands import (
 from src.cli.cache.commands import (
     cache_stats,
     reload_cache,
+    snapshot_build,
+    snapshot_inspect,
 )
 from src.cli.cloud.database import (
     status as database_status,
@@ -438,6 +440,16 @@ cache.add_command(cache_stats, name="stats")
 cache.add_command(reload_cache, name="reload")
 
 
+@cache.group("snapshot")
+async def cache_snapshot():
+    """On-disk cache snapshot commands."""
+    pass
+
+
+cache_snapshot.add_command(snapshot_build, name="build")
+cache_snapshot.add_command(snapshot_inspect, name="inspect")
+
+
 def main():
     cli(_anyio_backend="asyncio")
 
@@ -17,6 +17,7 @@ from src.schemas.problems import (
     GrammarProblemConstraints,
     Problem,
     ProblemFilters,
+    ProblemProjection,
     ProblemType,
 )
 
@@ -190,7 +191,11 @@ async def get_random_problem(
             # Direct mode - use service layer
             logger.debug("💾 Using direct service layer mode")
             problems_service = await create_problem_service()
-            problem = await problems_service.get_random_problem()
+            problem = await problems_service.get_random_problem(
+                projection=ProblemProjection.FULL
+                if include_metadata
+                else ProblemProjection.SERVING
+            )
 
             if problem is None:
                 import asyncclick as click
@@ -1,15 +1,121 @@
 """Supabase client configuration."""
 
+import asyncio
 import logging
 import socket
+import weakref
 
-from supabase import AsyncClient, acreate_client
+import httpx
+
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 
 logger = logging.getLogger(__name__)
 
+# One shared client (and httpx connection pool) per event loop.
+# httpx clients are bound to the loop that opened their connections, so the
+# pool cannot be shared across loops (e.g. CLI runs, per-test loops).
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _PooledClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_client_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _PooledClient:
+    """A Supabase client together with the httpx pool it owns."""
+
+    __slots__ = ("client", "http_client", "url", "key")
+
+    def __init__(
+        self, client: AsyncClient, http_client: httpx.AsyncClient, url: str, key: str
+    ):
+        self.client = client
+        self.http_client = http_client
+        self.url = url
+        self.key = key
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the keep-alive/HTTP2 connection pool used for PostgREST calls."""
+    from src.core.config import settings
+
+    return httpx.AsyncClient(
+        http2=settings.supabase_http2,
+        limits=httpx.Limits(
+            max_connections=settings.supabase_max_connections,
+            max_keepalive_connections=settings.supabase_max_keepalive_connections,
+            keepalive_expiry=settings.supabase_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(settings.supabase_timeout_seconds),
+        follow_redirects=True,
+    )
+
 
 async def get_supabase_client() -> AsyncClient:
-    """Get Supabase client with service role key for backend operations."""
+    """
+    Get the shared Supabase client for the running event loop.
+
+    The first call on a loop builds the client and its connection pool;
+    later calls reuse it, so requests no longer pay for client construction
+    and TLS handshakes. A change of SUPABASE_URL/key (e.g. --local flag)
+    rebuilds the client.
+    """
+    from src.core.config import settings
+
+    loop = asyncio.get_running_loop()
+    pooled = _clients.get(loop)
+    if (
+        pooled is not None
+        and pooled.url == settings.supabase_url
+        and pooled.key == settings.supabase_key
+    ):
+        return pooled.client
+
+    lock = _client_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pooled = _clients.get(loop)
+        if (
+            pooled is not None
+            and pooled.url == settings.supabase_url
+            and pooled.key == settings.supabase_key
+        ):
+            return pooled.client
+
+        if pooled is not None:
+            await pooled.http_client.aclose()
+
+        http_client = create_http_client()
+        try:
+            client = await create_supabase_client(http_client=http_client)
+        except BaseException:
+            await http_client.aclose()
+            raise
+
+        _clients[loop] = _PooledClient(
+            client, http_client, settings.supabase_url, settings.supabase_key
+        )
+        logger.debug("Created pooled Supabase client for event loop")
+        return client
+
+
+async def close_supabase_client() -> None:
+    """Close the shared Supabase client for the running event loop (shutdown)."""
+    loop = asyncio.get_running_loop()
+    pooled = _clients.pop(loop, None)
+    if pooled is not None:
+        await pooled.http_client.aclose()
+        logger.info("Closed pooled Supabase client")
+
+
+async def create_supabase_client(
+    http_client: httpx.AsyncClient | None = None,
+) -> AsyncClient:
+    """
+    Create a new Supabase client with service role key for backend operations.
+
+    Prefer get_supabase_client(), which reuses one client per event loop.
+    """
     # Import settings here to allow for runtime environment overrides (e.g., --local flag)
     from src.core.config import settings
 
@@ -27,7 +133,12 @@ async def get_supabase_client() -> AsyncClient:
         raise ValueError(error_msg)
 
     try:
-        return await acreate_client(supabase_url, settings.supabase_key)
+        options = (
+            AsyncClientOptions(httpx_client=http_client)
+            if http_client is not None
+            else None
+        )
+        return await acreate_client(supabase_url, settings.supabase_key, options)
     except socket.gaierror as e:
         # DNS resolution failure
         error_msg = (
@@ -7,54 +7,100 @@ import logging
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from opentelemetry import trace
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.core.config import get_settings
+from src.core.exceptions import ServiceUnavailableError
 from src.core.factories import create_api_key_service
+from src.core.path_matching import PathPrefixMatcher
+from src.core.rate_limiting import api_key_rate_limiter
 
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer(__name__)
 
+# Always exempt from authentication
+EXEMPT_PATHS = ["/health", "/metrics"]
 
-class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
-    """Middleware for API key authentication and authorization."""
+# Also exempt outside production
+DOCS_PATHS = ["/docs", "/redoc", "/openapi.json"]
 
-    def __init__(self, app, exempt_paths: list[str] = None):
-        super().__init__(app)
+
+class ApiKeyAuthMiddleware:
+    """
+    Middleware for API key authentication and authorization.
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware so requests are
+    not copied through an extra task and stream per call. Exempt path rules
+    are compiled once here; settings are still read per request.
+
+    Authenticated requests are also held to their key's `rate_limit_rpm`
+    with a token bucket, and responses carry RateLimit-* headers.
+    """
+
+    def __init__(self, app: ASGIApp, exempt_paths: list[str] = None):
+        self.app = app
         self.exempt_paths = exempt_paths or []
 
-    async def dispatch(self, request: Request, call_next):
+        # Root is exempt exactly, everything else by prefix
+        self._exempt = PathPrefixMatcher(EXEMPT_PATHS + self.exempt_paths, exact=["/"])
+        self._exempt_with_docs = PathPrefixMatcher(
+            EXEMPT_PATHS + DOCS_PATHS + self.exempt_paths, exact=["/"]
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and validate API key if required."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
         with tracer.start_as_current_span(
             "auth_middleware",
             attributes={
-                "http.method": request.method,
-                "http.route": request.url.path,
+                "http.method": scope["method"],
+                "http.route": path,
             },
         ):
             # Check if this path is exempt from authentication
-            if self._is_exempt_path(request.url.path):
-                return await call_next(request)
+            if self._is_exempt_path(path):
+                await self.app(scope, receive, send)
+                return
+
+            headers = Headers(scope=scope)
+            state = scope.setdefault("state", {})
 
             # Check if authentication is required
             settings = get_settings()
             if not settings.should_require_auth:
                 # Development mode - bypass authentication
                 logger.debug("Authentication bypassed (REQUIRE_AUTH=False)")
-                request.state.api_key_info = {
+                state["api_key_info"] = {
                     "auth_type": "dev",
                     "name": "dev_user",
                     "is_admin": True,
                     "permissions_scope": ["read", "write", "admin"],
                     "bypassed": True,
                 }
-                request.state.client_ip = self._get_client_ip(request)
-                return await call_next(request)
+                state["client_ip"] = self._get_client_ip(scope, headers)
+                await self.app(scope, receive, send)
+                return
+
+            response_started = False
+            rate_limit_headers: dict[str, str] | None = None
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal response_started
+                if message["type"] == "http.response.start":
+                    response_started = True
+                    if rate_limit_headers:
+                        MutableHeaders(scope=message).update(rate_limit_headers)
+                await send(message)
 
             try:
                 # Extract API key from headers
                 with tracer.start_as_current_span("extract_api_key"):
-                    api_key = self._extract_api_key(request)
+                    api_key = self._extract_api_key(headers)
                     if not api_key:
                         raise HTTPException(
                             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -63,7 +109,7 @@ class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
 
                 # Validate API key and get key info (includes IP checking and usage tracking)
                 with tracer.start_as_current_span("validate_api_key"):
-                    client_ip = self._get_client_ip(request)
+                    client_ip = self._get_client_ip(scope, headers)
                     key_info = await self._validate_api_key_with_ip(api_key, client_ip)
                     if not key_info:
                         raise HTTPException(
@@ -71,81 +117,101 @@ class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
                             detail="Invalid API key",
                         )
 
+                # Enforce the key's own rate limit (per key, not per IP)
+                limit_rpm = key_info.get("rate_limit_rpm")
+                if limit_rpm and settings.api_key_rate_limit_enabled:
+                    bucket = api_key_rate_limiter.acquire(key_info["id"], limit_rpm)
+                    rate_limit_headers = bucket.headers()
+                    if not bucket.allowed:
+                        raise HTTPException(
+                            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                            detail="Rate limit exceeded for this API key",
+                        )
+
                 # Add key info to request state for downstream use
-                request.state.api_key_info = key_info
-                request.state.client_ip = client_ip
+                state["api_key_info"] = key_info
+                state["client_ip"] = client_ip
 
                 # Continue processing the request
-                response = await call_next(request)
-                return response
+                await self.app(scope, receive, send_wrapper)
+                return
 
             except HTTPException as exc:
                 # Return standardized JSON response for authentication errors
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=exc.status_code,
                     content={
                         "error": True,
                         "message": exc.detail,
                         "status_code": exc.status_code,
-                        "path": str(request.url.path),
+                        "path": path,
                     },
+                    headers=rate_limit_headers,
+                )
+            except ServiceUnavailableError as exc:
+                # Fast reject when auth capacity is saturated
+                retry_headers = (
+                    {"Retry-After": str(exc.retry_after)} if exc.retry_after else None
+                )
+                response = JSONResponse(
+                    status_code=exc.status_code,
+                    content={
+                        "error": True,
+                        "message": exc.message,
+                        "status_code": exc.status_code,
+                        "path": path,
+                    },
+                    headers=retry_headers,
                 )
             except Exception as e:
+                # Too late to replace a response that is already on the wire
+                if response_started:
+                    raise
                 logger.error(f"Authentication middleware error: {e}", exc_info=True)
                 # Return standardized JSON response for unexpected auth errors
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     content={
                         "error": True,
                         "message": "Authentication service error",
                         "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-                        "path": str(request.url.path),
+                        "path": path,
                     },
                 )
 
+            await response(scope, receive, send)
+
     def _is_exempt_path(self, path: str) -> bool:
         """Check if the request path is exempt from authentication."""
         try:
-            settings = get_settings()
-
-            # Always exempt health and metrics
-            exempt_patterns = ["/health", "/metrics"]
-
-            # Exempt root path exactly
-            if path == "/":
-                return True
-
             # In non-production, also exempt docs
-            if not settings.is_production:
-                exempt_patterns.extend(["/docs", "/redoc", "/openapi.json"])
-
-            # Add any additional exempt paths
-            exempt_patterns.extend(self.exempt_paths)
-
-            return any(path.startswith(pattern) for pattern in exempt_patterns)
+            if get_settings().is_production:
+                return self._exempt.matches(path)
+            return self._exempt_with_docs.matches(path)
         except Exception:
             # Fallback - only exempt health endpoints if settings fail
             return path.startswith(("/health", "/metrics", "/"))
 
-    def _extract_api_key(self, request: Request) -> str | None:
+    def _extract_api_key(self, headers: Headers) -> str | None:
         """Extract API key from X-API-Key header."""
-        return request.headers.get("X-API-Key")
+        return headers.get("X-API-Key")
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, scope: Scope, headers: Headers) -> str:
         """Extract the client IP address from the request."""
         # Check for forwarded headers first (from proxies/load balancers)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("X-Forwarded-For")
         if forwarded_for:
             # X-Forwarded-For can contain multiple IPs, use the first one
             return forwarded_for.split(",")[0].strip()
 
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("X-Real-IP")
         if real_ip:
             return real_ip.strip()
 
         # Fallback to direct client IP
-        if hasattr(request.client, "host"):
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
 
         return "unknown"
 
@@ -166,6 +232,10 @@ class ApiKeyAuthMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             from src.core.exceptions import RepositoryError, ServiceError
 
+            # Saturation is not an auth failure - let the outer handler return 503
+            if isinstance(e, ServiceUnavailableError):
+                raise
+
             # Check if this is an infrastructure error (database connection, etc.)
             # These should return 500 to indicate service unavailability
             if isinstance(e, RepositoryError | ServiceError):
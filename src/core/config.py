@@ -34,6 +34,39 @@ class Settings(BaseSettings):
     rate_limit_window: int = Field(
         default=60, description="Rate limit window in seconds"
     )
+    api_key_rate_limit_enabled: bool = Field(
+        default=True,
+        description="Enforce each API key's rate_limit_rpm in the auth middleware",
+    )
+    rate_limit_storage: str = Field(
+        default="memory",
+        description="Rate limit state: 'memory' (per machine) or 'postgres' (shared)",
+    )
+    rate_limit_sync_interval_ms: int = Field(
+        default=250,
+        ge=50,
+        description="How often machines exchange rate limit counters (postgres only)",
+    )
+
+    # Password hashing (bcrypt) executor
+    hash_executor_workers: int = Field(
+        default=4, ge=1, description="Threads dedicated to bcrypt hashing/verification"
+    )
+    hash_executor_max_queue: int = Field(
+        default=64,
+        ge=0,
+        description="Hash jobs allowed to wait for a thread before rejecting with 503",
+    )
+
+    # API key usage tracking (batched writes)
+    api_key_usage_flush_interval_seconds: float = Field(
+        default=5.0, gt=0, description="Seconds between bulk usage count writes"
+    )
+    api_key_usage_flush_threshold: int = Field(
+        default=500,
+        ge=1,
+        description="Pending usage increments that trigger an early flush",
+    )
 
     # Environment
     environment: str = Field(default="development")
@@ -74,6 +107,73 @@ class Settings(BaseSettings):
     supabase_anon_key: str = Field(default="test_key", alias="SUPABASE_ANON_KEY")
     supabase_project_ref: str = Field(default="test_ref", alias="SUPABASE_PROJECT_REF")
 
+    # Direct Postgres connection for LISTEN/NOTIFY cache invalidation
+    database_url: str | None = Field(
+        default=None,
+        description="Postgres DSN used to listen for cache invalidations (disabled when unset)",
+    )
+
+    # In-memory cache warm-up (keyset-paginated, see src/cache/paged_loader.py)
+    cache_load_page_size: int = Field(
+        default=1000,
+        ge=1,
+        description="Rows per page when loading caches (keep <= PostgREST max_rows)",
+    )
+    cache_load_parallelism: int = Field(
+        default=4, ge=1, description="Concurrent page requests per cache load"
+    )
+    cache_load_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Cache load attempts before failing on errors or a row count mismatch",
+    )
+    cache_snapshot_path: str | None = Field(
+        default=None,
+        description="On-disk cache snapshot used for fast cold starts (disabled when unset)",
+    )
+    cache_warmup_mode: str = Field(
+        default="blocking",
+        description="'blocking' (startup waits for the caches) or 'background' "
+        "(serve at once, /health/ready reports when the caches are warm)",
+    )
+    cache_fallback_max_in_flight: int = Field(
+        default=32,
+        ge=1,
+        description="Concurrent database lookups per cache on misses before rejecting with 503",
+    )
+
+    # Prefetched problem pool for /problems/random (see src/cache/problem_pool.py)
+    problem_pool_size: int = Field(
+        default=0,
+        ge=0,
+        description="Problems held in memory per replica for /problems/random (0 disables)",
+    )
+    problem_pool_refill_batch: int = Field(
+        default=50, ge=1, description="Problems claimed per refill query"
+    )
+    problem_pool_max_age_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Seconds a pooled problem may be held before it is dropped unserved",
+    )
+
+    # Supabase connection pool (shared per event loop)
+    supabase_http2: bool = Field(
+        default=True, description="Use HTTP/2 for PostgREST connections"
+    )
+    supabase_max_connections: int = Field(
+        default=100, ge=1, description="Max concurrent connections to Supabase"
+    )
+    supabase_max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Idle connections kept open for reuse"
+    )
+    supabase_keepalive_expiry_seconds: float = Field(
+        default=30.0, gt=0, description="Seconds an idle connection is kept open"
+    )
+    supabase_timeout_seconds: float = Field(
+        default=30.0, gt=0, description="PostgREST request timeout in seconds"
+    )
+
     # Observability - Grafana Cloud (OpenTelemetry)
     grafana_cloud_instance_id: str | None = Field(
         default=None, alias="GRAFANA_CLOUD_INSTANCE_ID"
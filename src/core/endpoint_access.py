@@ -1,13 +1,13 @@
 """Endpoint access control middleware for production/staging."""
 
 import logging
-from collections.abc import Callable
 
-from fastapi import Request, Response, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .config import get_settings
+from .path_matching import PathPrefixMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ PUBLIC_ENDPOINTS = [
 ]
 
 
-class EndpointAccessMiddleware(BaseHTTPMiddleware):
+class EndpointAccessMiddleware:
     """
     Middleware to restrict endpoint access in production/staging environments.
 
@@ -30,30 +30,36 @@ class EndpointAccessMiddleware(BaseHTTPMiddleware):
     In development, all endpoints are accessible.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp, public_endpoints: list[str] = None):
+        self.app = app
+        # Matched by prefix, compiled once at startup
+        self._public = PathPrefixMatcher(
+            PUBLIC_ENDPOINTS if public_endpoints is None else public_endpoints
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         settings = get_settings()
 
         # In development, allow all endpoints
         if settings.is_development:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # In staging/production, restrict to public endpoints
-        path = request.url.path
-        method = request.method
-
-        # Check if this is a public endpoint
-        is_public = any(
-            path.startswith(endpoint) or path == endpoint
-            for endpoint in PUBLIC_ENDPOINTS
-        )
+        path = scope["path"]
 
-        if not is_public:
+        if not self._public.matches(path):
+            client = scope.get("client")
             logger.warning(
-                f"Blocked access to restricted endpoint: {method} {path} "
-                f"from {request.client.host if request.client else 'unknown'} "
+                f"Blocked access to restricted endpoint: {scope['method']} {path} "
+                f"from {client[0] if client else 'unknown'} "
                 f"(environment: {settings.environment})"
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_403_FORBIDDEN,
                 content={
                     "error": "Forbidden",
@@ -61,6 +67,8 @@ class EndpointAccessMiddleware(BaseHTTPMiddleware):
                     "detail": "Access to this endpoint is restricted in production/staging environments",
                 },
             )
+            await response(scope, receive, send)
+            return
 
         # Endpoint is public, proceed
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -57,6 +57,21 @@ class ServiceError(AppException):
         super().__init__(message, status_code=500)
 
 
+class ServiceUnavailableError(AppException):
+    """
+    Temporarily unable to handle the request (503).
+    Raised when a bounded resource is saturated; clients should retry.
+    """
+
+    def __init__(
+        self,
+        message: str = "Service temporarily unavailable",
+        retry_after: int | None = None,
+    ):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=503)
+
+
 class LanguageResourceNotFoundError(AppException):
     """Raised when required language resources are not available for content generation."""
 
@@ -0,0 +1,206 @@
+"""
+Bounded thread pool for password-hash (bcrypt) work.
+
+bcrypt releases the GIL, so running it on a small dedicated pool keeps the
+event loop free for other requests and Kafka consumers while still using
+multiple cores. When the pool and its queue are full, new work is rejected
+immediately instead of piling up behind it.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TypeVar
+
+from src.core.exceptions import ServiceUnavailableError
+from src.schemas.api_keys import hash_api_key, verify_api_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Import OpenTelemetry only if enabled
+OTEL_ENABLED = bool(os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT"))
+
+
+class HashExecutor:
+    """
+    Dedicated, bounded executor for CPU-bound hashing.
+
+    Tracks in-flight jobs (running + queued) so callers can be rejected fast
+    once `max_workers + max_queue` jobs are outstanding.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must be >= 0")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs submitted and not yet finished (running + queued)."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs waiting for a free worker thread."""
+        return max(0, self._in_flight - self.max_workers)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use (internal helper)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="hash-worker"
+            )
+        return self._executor
+
+    def _on_done(self, _future: Future):
+        """Release an in-flight slot (runs on the worker thread)."""
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run fn(*args) on the pool and await its result.
+
+        Raises:
+            ServiceUnavailableError: If the pool and its queue are saturated
+        """
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                saturated = True
+            else:
+                self._in_flight += 1
+                saturated = False
+
+        if saturated:
+            _rejected_counter.add(1)
+            logger.warning(
+                f"Hash executor saturated ({self._in_flight} in flight), rejecting"
+            )
+            raise ServiceUnavailableError(
+                "Authentication is temporarily overloaded, please retry",
+                retry_after=1,
+            )
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> dict:
+        """Get executor statistics."""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+# Global instance - initialized lazily from settings
+_hash_executor: HashExecutor | None = None
+
+
+def get_hash_executor() -> HashExecutor:
+    """Get the shared hash executor."""
+    global _hash_executor
+    if _hash_executor is None:
+        from src.core.config import get_settings
+
+        settings = get_settings()
+        _hash_executor = HashExecutor(
+            max_workers=settings.hash_executor_workers,
+            max_queue=settings.hash_executor_max_queue,
+        )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """Shut down and reset the shared hash executor."""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown()
+        _hash_executor = None
+
+
+async def verify_api_key_async(api_key: str, key_hash: str) -> bool:
+    """Verify an API key against its hash on the hash executor."""
+    return await get_hash_executor().run(verify_api_key, api_key, key_hash)
+
+
+async def hash_api_key_async(api_key: str) -> str:
+    """Hash an API key for storage on the hash executor."""
+    return await get_hash_executor().run(hash_api_key, api_key)
+
+
+if OTEL_ENABLED:  # pragma: no cover
+    from opentelemetry import metrics
+    from opentelemetry.metrics import Observation
+
+    meter = metrics.get_meter("auth")
+
+    def _get_queue_depth(options):
+        """Callback for hash executor queue depth gauge."""
+        if _hash_executor is not None:
+            yield Observation(_hash_executor.queue_depth)
+
+    def _get_in_flight(options):
+        """Callback for hash executor in-flight gauge."""
+        if _hash_executor is not None:
+            yield Observation(_hash_executor.in_flight)
+
+    meter.create_observable_gauge(
+        name="auth.hash_executor.queue_depth",
+        callbacks=[_get_queue_depth],
+        description="Hash jobs waiting for a free worker thread",
+        unit="1",
+    )
+    meter.create_observable_gauge(
+        name="auth.hash_executor.in_flight",
+        callbacks=[_get_in_flight],
+        description="Hash jobs running or queued",
+        unit="1",
+    )
+    _rejected_counter = meter.create_counter(
+        name="auth.hash_executor.rejected",
+        description="Hash jobs rejected because the executor was saturated",
+        unit="1",
+    )
+
+else:  # pragma: no cover
+
+    class _DummyCounter:  # pragma: no cover
+        def add(self, *args, **kwargs):  # pragma: no cover
+            pass  # pragma: no cover
+
+    _rejected_counter = _DummyCounter()
@@ -0,0 +1,30 @@
+"""Shared per-IP request limiter (slowapi)."""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+# Importing registers the synced-memory:// storage scheme
+from src.core import rate_limit_sync  # noqa: F401
+from src.core.config import get_settings
+
+
+def create_limiter() -> Limiter:
+    """
+    Create the per-IP limiter used by every route.
+
+    With RATE_LIMIT_STORAGE=postgres its counters are shared across
+    machines through RateLimitSync; otherwise they are per machine.
+    """
+    settings = get_settings()
+    storage_uri = (
+        "synced-memory://" if settings.rate_limit_storage == "postgres" else "memory://"
+    )
+    return Limiter(
+        key_func=get_remote_address,
+        default_limits=[f"{settings.rate_limit_requests}/minute"],
+        storage_uri=storage_uri,
+    )
+
+
+# One limiter (and one set of counters) for the whole app
+limiter = create_limiter()
@@ -0,0 +1,44 @@
+"""Precompiled path rules for middleware."""
+
+from collections.abc import Iterable
+
+# Marks the end of a rule inside the trie
+_TERMINAL = ""
+
+
+class PathPrefixMatcher:
+    """
+    Character trie answering "does this path start with any rule?".
+
+    Built once at startup. A lookup walks the path only until it reaches a
+    rule or falls off the trie, so non-matching paths usually stop after a
+    few characters regardless of how many rules there are.
+    """
+
+    __slots__ = ("_root", "_exact")
+
+    def __init__(self, prefixes: Iterable[str], exact: Iterable[str] = ()):
+        self._root: dict = {}
+        self._exact = frozenset(exact)
+
+        for prefix in prefixes:
+            node = self._root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[_TERMINAL] = True
+
+    def matches(self, path: str) -> bool:
+        """Check if path equals an exact rule or starts with a prefix rule."""
+        if path in self._exact:
+            return True
+
+        node = self._root
+        if _TERMINAL in node:
+            return True
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
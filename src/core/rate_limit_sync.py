@@ -0,0 +1,300 @@
+"""
+Cluster-wide rate limit state shared between machines.
+
+Each machine keeps enforcing limits from its own in-memory counters and
+token buckets, so there is no database round trip per request. A background
+task periodically swaps this machine's consumption since the last sync with
+a shared store and applies what every other machine consumed in the
+meantime. Limits therefore hold across the cluster, approximately, with a
+lag of about one sync interval.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+from limits.storage import MemoryStorage
+
+logger = logging.getLogger(__name__)
+
+# Identifies this process in the shared store
+NODE_ID = os.getenv("FLY_MACHINE_ID") or f"{socket.gethostname()}-{os.getpid()}"
+
+# bucket key -> (amount consumed, window/expiry in seconds)
+Deltas = dict[str, tuple[int, float]]
+
+
+class RateLimitSyncSource(Protocol):
+    """Local limiter state that can be synchronized."""
+
+    def drain_deltas(self) -> Deltas:
+        """Return and reset consumption recorded since the last call."""
+        ...
+
+    def apply_remote(self, key: str, amount: int, expiry: float) -> None:
+        """Account for consumption that happened on another machine."""
+        ...
+
+
+class RateLimitStore(ABC):
+    """Shared store that machines exchange rate limit deltas through."""
+
+    @abstractmethod
+    async def exchange(self, node_id: str, deltas: Deltas) -> Deltas:
+        """
+        Publish this node's deltas and collect everyone else's.
+
+        Returns:
+            Consumption by other nodes since this node's previous exchange,
+            summed per bucket key.
+        """
+
+    async def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """
+    Local stand-in for the shared store.
+
+    Nodes are sync coordinators in the same process. Used for tests and
+    local development; a single node never receives anything.
+    """
+
+    def __init__(self):
+        # node_id -> deltas from other nodes not yet collected
+        self._inboxes: dict[str, dict[str, list]] = {}
+
+    async def exchange(self, node_id: str, deltas: Deltas) -> Deltas:
+        inbox = self._inboxes.get(node_id, {})
+        self._inboxes[node_id] = {}
+
+        for other_id, other_inbox in self._inboxes.items():
+            if other_id == node_id:
+                continue
+            for key, (amount, expiry) in deltas.items():
+                entry = other_inbox.get(key)
+                if entry is None:
+                    other_inbox[key] = [amount, expiry]
+                else:
+                    entry[0] += amount
+                    entry[1] = max(entry[1], expiry)
+
+        return {key: (amount, expiry) for key, (amount, expiry) in inbox.items()}
+
+
+class PostgresRateLimitStore(RateLimitStore):
+    """
+    Shared store backed by Postgres through the exchange_rate_limit_deltas RPC.
+
+    Deltas are appended to a small log table; each node keeps a cursor into
+    the log and reads only what other nodes wrote after it.
+    """
+
+    def __init__(self, client=None):
+        self._client = client
+        self._cursor: int | None = None
+
+    async def _get_client(self):
+        """Use the injected client or the shared pooled one (internal helper)."""
+        if self._client is not None:
+            return self._client
+        from src.clients.supabase import get_supabase_client
+
+        return await get_supabase_client()
+
+    async def exchange(self, node_id: str, deltas: Deltas) -> Deltas:
+        client = await self._get_client()
+        payload = [
+            {"bucket_key": key, "amount": amount, "expiry": expiry}
+            for key, (amount, expiry) in deltas.items()
+        ]
+        result = await client.rpc(
+            "exchange_rate_limit_deltas",
+            {"p_node_id": node_id, "p_after_id": self._cursor, "p_deltas": payload},
+        ).execute()
+
+        data = result.data or {}
+        self._cursor = data.get("cursor", self._cursor)
+        return {
+            row["bucket_key"]: (int(row["amount"]), float(row["expiry"]))
+            for row in data.get("deltas") or []
+        }
+
+
+class RateLimitSync:
+    """
+    Periodically exchanges local limiter consumption through a RateLimitStore.
+
+    Sources register under a namespace, which prefixes their bucket keys in
+    the store so different limiters never collide.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.node_id = NODE_ID
+
+        self._sources: dict[str, RateLimitSyncSource] = {}
+        self._store: RateLimitStore | None = None
+        self._task: asyncio.Task | None = None
+
+        # Deltas from a failed exchange, resent with the next one
+        self._unsent: dict[str, list] = {}
+
+        # Metrics
+        self._syncs = 0
+        self._failed_syncs = 0
+        self._sent = 0
+        self._received = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background sync is running."""
+        return self._task is not None and not self._task.done()
+
+    def register(self, namespace: str, source: RateLimitSyncSource) -> None:
+        """Register limiter state to synchronize under a namespace."""
+        self._sources[namespace] = source
+
+    async def start(
+        self,
+        store: RateLimitStore,
+        interval: float | None = None,
+        node_id: str | None = None,
+    ) -> None:
+        """Start syncing registered sources through the given store."""
+        if self.running:
+            logger.warning("Rate limit sync already running")
+            return
+
+        if interval is not None:
+            self.interval = interval
+        if node_id is not None:
+            self.node_id = node_id
+
+        self._store = store
+        self._task = asyncio.create_task(self._run(), name="rate-limit-sync")
+        logger.info(
+            f"Rate limit sync started (node={self.node_id}, "
+            f"interval={self.interval * 1000:.0f}ms, store={type(store).__name__})"
+        )
+
+    async def stop(self) -> None:
+        """Stop syncing, publishing anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        if self._store is not None:
+            await self.sync_once()
+            await self._store.close()
+            self._store = None
+        logger.info("Rate limit sync stopped")
+
+    async def _run(self) -> None:
+        """Sync on a fixed interval."""
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.sync_once()
+
+    def _collect(self) -> Deltas:
+        """Drain all sources into namespaced deltas (internal helper)."""
+        collected = self._unsent
+        self._unsent = {}
+        for namespace, source in self._sources.items():
+            for key, (amount, expiry) in source.drain_deltas().items():
+                store_key = f"{namespace}:{key}"
+                entry = collected.get(store_key)
+                if entry is None:
+                    collected[store_key] = [amount, expiry]
+                else:
+                    entry[0] += amount
+                    entry[1] = max(entry[1], expiry)
+        return {key: (amount, expiry) for key, (amount, expiry) in collected.items()}
+
+    async def sync_once(self) -> int:
+        """
+        Run a single exchange with the store.
+
+        Returns:
+            Number of remote bucket updates applied. On failure local deltas
+            are kept and sent with the next exchange.
+        """
+        if self._store is None:
+            return 0
+
+        deltas = self._collect()
+        try:
+            remote = await self._store.exchange(self.node_id, deltas)
+        except Exception as e:
+            logger.warning(f"Rate limit sync failed: {e}")
+            self._failed_syncs += 1
+            self._unsent = {key: list(value) for key, value in deltas.items()}
+            return 0
+
+        for store_key, (amount, expiry) in remote.items():
+            namespace, _, key = store_key.partition(":")
+            source = self._sources.get(namespace)
+            if source is not None and amount > 0:
+                source.apply_remote(key, amount, expiry)
+
+        self._syncs += 1
+        self._sent += len(deltas)
+        self._received += len(remote)
+        return len(remote)
+
+    def get_stats(self) -> dict:
+        """Get rate limit sync statistics."""
+        return {
+            "running": self.running,
+            "node_id": self.node_id,
+            "sources": sorted(self._sources),
+            "syncs": self._syncs,
+            "failed_syncs": self._failed_syncs,
+            "sent_buckets": self._sent,
+            "received_buckets": self._received,
+        }
+
+
+class SyncedMemoryStorage(MemoryStorage):
+    """
+    slowapi/limits memory storage that shares its counters via RateLimitSync.
+
+    Registered as the `synced-memory://` storage scheme. Only counter based
+    strategies (fixed and sliding window) are synchronized; the moving
+    window strategy stays local.
+    """
+
+    STORAGE_SCHEME = ["synced-memory"]
+
+    def __init__(self, uri: str | None = None, wrap_exceptions: bool = False, **_):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **_)
+        # key -> [amount, expiry] consumed locally since the last sync
+        self._pending: dict[str, list] = {}
+        rate_limit_sync.register("ip", self)
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        count = super().incr(key, expiry, amount)
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = [amount, expiry]
+        else:
+            entry[0] += amount
+        return count
+
+    def drain_deltas(self) -> Deltas:
+        pending = self._pending
+        self._pending = {}
+        return {key: (amount, expiry) for key, (amount, expiry) in pending.items()}
+
+    def apply_remote(self, key: str, amount: int, expiry: float) -> None:
+        # Bypass incr() so remote consumption is not published again
+        super().incr(key, expiry, amount)
+
+
+# Global singleton instance
+rate_limit_sync = RateLimitSync()
@@ -0,0 +1,195 @@
+"""
+Per-API-key rate limiting with in-process token buckets.
+
+Each key gets one bucket holding up to `rate_limit_rpm` tokens that refills
+continuously at `rate_limit_rpm / 60` tokens per second. A request takes one
+token. Buckets are created once per key and updated in place, so a check is
+O(1) and does not allocate.
+"""
+
+import math
+import time
+from uuid import UUID
+
+# Seconds over which a full bucket refills (limits are per minute)
+WINDOW_SECONDS = 60.0
+
+
+class TokenBucket:
+    """Token bucket for a single API key."""
+
+    __slots__ = ("limit", "rate", "tokens", "updated_at", "allowed")
+
+    def __init__(self, limit: int, now: float):
+        self.limit = limit
+        self.rate = limit / WINDOW_SECONDS
+        self.tokens = float(limit)
+        self.updated_at = now
+        # Outcome of the most recent acquire()
+        self.allowed = True
+
+    def set_limit(self, limit: int) -> None:
+        """Change the limit in place, keeping tokens already spent."""
+        if limit > self.limit:
+            self.tokens += limit - self.limit
+        self.limit = limit
+        self.rate = limit / WINDOW_SECONDS
+        self.tokens = min(self.tokens, float(limit))
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last update (internal helper)."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(float(self.limit), self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def acquire(self, now: float) -> bool:
+        """Take one token if available."""
+        self._refill(now)
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.allowed = True
+        else:
+            self.allowed = False
+        return self.allowed
+
+    def peek(self, now: float) -> bool:
+        """Check whether a token is available without taking it."""
+        self._refill(now)
+        return self.tokens >= 1.0
+
+    def consume_remote(self, amount: int) -> None:
+        """Deduct requests served for this key by other machines."""
+        # Allow a debt of at most one full bucket
+        self.tokens = max(self.tokens - amount, -float(self.limit))
+
+    @property
+    def remaining(self) -> int:
+        """Whole requests left right now."""
+        return max(0, int(self.tokens))
+
+    @property
+    def reset_after(self) -> int:
+        """Seconds until the bucket is full again."""
+        return math.ceil((self.limit - self.tokens) / self.rate)
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds until the next request would be allowed."""
+        return max(1, math.ceil((1.0 - self.tokens) / self.rate))
+
+    def headers(self) -> dict[str, str]:
+        """RateLimit-* response headers (plus Retry-After when rejected)."""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(self.reset_after),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+class ApiKeyRateLimiter:
+    """
+    Token-bucket rate limiter keyed by API key id.
+
+    The limit is passed on every check, so a changed `rate_limit_rpm` takes
+    effect on the next request that sees the refreshed key.
+
+    Once `enable_sync()` is called, allowed requests are also counted per key
+    so RateLimitSync can share them with other machines.
+    """
+
+    def __init__(self):
+        self._buckets: dict[UUID, TokenBucket] = {}
+
+        # key_id -> requests allowed since the last sync (None when not syncing)
+        self._pending: dict[UUID, int] | None = None
+
+        # Metrics
+        self._allowed = 0
+        self._rejected = 0
+
+    def acquire(self, key_id: UUID, limit_rpm: int) -> TokenBucket:
+        """
+        Take one token for a key.
+
+        Returns:
+            The key's bucket; check `allowed` for the outcome and use it to
+            build response headers.
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(key_id)
+        if bucket is None:
+            bucket = self._buckets[key_id] = TokenBucket(limit_rpm, now)
+        elif bucket.limit != limit_rpm:
+            bucket.set_limit(limit_rpm)
+
+        if bucket.acquire(now):
+            self._allowed += 1
+            if self._pending is not None:
+                self._pending[key_id] = self._pending.get(key_id, 0) + 1
+        else:
+            self._rejected += 1
+        return bucket
+
+    def peek(self, key_id: UUID, limit_rpm: int) -> bool:
+        """Check whether a key is within its limit without taking a token."""
+        bucket = self._buckets.get(key_id)
+        if bucket is None:
+            return limit_rpm >= 1
+        if bucket.limit != limit_rpm:
+            bucket.set_limit(limit_rpm)
+        return bucket.peek(time.monotonic())
+
+    def set_limit(self, key_id: UUID, limit_rpm: int) -> None:
+        """Apply a new limit to a key's bucket, if it has one."""
+        bucket = self._buckets.get(key_id)
+        if bucket is not None and bucket.limit != limit_rpm:
+            bucket.set_limit(limit_rpm)
+
+    def forget(self, key_id: UUID) -> None:
+        """Drop a key's bucket (e.g. after revocation)."""
+        self._buckets.pop(key_id, None)
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        self._buckets.clear()
+
+    def enable_sync(self) -> None:
+        """Start counting consumption for cluster-wide synchronization."""
+        if self._pending is None:
+            self._pending = {}
+
+    def drain_deltas(self) -> dict[str, tuple[int, float]]:
+        """Return and reset requests allowed per key since the last call."""
+        if not self._pending:
+            return {}
+        pending = self._pending
+        self._pending = {}
+        return {
+            str(key_id): (count, WINDOW_SECONDS) for key_id, count in pending.items()
+        }
+
+    def apply_remote(self, key: str, amount: int, expiry: float) -> None:
+        """Deduct requests another machine allowed for a key."""
+        try:
+            bucket = self._buckets.get(UUID(key))
+        except ValueError:
+            return
+        # Keys this machine has not seen yet start from a full bucket
+        if bucket is not None:
+            bucket.consume_remote(amount)
+
+    def get_stats(self) -> dict:
+        """Get rate limiter statistics."""
+        return {
+            "tracked_keys": len(self._buckets),
+            "allowed": self._allowed,
+            "rejected": self._rejected,
+        }
+
+
+# Global singleton instance
+api_key_rate_limiter = ApiKeyRateLimiter()
@@ -13,9 +13,8 @@ from contextlib import asynccontextmanager
 from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from slowapi.util import get_remote_address
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Configure logging BEFORE other imports
@@ -159,16 +158,10 @@ from .core.exceptions import (  # noqa: E402
     NotFoundError,
     ValidationError,
 )
+from .core.limiter import limiter  # noqa: E402
 
 settings = get_settings()
 
-# Configure rate limiter
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=[f"{settings.rate_limit_requests}/minute"],
-    storage_uri="memory://",
-)
-
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -193,20 +186,71 @@ async def lifespan(app: FastAPI):
         verb_repo = VerbRepository(client)
         api_key_repo = ApiKeyRepository(client)
 
-        # Load all caches in parallel
-        import asyncio
+        # Follow changes made by other replicas (started first so nothing
+        # committed during the initial load is missed)
+        if settings.database_url:
+            from src.cache.invalidation_listener import cache_invalidation_listener
+
+            await cache_invalidation_listener.start(
+                settings.database_url, verb_repo, api_key_repo
+            )
+
+        # Load all caches, from the on-disk snapshot when it is current. In
+        # background mode requests are served at once (cache misses fall back
+        # to the database) and /health/ready reports when the caches are warm.
+        from src.cache.snapshot import cache_warmup
+
+        if settings.cache_warmup_mode == "background":
+            cache_warmup.start(
+                client, verb_repo, api_key_repo, settings.cache_snapshot_path
+            )
+            logger.info("💾 Warming caches in the background")
+        else:
+            await cache_warmup.load(
+                client, verb_repo, api_key_repo, settings.cache_snapshot_path
+            )
+
+        # Start batched API key usage flusher
+        from src.services.api_key_usage_service import api_key_usage
 
-        await asyncio.gather(
-            verb_cache.load(verb_repo),
-            conjugation_cache.load(verb_repo),
-            api_key_cache.load(api_key_repo),
+        await api_key_usage.start(
+            api_key_repo,
+            flush_interval=settings.api_key_usage_flush_interval_seconds,
+            flush_threshold=settings.api_key_usage_flush_threshold,
         )
 
+        # Share rate limit counters with other machines
+        if settings.rate_limit_storage == "postgres":
+            from src.core.rate_limit_sync import PostgresRateLimitStore, rate_limit_sync
+            from src.core.rate_limiting import api_key_rate_limiter
+
+            api_key_rate_limiter.enable_sync()
+            rate_limit_sync.register("api_key", api_key_rate_limiter)
+            await rate_limit_sync.start(
+                PostgresRateLimitStore(client),
+                interval=settings.rate_limit_sync_interval_ms / 1000,
+            )
+
+        # Serve /problems/random from memory
+        if settings.problem_pool_size > 0:
+            from src.api.models.problems import ProblemResponse
+            from src.cache.problem_pool import problem_pool
+            from src.repositories.problem_repository import ProblemRepository
+
+            await problem_pool.start(
+                ProblemRepository(client),
+                size=settings.problem_pool_size,
+                refill_batch=settings.problem_pool_refill_batch,
+                max_age=settings.problem_pool_max_age_seconds,
+                render=ProblemResponse.render,
+            )
+
         # Log cache statistics
-        logger.info(f"📊 Verb cache: {verb_cache.get_stats()}")
-        logger.info(f"📊 Conjugation cache: {conjugation_cache.get_stats()}")
-        logger.info(f"📊 API key cache: {api_key_cache.get_stats()}")
-        logger.info("✅ All caches loaded successfully")
+        if not cache_warmup.warming:
+            logger.info(f"📊 Verb cache: {verb_cache.get_stats()}")
+            logger.info(f"📊 Conjugation cache: {conjugation_cache.get_stats()}")
+            logger.info(f"📊 API key cache: {api_key_cache.get_stats()}")
+            logger.info("✅ All caches loaded successfully")
 
         # Expire stale pending generation requests
         from src.core.factories import create_generation_request_repository
@@ -263,6 +307,45 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"⚠️  Error stopping background workers: {e}", exc_info=True)
 
+    # Stop following cache invalidations
+    from src.cache.invalidation_listener import cache_invalidation_listener
+    from src.cache.snapshot import cache_warmup
+
+    await cache_warmup.stop()
+
+    await cache_invalidation_listener.stop()
+
+    # Stop refilling the problem pool
+    from src.cache.problem_pool import problem_pool
+
+    await problem_pool.stop()
+
+    # Write out pending API key usage counts
+    from src.services.api_key_usage_service import api_key_usage
+
+    try:
+        await api_key_usage.stop()
+    except Exception as e:
+        logger.error(f"⚠️  Error flushing API key usage: {e}", exc_info=True)
+
+    # Publish final rate limit counters
+    from src.core.rate_limit_sync import rate_limit_sync
+
+    try:
+        await rate_limit_sync.stop()
+    except Exception as e:
+        logger.error(f"⚠️  Error stopping rate limit sync: {e}", exc_info=True)
+
+    # Release bcrypt worker threads
+    from src.core.hashing import shutdown_hash_executor
+
+    shutdown_hash_executor()
+
+    # Close pooled Supabase connections
+    from src.clients.supabase import close_supabase_client
+
+    await close_supabase_client()
+
 
 app = FastAPI(
     title="Language Quiz Service API",
@@ -371,6 +454,12 @@ app.add_middleware(
     if settings.is_production
     else ["*"],
     allow_headers=["*"],
+    expose_headers=[
+        "RateLimit-Limit",
+        "RateLimit-Remaining",
+        "RateLimit-Reset",
+        "Retry-After",
+    ],
 )
 
 # Instrument FastAPI with OpenTelemetry (if enabled)
@@ -456,6 +545,7 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             "status_code": exc.status_code,
             "path": str(request.url.path),
         },
+        headers=getattr(exc, "headers", None),
     )
 
 
@@ -0,0 +1,332 @@
+"""Cache Performance Dashboard - Hit rates, footprint and load times of the in-memory caches."""
+
+from grafana_foundation_sdk.builders import (
+    dashboard,
+    prometheus,
+    stat,
+    timeseries,
+)
+from grafana_foundation_sdk.models import common, units
+from grafana_foundation_sdk.models.dashboard import (
+    DataSourceRef,
+    GridPos,
+    Threshold,
+    ThresholdsMode,
+)
+
+from .base import create_base_dashboard
+
+
+def create_cache_hit_rate_stat(cache: str, title: str, x: int) -> stat.Panel:
+    """Hit rate of one cache over the time window."""
+    return (
+        stat.Panel()
+        .title(title)
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Percent)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                f'sum(increase(cache_lookups_total{{environment="$environment", cache="{cache}", result="hit"}}[$__range])) / sum(increase(cache_lookups_total{{environment="$environment", cache="{cache}"}}[$__range])) * 100'
+            )
+            .legend_format("Hit %")
+            .ref_id("A")
+        )
+        .color_mode(common.BigValueColorMode.VALUE)
+        .graph_mode(common.BigValueGraphMode.AREA)
+        .thresholds(
+            dashboard.ThresholdsConfig()
+            .mode(ThresholdsMode.ABSOLUTE)
+            .steps(
+                [
+                    Threshold(value=0.0, color="red"),
+                    Threshold(value=90.0, color="yellow"),
+                    Threshold(value=99.0, color="green"),
+                ]
+            )
+        )
+        .grid_pos(GridPos(x=x, y=0, w=6, h=6))  # x, y, w, h
+    )
+
+
+def create_total_memory_stat() -> stat.Panel:
+    """Approximate memory held by all caches."""
+    return (
+        stat.Panel()
+        .title("Cache Memory")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.BytesIEC)
+        .with_target(
+            prometheus.Dataquery()
+            .expr('sum(cache_memory_bytes{environment="$environment"})')
+            .legend_format("Memory")
+            .ref_id("A")
+        )
+        .color_mode(common.BigValueColorMode.VALUE)
+        .graph_mode(common.BigValueGraphMode.AREA)
+        .grid_pos(GridPos(x=18, y=0, w=6, h=6))  # x, y, w, h
+    )
+
+
+def create_hit_rate_panel() -> timeseries.Panel:
+    """Hit rate of each cache over time."""
+    return (
+        timeseries.Panel()
+        .title("Hit Rate by Cache")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Percent)
+        .min(0)
+        .max(100)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'sum by (cache) (rate(cache_lookups_total{environment="$environment", result="hit"}[5m])) / sum by (cache) (rate(cache_lookups_total{environment="$environment"}[5m])) * 100'
+            )
+            .legend_format("{{cache}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=0, y=6, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_lookup_rate_panel() -> timeseries.Panel:
+    """Lookups per second by cache and access pattern."""
+    return (
+        timeseries.Panel()
+        .title("Lookups by Access Pattern")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.OpsPerSecond)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'sum by (cache, pattern) (rate(cache_lookups_total{environment="$environment"}[5m]))'
+            )
+            .legend_format("{{cache}} {{pattern}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=12, y=6, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_miss_rate_panel() -> timeseries.Panel:
+    """Misses per second by cache and access pattern (each may cost a query)."""
+    return (
+        timeseries.Panel()
+        .title("Misses by Access Pattern")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.OpsPerSecond)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'sum by (cache, pattern) (rate(cache_lookups_total{environment="$environment", result="miss"}[5m]))'
+            )
+            .legend_format("{{cache}} {{pattern}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=0, y=14, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_entries_panel() -> timeseries.Panel:
+    """Entries held by each cache."""
+    return (
+        timeseries.Panel()
+        .title("Entries by Cache")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Short)
+        .with_target(
+            prometheus.Dataquery()
+            .expr('sum by (cache) (cache_entries{environment="$environment"})')
+            .legend_format("{{cache}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=12, y=14, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_memory_panel() -> timeseries.Panel:
+    """Approximate memory held by each cache."""
+    return (
+        timeseries.Panel()
+        .title("Memory by Cache")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.BytesIEC)
+        .with_target(
+            prometheus.Dataquery()
+            .expr('sum by (cache) (cache_memory_bytes{environment="$environment"})')
+            .legend_format("{{cache}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=0, y=22, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_load_duration_panel() -> timeseries.Panel:
+    """Cache load duration (p50, p95) by cache."""
+    return (
+        timeseries.Panel()
+        .title("Load Duration")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Seconds)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'histogram_quantile(0.50, sum by (cache, le) (rate(cache_load_duration_seconds_bucket{environment="$environment"}[$__rate_interval])))'
+            )
+            .legend_format("{{cache}} p50")
+            .ref_id("A")
+        )
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'histogram_quantile(0.95, sum by (cache, le) (rate(cache_load_duration_seconds_bucket{environment="$environment"}[$__rate_interval])))'
+            )
+            .legend_format("{{cache}} p95")
+            .ref_id("B")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=12, y=22, w=12, h=8))  # x, y, w, h
+    )
+
+
+def create_load_count_panel() -> timeseries.Panel:
+    """Cache loads and reloads by outcome."""
+    return (
+        timeseries.Panel()
+        .title("Loads by Outcome")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Short)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'sum by (cache, outcome) (increase(cache_load_duration_seconds_count{environment="$environment"}[5m]))'
+            )
+            .legend_format("{{cache}} {{outcome}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(50)
+        .grid_pos(GridPos(x=0, y=30, w=24, h=8))  # x, y, w, h
+    )
+
+
+def create_problem_pool_depth_panel() -> timeseries.Panel:
+    """Problems held in each replica's serving pool."""
+    return (
+        timeseries.Panel()
+        .title("Problem Pool Depth")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Short)
+        .with_target(
+            prometheus.Dataquery()
+            .expr('problem_pool_depth{environment="$environment"}')
+            .legend_format("{{instance}}")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=0, y=38, w=8, h=8))  # x, y, w, h
+    )
+
+
+def create_problem_pool_refill_panel() -> timeseries.Panel:
+    """Problem pool refill duration (p50, p95)."""
+    return (
+        timeseries.Panel()
+        .title("Problem Pool Refill Duration")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.Seconds)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'histogram_quantile(0.50, sum by (le) (rate(problem_pool_refill_duration_seconds_bucket{environment="$environment"}[$__rate_interval])))'
+            )
+            .legend_format("p50")
+            .ref_id("A")
+        )
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'histogram_quantile(0.95, sum by (le) (rate(problem_pool_refill_duration_seconds_bucket{environment="$environment"}[$__rate_interval])))'
+            )
+            .legend_format("p95")
+            .ref_id("B")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=8, y=38, w=8, h=8))  # x, y, w, h
+    )
+
+
+def create_problem_pool_fallback_panel() -> timeseries.Panel:
+    """Problem requests served from the database because the pool was empty."""
+    return (
+        timeseries.Panel()
+        .title("Problem Pool Fallbacks")
+        .datasource(DataSourceRef(uid="$datasource"))
+        .unit(units.OpsPerSecond)
+        .with_target(
+            prometheus.Dataquery()
+            .expr(
+                'sum(rate(problem_pool_fallbacks_total{environment="$environment"}[5m]))'
+            )
+            .legend_format("Fallbacks")
+            .ref_id("A")
+        )
+        .line_width(2)
+        .fill_opacity(10)
+        .grid_pos(GridPos(x=16, y=38, w=8, h=8))  # x, y, w, h
+    )
+
+
+def generate() -> dashboard.Dashboard:
+    """
+    Generate the Cache Performance dashboard.
+
+    This dashboard tracks the in-memory verb, conjugation and API key caches:
+    - Hit rates per cache and lookups/misses per access pattern
+    - Entry counts and approximate memory footprint
+    - Load and reload durations and failures
+    - Depth, refill duration and fallbacks of the problem serving pool
+
+    Returns:
+        Complete dashboard builder ready to build()
+    """
+    return (
+        create_base_dashboard(
+            title="Cache Performance",
+            description="Efficiency, footprint and load times of the in-memory caches",
+            uid="lqs-cache-performance",
+            tags=["language-quiz-service", "cache", "performance"],
+            use_environment_filter=True,
+        )
+        # All panels use absolute grid positioning (no rows)
+        # Grid: 24 units wide, panels positioned with (x, y, width, height)
+        .with_panel(create_cache_hit_rate_stat("verbs", "Verb Hit Rate", 0))
+        .with_panel(
+            create_cache_hit_rate_stat("conjugations", "Conjugation Hit Rate", 6)
+        )
+        .with_panel(create_cache_hit_rate_stat("api_keys", "API Key Hit Rate", 12))
+        .with_panel(create_total_memory_stat())  # (18, 0, 6, 6)
+        .with_panel(create_hit_rate_panel())  # (0, 6, 12, 8)
+        .with_panel(create_lookup_rate_panel())  # (12, 6, 12, 8)
+        .with_panel(create_miss_rate_panel())  # (0, 14, 12, 8)
+        .with_panel(create_entries_panel())  # (12, 14, 12, 8)
+        .with_panel(create_memory_panel())  # (0, 22, 12, 8)
+        .with_panel(create_load_duration_panel())  # (12, 22, 12, 8)
+        .with_panel(create_load_count_panel())  # (0, 30, 24, 8)
+        .with_panel(create_problem_pool_depth_panel())  # (0, 38, 8, 8)
+        .with_panel(create_problem_pool_refill_panel())  # (8, 38, 8, 8)
+        .with_panel(create_problem_pool_fallback_panel())  # (16, 38, 8, 8)
+    )
@@ -11,7 +11,7 @@ import requests
 from grafana_foundation_sdk.cog.encoder import JSONEncoder
 
 # Import dashboard generators
-from .dashboards import llm_performance, service_overview
+from .dashboards import cache_performance, llm_performance, service_overview
 
 
 class GrafanaDeployer:
@@ -249,6 +249,7 @@ def main():
     dashboards = {
         "service_overview": service_overview.generate(),
         "llm_performance": llm_performance.generate(),
+        "cache_performance": cache_performance.generate(),
     }
 
     # Validate mode
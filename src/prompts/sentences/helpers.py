@@ -2,10 +2,21 @@
 
 import random
 
+from src.cache.records import FORM_FIELDS, ConjugationRecord
 from src.prompts.sentences.templates import COMPOUND_TENSES
 from src.schemas.sentences import Pronoun
 from src.schemas.verbs import Tense, Verb
 
+# Position of each pronoun's form in FORM_FIELDS
+PRONOUN_FORM_INDEX = {
+    Pronoun.FIRST_PERSON: 0,
+    Pronoun.SECOND_PERSON: 1,
+    Pronoun.THIRD_PERSON: 2,
+    Pronoun.FIRST_PERSON_PLURAL: 3,
+    Pronoun.SECOND_PERSON_PLURAL: 4,
+    Pronoun.THIRD_PERSON_PLURAL: 5,
+}
+
 
 def get_pronoun_display(pronoun: str) -> str:
     """Convert pronoun enum to French display format.
@@ -40,7 +51,7 @@ def get_conjugation_pair(
         pronoun: The pronoun to use
         tense: The tense to use
         verb: The verb being conjugated
-        conjugations: List of conjugation objects for the verb
+        conjugations: Conjugations (models or cache records) for the verb
         correct: If True, return correct form. If False, return a different form.
 
     Returns:
@@ -61,38 +72,21 @@ def get_conjugation_pair(
             f"No conjugation found for verb '{verb.infinitive}' in tense '{tense.value}'"
         )
 
-    # Get all forms for this tense
-    all_forms = {
-        "first_person_singular": tense_conjugation.first_person_singular,
-        "second_person_singular": tense_conjugation.second_person_singular,
-        "third_person_singular": tense_conjugation.third_person_singular,
-        "first_person_plural": tense_conjugation.first_person_plural,
-        "second_person_plural": tense_conjugation.second_person_plural,
-        "third_person_plural": tense_conjugation.third_person_plural,
-    }
-
-    # Map pronoun enum to field name
-    pronoun_to_field = {
-        Pronoun.FIRST_PERSON: "first_person_singular",
-        Pronoun.SECOND_PERSON: "second_person_singular",
-        Pronoun.THIRD_PERSON: "third_person_singular",
-        Pronoun.FIRST_PERSON_PLURAL: "first_person_plural",
-        Pronoun.SECOND_PERSON_PLURAL: "second_person_plural",
-        Pronoun.THIRD_PERSON_PLURAL: "third_person_plural",
-    }
+    # Compact cache records expose their forms directly; models are read by field
+    if isinstance(tense_conjugation, ConjugationRecord):
+        forms = tense_conjugation.forms
+    else:
+        forms = tuple(getattr(tense_conjugation, field) for field in FORM_FIELDS)
 
     # Get the correct form for this pronoun
-    correct_field = pronoun_to_field[pronoun]
-    correct_form = all_forms[correct_field]
+    correct_form = forms[PRONOUN_FORM_INDEX[pronoun]]
 
     if correct:
         conjugation_form = correct_form
     else:
         # Get all forms that are DIFFERENT from the correct one
         wrong_forms = [
-            form
-            for field, form in all_forms.items()
-            if form != correct_form and form is not None
+            form for form in forms if form != correct_form and form is not None
         ]
 
         if not wrong_forms:
@@ -1,9 +1,11 @@
 """API Key repository for data access."""
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
 from src.core.exceptions import RepositoryError
+from src.repositories.pagination import count_rows, fetch_keyset_page
 from src.schemas.api_keys import ApiKey, ApiKeyCreate, ApiKeyStats, ApiKeyUpdate
 from supabase import AsyncClient
 
@@ -97,6 +99,22 @@ class ApiKeyRepository:
         result = await query.execute()
         return [ApiKey.model_validate(key) for key in result.data]
 
+    async def get_api_keys_page(
+        self,
+        after: UUID | None = None,
+        until: UUID | None = None,
+        limit: int = 1000,
+    ) -> list[ApiKey]:
+        """Get one keyset page of API keys (active and inactive), ordered by id."""
+        rows = await fetch_keyset_page(
+            self.client, "api_keys", after=after, until=until, limit=limit
+        )
+        return [ApiKey.model_validate(key) for key in rows]
+
+    async def count_api_keys(self) -> int:
+        """Get the total number of API keys, active and inactive."""
+        return await count_rows(self.client, "api_keys")
+
     async def update_api_key(
         self, api_key_id: UUID, api_key_data: ApiKeyUpdate
     ) -> ApiKey | None:
@@ -140,6 +158,35 @@ class ApiKeyRepository:
             logger.error(f"Failed to increment usage for API key {api_key_id}: {e}")
             return False
 
+    async def increment_usage_bulk(
+        self, usage: dict[UUID, tuple[int, datetime]]
+    ) -> bool:
+        """
+        Add accumulated usage counts for many keys in a single RPC.
+
+        Args:
+            usage: key_id -> (number of uses, most recent use time)
+        """
+        if not usage:
+            return True
+
+        payload = [
+            {
+                "key_id": str(key_id),
+                "count": count,
+                "last_used_at": last_used_at.isoformat(),
+            }
+            for key_id, (count, last_used_at) in usage.items()
+        ]
+        try:
+            await self.client.rpc(
+                "increment_api_key_usage_bulk", {"usage": payload}
+            ).execute()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to increment usage for {len(usage)} API keys: {e}")
+            return False
+
     async def get_api_key_stats(self) -> ApiKeyStats:
         """Get API key usage statistics."""
         # Get counts
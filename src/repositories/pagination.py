@@ -0,0 +1,50 @@
+"""Keyset pagination over uuid primary keys."""
+
+from uuid import UUID
+
+from supabase import AsyncClient
+
+# Number of distinct uuid values
+UUID_SPACE = 2**128
+
+
+def split_uuid_range(parts: int) -> list[tuple[UUID | None, UUID | None]]:
+    """
+    Split the uuid key space into contiguous ranges.
+
+    Returns `parts` (after, until) pairs covering after < id <= until, where
+    None means unbounded. Random (v4) ids spread evenly over the ranges, so
+    each range can be paged independently and in parallel.
+    """
+    if parts < 1:
+        raise ValueError("parts must be at least 1")
+
+    bounds = [UUID(int=i * UUID_SPACE // parts) for i in range(1, parts)]
+    lowers: list[UUID | None] = [None, *bounds]
+    uppers: list[UUID | None] = [*bounds, None]
+    return list(zip(lowers, uppers, strict=True))
+
+
+async def fetch_keyset_page(
+    client: AsyncClient,
+    table: str,
+    *,
+    after: UUID | None = None,
+    until: UUID | None = None,
+    limit: int = 1000,
+    columns: str = "*",
+) -> list[dict]:
+    """Fetch rows with after < id <= until, ordered by id."""
+    query = client.table(table).select(columns)
+    if after is not None:
+        query = query.gt("id", str(after))
+    if until is not None:
+        query = query.lte("id", str(until))
+    result = await query.order("id").limit(limit).execute()
+    return result.data
+
+
+async def count_rows(client: AsyncClient, table: str) -> int:
+    """Exact row count of a table."""
+    result = await client.table(table).select("id", count="exact", head=True).execute()
+    return result.count or 0
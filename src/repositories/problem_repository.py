@@ -12,6 +12,7 @@ from src.schemas.problems import (
     Problem,
     ProblemCreate,
     ProblemFilters,
+    ProblemProjection,
     ProblemSummary,
     ProblemType,
     ProblemUpdate,
@@ -20,6 +21,22 @@ from supabase import AsyncClient
 
 logger = logging.getLogger(__name__)
 
+_SUMMARY_COLUMNS = (
+    "id, created_at, updated_at, problem_type, title, instructions, "
+    "correct_answer_index, target_language_code, topic_tags, "
+    "source_statement_ids, metadata"
+)
+
+# Select clause for each projection
+PROJECTION_COLUMNS: dict[ProblemProjection, str] = {
+    ProblemProjection.SERVING: (
+        f"{_SUMMARY_COLUMNS}, statements, last_served_at, generation_request_id"
+    ),
+    ProblemProjection.SUMMARY: _SUMMARY_COLUMNS,
+    ProblemProjection.FULL: "*",
+    ProblemProjection.TRACE: "id, generation_trace",
+}
+
 
 class ProblemRepository:
     """Repository for problem data access operations."""
@@ -55,11 +72,15 @@ class ProblemRepository:
             "Failed to create problem: No data returned from Supabase"
         )
 
-    async def get_problem(self, problem_id: UUID) -> Problem | None:
+    async def get_problem(
+        self,
+        problem_id: UUID,
+        projection: ProblemProjection = ProblemProjection.SERVING,
+    ) -> Problem | None:
         """Get a problem by ID."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .eq("id", str(problem_id))
             .execute()
         )
@@ -69,22 +90,19 @@ class ProblemRepository:
         return None
 
     async def get_problems(
-        self, filters: ProblemFilters, include_statements: bool = True
+        self,
+        filters: ProblemFilters,
+        include_statements: bool = True,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> tuple[list[Problem], int]:
         """
         Get problems with filtering and pagination.
         Returns tuple of (problems, total_count).
         """
         # Build the select clause
-        select_fields = (
-            "*"
-            if include_statements
-            else """
-            id, created_at, updated_at, problem_type, title, instructions,
-            correct_answer_index, target_language_code, topic_tags,
-            source_statement_ids, metadata
-        """
-        )
+        select_fields = PROJECTION_COLUMNS[
+            projection if include_statements else ProblemProjection.SUMMARY
+        ]
 
         # Start with base query
         query = self.client.table("problems").select(select_fields, count="exact")
@@ -146,6 +164,19 @@ class ProblemRepository:
 
         return summaries, result.count or 0
 
+    async def get_problem_trace(self, problem_id: UUID) -> dict[str, Any] | None:
+        """Get only a problem's generation trace (None if missing or not stored)."""
+        result = (
+            await self.client.table("problems")
+            .select(PROJECTION_COLUMNS[ProblemProjection.TRACE])
+            .eq("id", str(problem_id))
+            .execute()
+        )
+
+        if result.data:
+            return result.data[0]["generation_trace"]
+        return None
+
     async def update_problem(
         self, problem_id: UUID, problem_data: ProblemUpdate
     ) -> Problem | None:
@@ -210,12 +241,15 @@ class ProblemRepository:
         return problem_data
 
     async def get_problems_by_type(
-        self, problem_type: ProblemType, limit: int = 50
+        self,
+        problem_type: ProblemType,
+        limit: int = 50,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> list[Problem]:
         """Get problems by type."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .eq("problem_type", problem_type.value)
             .limit(limit)
             .execute()
@@ -227,13 +261,16 @@ class ProblemRepository:
         )
 
     async def get_problems_by_topic_tags(
-        self, topic_tags: list[str], limit: int = 50
+        self,
+        topic_tags: list[str],
+        limit: int = 50,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> list[Problem]:
         """Get problems that contain any of the specified topic tags."""
         # Use array overlap operator
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .or_(f"topic_tags.ov.{{{','.join(topic_tags)}}}")
             .limit(limit)
             .execute()
@@ -245,12 +282,15 @@ class ProblemRepository:
         )
 
     async def get_problems_using_statement(
-        self, statement_id: UUID, limit: int = 50
+        self,
+        statement_id: UUID,
+        limit: int = 50,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> list[Problem]:
         """Get problems that reference a specific source statement."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .contains("source_statement_ids", [str(statement_id)])
             .limit(limit)
             .execute()
@@ -262,12 +302,15 @@ class ProblemRepository:
         )
 
     async def search_problems_by_metadata(
-        self, metadata_query: dict[str, Any], limit: int = 50
+        self,
+        metadata_query: dict[str, Any],
+        limit: int = 50,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> list[Problem]:
         """Search problems by metadata containment."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .contains("metadata", metadata_query)
             .order("updated_at", desc=True)
             .limit(limit)
@@ -279,7 +322,9 @@ class ProblemRepository:
             else []
         )
 
-    async def get_least_recently_served_problem(self) -> Problem | None:
+    async def get_least_recently_served_problem(
+        self, projection: ProblemProjection = ProblemProjection.SERVING
+    ) -> Problem | None:
         """
         Get the least recently served problem from the database.
 
@@ -292,7 +337,7 @@ class ProblemRepository:
         try:
             response = (
                 await self.client.table("problems")
-                .select("*")
+                .select(PROJECTION_COLUMNS[projection])
                 .order("last_served_at", desc=False, nullsfirst=True)
                 .order("created_at", desc=False)  # Tiebreaker: oldest created first
                 .limit(1)
@@ -309,6 +354,38 @@ class ProblemRepository:
             logger.error(f"Error fetching least recently served problem: {e}")
             raise
 
+    async def claim_next_problems(
+        self, count: int = 1, projection: ProblemProjection = ProblemProjection.SERVING
+    ) -> list[Problem]:
+        """
+        Claim the least recently served problems and stamp their last_served_at.
+
+        Selects and updates in a single statement (claim_next_problems RPC).
+        Rows locked by a concurrent claim are skipped, so concurrent callers
+        never receive the same problem.
+
+        Args:
+            count: Maximum number of problems to claim
+            projection: Columns returned for the claimed problems
+
+        Returns:
+            Claimed problems in LRU order (fewer than count if the table is smaller)
+        """
+        try:
+            result = (
+                await self.client.rpc("claim_next_problems", {"p_count": count})
+                .select(PROJECTION_COLUMNS[projection])
+                .execute()
+            )
+        except PostgrestAPIError as e:
+            logger.error(f"Database error claiming problems: {e.message}")
+            raise RepositoryError(f"Failed to claim problems: {e.message}") from e
+
+        return [
+            Problem.model_validate(self._prepare_problem_data(p))
+            for p in result.data or []
+        ]
+
     async def update_problem_last_served(self, problem_id: UUID) -> bool:
         """
         Update the last_served_at timestamp for a problem.
@@ -337,10 +414,11 @@ class ProblemRepository:
     async def get_random_problem(
         self,
         filters: ProblemFilters,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> Problem | None:
         """Get a random problem with optional filters."""
         # Note: Supabase doesn't have native random, this is a simple implementation
-        query = self.client.table("problems").select("*")
+        query = self.client.table("problems").select(PROJECTION_COLUMNS[projection])
 
         query = self._apply_filters(query, filters)
 
@@ -425,12 +503,15 @@ class ProblemRepository:
         }
 
     async def get_problems_with_topic_tag(
-        self, topic_tag: str, limit: int = 50
+        self,
+        topic_tag: str,
+        limit: int = 50,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> list[Problem]:
         """Get problems that contain a specific topic tag."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .contains("topic_tags", [topic_tag])
             .limit(limit)
             .execute()
@@ -441,11 +522,13 @@ class ProblemRepository:
             else []
         )
 
-    async def get_recent_problems(self, limit: int = 10) -> list[Problem]:
+    async def get_recent_problems(
+        self, limit: int = 10, projection: ProblemProjection = ProblemProjection.SERVING
+    ) -> list[Problem]:
         """Get the most recently created problems."""
         result = (
             await self.client.table("problems")
-            .select("*")
+            .select(PROJECTION_COLUMNS[projection])
             .order("created_at", desc=True)
             .limit(limit)
             .execute()
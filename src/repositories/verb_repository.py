@@ -7,6 +7,7 @@ from opentelemetry import trace
 from postgrest import APIError as PostgrestAPIError
 
 from src.core.exceptions import RepositoryError
+from src.repositories.pagination import count_rows, fetch_keyset_page
 from src.schemas.verbs import (
     Conjugation,
     ConjugationCreate,
@@ -64,6 +65,22 @@ class VerbRepository:
         result = await query.execute()
         return [Verb.model_validate(verb) for verb in result.data]
 
+    async def get_verbs_page(
+        self,
+        after: UUID | None = None,
+        until: UUID | None = None,
+        limit: int = 1000,
+    ) -> list[Verb]:
+        """Get one keyset page of verbs with after < id <= until, ordered by id."""
+        rows = await fetch_keyset_page(
+            self.client, "verbs", after=after, until=until, limit=limit
+        )
+        return [Verb.model_validate(verb) for verb in rows]
+
+    async def count_verbs(self) -> int:
+        """Get the total number of verbs."""
+        return await count_rows(self.client, "verbs")
+
     async def get_random_verb(self, target_language_code: str = "eng") -> Verb | None:
         """
         Get a random verb using the database function.
@@ -369,6 +386,22 @@ class VerbRepository:
         )
         return [Conjugation.model_validate(conj) for conj in result.data]
 
+    async def get_conjugations_page(
+        self,
+        after: UUID | None = None,
+        until: UUID | None = None,
+        limit: int = 1000,
+    ) -> list[Conjugation]:
+        """Get one keyset page of conjugations with after < id <= until, ordered by id."""
+        rows = await fetch_keyset_page(
+            self.client, "conjugations", after=after, until=until, limit=limit
+        )
+        return [Conjugation.model_validate(conj) for conj in rows]
+
+    async def count_conjugations(self) -> int:
+        """Get the total number of conjugations."""
+        return await count_rows(self.client, "conjugations")
+
     async def update_conjugation_by_verb_and_tense(
         self,
         infinitive: str,
@@ -2,6 +2,7 @@
 API Key schemas for authentication and management.
 """
 
+import bisect
 import ipaddress
 import secrets
 import string
@@ -234,10 +235,72 @@ def verify_api_key(api_key: str, key_hash: str) -> bool:
         return False
 
 
+class IpAllowlist:
+    """
+    Precompiled IP allowlist for O(log n) membership checks.
+
+    Entries are parsed once into merged, sorted integer ranges per IP version
+    (searched with bisect) plus a set of exact strings, so checking a client
+    IP no longer re-parses every CIDR on every request.
+    """
+
+    __slots__ = ("unrestricted", "_exact", "_starts", "_ends")
+
+    def __init__(self, allowed_ips: list[str] | None):
+        self.unrestricted = not allowed_ips
+        self._exact: frozenset[str] = frozenset(allowed_ips or ())
+
+        # IP version -> sorted range starts / matching range ends
+        self._starts: dict[int, list[int]] = {4: [], 6: []}
+        self._ends: dict[int, list[int]] = {4: [], 6: []}
+
+        ranges: dict[int, list[tuple[int, int]]] = {4: [], 6: []}
+        for allowed_ip in allowed_ips or ():
+            try:
+                network = ipaddress.ip_network(allowed_ip, strict=False)
+            except (ValueError, TypeError):
+                # Skip invalid IP/CIDR entries - still usable as exact matches
+                continue
+            ranges[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+
+        for version, version_ranges in ranges.items():
+            for start, end in sorted(version_ranges):
+                ends = self._ends[version]
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    self._starts[version].append(start)
+                    ends.append(end)
+
+    def allows(self, client_ip: str) -> bool:
+        """Check if a client IP is allowed by this allowlist."""
+        if self.unrestricted:
+            return True
+
+        # Exact string matches (for non-IP addresses like 'testclient')
+        if client_ip in self._exact:
+            return True
+
+        try:
+            client_addr = ipaddress.ip_address(client_ip)
+        except (ValueError, TypeError):
+            return False  # Invalid IP format
+
+        value = int(client_addr)
+        starts = self._starts[client_addr.version]
+        index = bisect.bisect_right(starts, value) - 1
+        return index >= 0 and value <= self._ends[client_addr.version][index]
+
+
 def check_ip_allowed(client_ip: str, allowed_ips: list[str] | None) -> bool:
     """
     Check if a client IP is allowed based on the allowlist.
 
+    Compiles the allowlist on every call; on hot paths use a cached
+    IpAllowlist (see ApiKeyCache.get_ip_allowlist) instead.
+
     Args:
         client_ip: The client's IP address
         allowed_ips: List of allowed IPs/CIDR ranges, or None for no restrictions
@@ -245,25 +308,4 @@ def check_ip_allowed(client_ip: str, allowed_ips: list[str] | None) -> bool:
     Returns:
         True if IP is allowed or no restrictions, False otherwise
     """
-    if not allowed_ips:
-        return True  # No restrictions
-
-    # First check for exact string matches (for non-IP addresses like 'testclient')
-    if client_ip in allowed_ips:
-        return True
-
-    # Then check IP address/CIDR matching
-    try:
-        client_addr = ipaddress.ip_address(client_ip)
-        for allowed_ip in allowed_ips:
-            try:
-                allowed_network = ipaddress.ip_network(allowed_ip, strict=False)
-                if client_addr in allowed_network:
-                    return True
-            except (ValueError, TypeError):
-                # Skip invalid IP/CIDR entries - already checked exact match above
-                continue
-        return False
-    except (ValueError, TypeError):
-        # client_ip is not a valid IP address, but we already checked exact match
-        return False  # Invalid IP format
+    return IpAllowlist(allowed_ips).allows(client_ip)
@@ -20,6 +20,19 @@ class ProblemType(str, Enum):
     VOCABULARY = "vocabulary"
 
 
+class ProblemProjection(str, Enum):
+    """Named column sets read from the problems table.
+
+    generation_trace (prompts and reasoning for every sentence) is by far the
+    largest column, so only FULL and TRACE read it.
+    """
+
+    SERVING = "serving"  # Everything but generation_trace (default)
+    SUMMARY = "summary"  # List views: no statements or generation_trace
+    FULL = "full"  # Every column
+    TRACE = "trace"  # id and generation_trace only
+
+
 class DifficultyLevel(str, Enum):
     """Difficulty levels for problems."""
 
@@ -4,19 +4,26 @@ import logging
 from uuid import UUID
 
 from src.cache import api_key_cache
-from src.core.exceptions import NotFoundError, RepositoryError, ServiceError
+from src.cache.single_flight import api_key_loads
+from src.core.exceptions import (
+    NotFoundError,
+    RepositoryError,
+    ServiceError,
+    ServiceUnavailableError,
+)
+from src.core.hashing import hash_api_key_async, verify_api_key_async
+from src.core.rate_limiting import api_key_rate_limiter
 from src.repositories.api_keys_repository import ApiKeyRepository
 from src.schemas.api_keys import (
+    ApiKey,
     ApiKeyCreate,
     ApiKeyResponse,
     ApiKeyStats,
     ApiKeyUpdate,
     ApiKeyWithPlainText,
-    check_ip_allowed,
     generate_api_key,
-    hash_api_key,
-    verify_api_key,
 )
+from src.services.api_key_usage_service import api_key_usage
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +57,7 @@ class ApiKeyService:
 
         # Generate the API key and hash it
         api_key_plain, key_prefix = generate_api_key()
-        key_hash = hash_api_key(api_key_plain)
+        key_hash = await hash_api_key_async(api_key_plain)
 
         # Create the API key in the database
         api_key = await repo.create_api_key(api_key_data, key_hash, key_prefix)
@@ -95,6 +102,9 @@ class ApiKeyService:
         # Refresh cache with updated key
         await api_key_cache.refresh_key(api_key)
 
+        # Apply a changed rate limit immediately
+        api_key_rate_limiter.set_limit(api_key.id, api_key.rate_limit_rpm)
+
         return ApiKeyResponse.model_validate(api_key.model_dump())
 
     async def revoke_api_key(self, api_key_id: UUID) -> bool:
@@ -105,6 +115,7 @@ class ApiKeyService:
         if success:
             # Invalidate cache
             await api_key_cache.invalidate_key(api_key_id)
+            api_key_rate_limiter.forget(api_key_id)
 
         return success
 
@@ -140,11 +151,23 @@ class ApiKeyService:
 
             # Cache miss - look up in database
             if not api_key:
-                api_key = await repo.get_api_key_by_prefix(key_prefix)
+                # Recently confirmed unknown or inactive - skip the database
+                if await api_key_cache.is_known_invalid(key_prefix):
+                    logger.debug(f"Rejected known invalid API key: {key_prefix}...")
+                    return None
+
+                async def load() -> ApiKey | None:
+                    api_key = await repo.get_api_key_by_prefix(key_prefix)
+
+                    # Warm cache for next time
+                    if api_key and api_key.is_active:
+                        await api_key_cache.refresh_key(api_key)
+                    else:
+                        await api_key_cache.mark_invalid(key_prefix)
+                    return api_key
 
-                # Warm cache for next time
-                if api_key and api_key.is_active:
-                    await api_key_cache.refresh_key(api_key)
+                # Concurrent misses for one prefix share a single query
+                api_key = await api_key_loads.do(key_prefix, load)
 
             if not api_key or not api_key.is_active:
                 logger.warning(
@@ -152,28 +175,34 @@ class ApiKeyService:
                 )
                 return None
 
-            # Verify the key against the stored hash
-            if not verify_api_key(api_key_plain, api_key.key_hash):
-                logger.warning(f"API key verification failed: {api_key_plain[:12]}...")
-                return None
-
-            # Check IP allowlist if configured
-            if client_ip and not check_ip_allowed(client_ip, api_key.allowed_ips):
+            # Verify the key against the stored hash (skip bcrypt on a repeat caller)
+            if not await api_key_cache.is_verified(api_key_plain, api_key):
+                if not await verify_api_key_async(api_key_plain, api_key.key_hash):
+                    logger.warning(
+                        f"API key verification failed: {api_key_plain[:12]}..."
+                    )
+                    return None
+                await api_key_cache.mark_verified(api_key_plain, api_key)
+
+            # Check IP allowlist if configured (precompiled per key)
+            allowlist = await api_key_cache.get_ip_allowlist(api_key)
+            if client_ip and not allowlist.allows(client_ip):
                 logger.warning(
                     f"IP {client_ip} not allowed for API key {api_key.name} ({api_key.key_prefix})"
                 )
                 return None
 
-            # Increment usage count atomically (fire-and-forget to not block request)
-            import asyncio
-
-            asyncio.create_task(repo.increment_usage(api_key.id))
+            # Record usage in memory; flushed to the database in batches
+            api_key_usage.record(api_key.id)
 
             logger.info(f"API key authenticated: {api_key.name} ({api_key.key_prefix})")
 
             # Return safe response
             return ApiKeyResponse.model_validate(api_key.model_dump())
 
+        except ServiceUnavailableError:
+            # Hash executor saturated - let the caller fast-reject with 503
+            raise
         except RepositoryError as e:
             logger.error(f"Repository error during API key authentication: {e}")
             # Propagate as a service error
@@ -228,12 +257,9 @@ class ApiKeyService:
         """
         Check if an API key is within its rate limit.
 
-        Note: This is a simplified implementation. In production, you'd want
-        to use Redis or similar for proper sliding window rate limiting.
+        Does not consume a request; the auth middleware enforces the limit.
         """
-        # For now, just return True - implement proper rate limiting later
-        # This is where you'd check against Redis/cache for current usage
-        return True
+        return api_key_rate_limiter.peek(api_key.id, api_key.rate_limit_rpm)
 
     async def is_api_key_expired(self, api_key: ApiKeyResponse) -> bool:
         """
@@ -0,0 +1,167 @@
+"""Aggregated API key usage tracking with batched writes."""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeyUsageAccumulator:
+    """
+    Coalesces per-request API key usage in memory and flushes it in bulk.
+
+    Each authenticated request only bumps an in-memory counter. A single
+    background task writes the accumulated counts and latest last_used_at
+    per key in one RPC, every `flush_interval` seconds or as soon as
+    `flush_threshold` increments are pending, whichever comes first.
+    """
+
+    def __init__(self, flush_interval: float = 5.0, flush_threshold: int = 500):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+
+        # key_id -> [count, last_used_at (epoch seconds)]
+        self._pending: dict[UUID, list] = {}
+        self._pending_increments = 0
+
+        self._repository = None
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._flush_lock = asyncio.Lock()
+
+        # Metrics
+        self._flushes = 0
+        self._flushed_increments = 0
+        self._failed_flushes = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background flusher is running."""
+        return self._task is not None and not self._task.done()
+
+    def record(self, key_id: UUID) -> None:
+        """Record one use of an API key (O(1), no I/O)."""
+        now = time.time()
+        entry = self._pending.get(key_id)
+        if entry is None:
+            self._pending[key_id] = [1, now]
+        else:
+            entry[0] += 1
+            entry[1] = now
+        self._pending_increments += 1
+
+        if self._pending_increments >= self.flush_threshold and self._wake:
+            self._wake.set()
+
+    async def start(
+        self,
+        repository,
+        flush_interval: float | None = None,
+        flush_threshold: int | None = None,
+    ) -> None:
+        """Start the background flusher using the given ApiKeyRepository."""
+        if self.running:
+            logger.warning("API key usage flusher already running")
+            return
+
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        if flush_threshold is not None:
+            self.flush_threshold = flush_threshold
+
+        self._repository = repository
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="api-key-usage-flusher")
+        logger.info(
+            f"API key usage flusher started (interval={self.flush_interval}s, "
+            f"threshold={self.flush_threshold})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write out anything pending."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._wake = None
+
+        if self._repository is not None:
+            await self.flush()
+        logger.info("API key usage flusher stopped")
+
+    async def _run(self) -> None:
+        """Flush on an interval or when woken by the size threshold."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending usage in one bulk call.
+
+        Returns:
+            Number of increments written. On failure the counts are merged
+            back so they are retried on the next flush.
+        """
+        async with self._flush_lock:
+            if not self._pending or self._repository is None:
+                return 0
+
+            batch = self._pending
+            increments = self._pending_increments
+            self._pending = {}
+            self._pending_increments = 0
+
+            usage = {
+                key_id: (count, datetime.fromtimestamp(last_used, tz=UTC))
+                for key_id, (count, last_used) in batch.items()
+            }
+
+            try:
+                success = await self._repository.increment_usage_bulk(usage)
+            except Exception as e:
+                logger.error(f"Failed to flush API key usage: {e}")
+                success = False
+
+            if not success:
+                self._failed_flushes += 1
+                self._merge_back(batch, increments)
+                return 0
+
+            self._flushes += 1
+            self._flushed_increments += increments
+            logger.debug(f"Flushed {increments} API key uses for {len(batch)} keys")
+            return increments
+
+    def _merge_back(self, batch: dict[UUID, list], increments: int) -> None:
+        """Return an unflushed batch to the pending counts (internal helper)."""
+        for key_id, (count, last_used) in batch.items():
+            entry = self._pending.get(key_id)
+            if entry is None:
+                self._pending[key_id] = [count, last_used]
+            else:
+                entry[0] += count
+                entry[1] = max(entry[1], last_used)
+        self._pending_increments += increments
+
+    def get_stats(self) -> dict:
+        """Get usage flusher statistics."""
+        return {
+            "running": self.running,
+            "pending_keys": len(self._pending),
+            "pending_increments": self._pending_increments,
+            "flushes": self._flushes,
+            "flushed_increments": self._flushed_increments,
+            "failed_flushes": self._failed_flushes,
+        }
+
+
+# Global singleton instance
+api_key_usage = ApiKeyUsageAccumulator()
@@ -22,6 +22,7 @@ from src.schemas.problems import (
     Problem,
     ProblemCreate,
     ProblemFilters,
+    ProblemProjection,
     ProblemSummary,
     ProblemType,
     ProblemUpdate,
@@ -104,20 +105,36 @@ class ProblemService:
         repo = self._get_problem_repository()
         return await repo.create_problem(problem_data)
 
-    async def get_problem_by_id(self, problem_id: UUID) -> Problem:
-        """Get a problem by ID, raising an error if not found."""
+    async def get_problem_by_id(
+        self,
+        problem_id: UUID,
+        projection: ProblemProjection = ProblemProjection.SERVING,
+    ) -> Problem:
+        """
+        Get a problem by ID, raising an error if not found.
+
+        The generation trace is only read with ProblemProjection.FULL.
+        """
         repo = self._get_problem_repository()
-        problem = await repo.get_problem(problem_id)
+        problem = await repo.get_problem(problem_id, projection)
         if not problem:
             raise NotFoundError(f"Problem with ID {problem_id} not found")
         return problem
 
+    async def get_problem_trace(self, problem_id: UUID) -> dict[str, Any] | None:
+        """Get a problem's generation trace without the rest of the problem."""
+        repo = self._get_problem_repository()
+        return await repo.get_problem_trace(problem_id)
+
     async def get_problems(
-        self, filters: ProblemFilters, include_statements: bool = True
+        self,
+        filters: ProblemFilters,
+        include_statements: bool = True,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> tuple[list[Problem], int]:
         """Get problems with filtering and pagination."""
         repo = self._get_problem_repository()
-        return await repo.get_problems(filters, include_statements)
+        return await repo.get_problems(filters, include_statements, projection)
 
     async def get_problem_summaries(
         self, filters: ProblemFilters
@@ -696,31 +713,38 @@ class ProblemService:
         problems, _ = await repo.get_problems(filters)
         return problems
 
-    async def get_least_recently_served_problem(self) -> Problem | None:
+    async def get_least_recently_served_problem(
+        self, projection: ProblemProjection = ProblemProjection.SERVING
+    ) -> Problem | None:
         """
         Get the least recently used problem and update its last_served_at.
 
         Returns:
             Problem object if found, None if no problems exist
         """
-        repo = self._get_problem_repository()
+        problems = await self.get_least_recently_served_problems(1, projection)
+        return problems[0] if problems else None
 
-        # Get least recently served problem
-        problem = await repo.get_least_recently_served_problem()
-
-        if problem:
-            # Update last_served_at timestamp
-            await repo.update_problem_last_served(problem.id)
+    async def get_least_recently_served_problems(
+        self, count: int, projection: ProblemProjection = ProblemProjection.SERVING
+    ) -> list[Problem]:
+        """
+        Get up to `count` least recently used problems, updating their last_served_at.
 
-        return problem
+        Selection and update happen atomically in the database, so concurrent
+        callers receive distinct problems.
+        """
+        repo = self._get_problem_repository()
+        return await repo.claim_next_problems(count, projection)
 
     async def get_random_problem(
         self,
         filters: ProblemFilters | None = None,
+        projection: ProblemProjection = ProblemProjection.SERVING,
     ) -> Problem | None:
         """Get a random problem, optionally filtered."""
         repo = self._get_problem_repository()
-        return await repo.get_random_problem(filters or ProblemFilters())
+        return await repo.get_random_problem(filters or ProblemFilters(), projection)
 
     async def count_problems(
         self,
@@ -3,12 +3,14 @@
 import asyncio
 import json
 import logging
+from collections.abc import Sequence
 from uuid import UUID
 
 from opentelemetry import trace
 from pydantic import ValidationError
 
 from src.cache import conjugation_cache, verb_cache
+from src.cache.single_flight import conjugation_loads, verb_loads
 from src.clients.abstract_llm_client import AbstractLLMClient
 from src.core.config import settings
 from src.core.exceptions import ContentGenerationError
@@ -146,15 +148,18 @@ class VerbService:
         if verb:
             return verb
 
-        # Cache miss - fetch from database
+        # Cache miss - fetch from database (once for concurrent callers)
         repo = self._get_verb_repository()
-        verb = await repo.get_verb(verb_id)
 
-        # Warm cache for next time
-        if verb:
-            await verb_cache.refresh_verb(verb)
+        async def load() -> Verb | None:
+            verb = await repo.get_verb(verb_id)
 
-        return verb
+            # Warm cache for next time
+            if verb:
+                await verb_cache.refresh_verb(verb)
+            return verb
+
+        return await verb_loads.do(("id", verb_id), load)
 
     async def get_verb_by_infinitive(
         self,
@@ -187,20 +192,25 @@ class VerbService:
                 if verb:
                     return verb
 
-            # Cache miss or filter mismatch - fetch from database
+            # Cache miss or filter mismatch - fetch from database (once for
+            # concurrent callers)
             repo = self._get_verb_repository()
-            verb = await repo.get_verb_by_infinitive(
-                infinitive=infinitive,
-                auxiliary=auxiliary,
-                reflexive=reflexive,
-                target_language_code=target_language_code,
-            )
 
-            # Warm cache for next time
-            if verb:
-                await verb_cache.refresh_verb(verb)
+            async def load() -> Verb | None:
+                verb = await repo.get_verb_by_infinitive(
+                    infinitive=infinitive,
+                    auxiliary=auxiliary,
+                    reflexive=reflexive,
+                    target_language_code=target_language_code,
+                )
 
-            return verb
+                # Warm cache for next time
+                if verb:
+                    await verb_cache.refresh_verb(verb)
+                return verb
+
+            key = ("infinitive", infinitive, auxiliary, reflexive, target_language_code)
+            return await verb_loads.do(key, load)
 
     async def get_verbs_by_infinitive(self, infinitive: str) -> list[Verb]:
         """Get all verb variants with the same infinitive."""
@@ -232,8 +242,13 @@ class VerbService:
 
     async def get_conjugations(
         self, infinitive: str, auxiliary: str, reflexive: bool = False
-    ) -> list[Conjugation]:
-        """Get all conjugations for a verb."""
+    ) -> Sequence[Conjugation]:
+        """
+        Get all conjugations for a verb.
+
+        Cache hits return the cache's shared tuple and concurrent misses share
+        one list; treat the result as read-only.
+        """
         # Try cache first
         conjugations = await conjugation_cache.get_conjugations_for_verb(
             infinitive, auxiliary, reflexive
@@ -241,19 +256,22 @@ class VerbService:
         if conjugations:
             return conjugations
 
-        # Cache miss - fetch from database
+        # Cache miss - fetch from database (once for concurrent callers)
         repo = self._get_verb_repository()
-        conjugations = await repo.get_conjugations(
-            infinitive=infinitive, auxiliary=auxiliary, reflexive=reflexive
-        )
 
-        # Warm cache for next time
-        for conj in conjugations:
-            await conjugation_cache.refresh_conjugation(conj)
+        async def load() -> list[Conjugation]:
+            conjugations = await repo.get_conjugations(
+                infinitive=infinitive, auxiliary=auxiliary, reflexive=reflexive
+            )
+
+            # Warm cache for next time
+            for conj in conjugations:
+                await conjugation_cache.refresh_conjugation(conj)
+            return conjugations
 
-        return conjugations
+        return await conjugation_loads.do((infinitive, auxiliary, reflexive), load)
 
-    async def get_conjugations_by_verb_id(self, verb_id: UUID) -> list[Conjugation]:
+    async def get_conjugations_by_verb_id(self, verb_id: UUID) -> Sequence[Conjugation]:
         """Get conjugations by verb ID (backwards compatibility)."""
         self._get_verb_repository()
         verb = await self.get_verb(verb_id)
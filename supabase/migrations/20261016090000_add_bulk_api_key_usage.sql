@@ -0,0 +1,23 @@
+-- Bulk variant of increment_api_key_usage
+-- The API accumulates usage per key in memory and flushes it periodically,
+-- turning one RPC per authenticated request into one RPC per flush interval.
+--
+-- usage: JSON array of {"key_id": uuid, "count": int, "last_used_at": timestamptz}
+
+CREATE OR REPLACE FUNCTION public.increment_api_key_usage_bulk(usage jsonb)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE api_keys AS k
+    SET
+        usage_count = k.usage_count + u.count,
+        last_used_at = GREATEST(COALESCE(k.last_used_at, u.last_used_at), u.last_used_at)
+    FROM jsonb_to_recordset(usage) AS u(key_id uuid, count integer, last_used_at timestamptz)
+    WHERE k.id = u.key_id;
+END;
+$$;
+
+ALTER FUNCTION public.increment_api_key_usage_bulk(jsonb) OWNER TO postgres;
+
+GRANT ALL ON FUNCTION public.increment_api_key_usage_bulk(jsonb) TO service_role;
@@ -0,0 +1,83 @@
+-- Shared rate limit state for multi-machine deployments
+-- Each machine enforces limits from local counters and, every few hundred
+-- milliseconds, appends what it consumed since the last sync and reads what
+-- the other machines appended. Enabled with RATE_LIMIT_STORAGE=postgres.
+
+CREATE TABLE IF NOT EXISTS public.rate_limit_deltas (
+    id BIGSERIAL PRIMARY KEY,
+    node_id TEXT NOT NULL,
+    bucket_key TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    expiry DOUBLE PRECISION NOT NULL DEFAULT 60,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_deltas_created_at
+    ON public.rate_limit_deltas(created_at);
+
+COMMENT ON TABLE public.rate_limit_deltas IS 'Short-lived log of rate limit consumption exchanged between API machines';
+
+-- Only the service role (through the function below) touches this table
+ALTER TABLE public.rate_limit_deltas ENABLE ROW LEVEL SECURITY;
+
+-- p_node_id:  calling machine
+-- p_after_id: cursor returned by the previous call (NULL on the first call)
+-- p_deltas:   JSON array of {"bucket_key": text, "amount": int, "expiry": float}
+--
+-- Returns {"cursor": bigint, "deltas": [{"bucket_key", "amount", "expiry"}]}
+-- with other machines' consumption since p_after_id, summed per bucket.
+-- Rows committed out of id order can be skipped; limits are approximate.
+CREATE OR REPLACE FUNCTION public.exchange_rate_limit_deltas(
+    p_node_id text,
+    p_after_id bigint,
+    p_deltas jsonb
+)
+RETURNS jsonb
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_cursor bigint;
+    v_deltas jsonb;
+BEGIN
+    INSERT INTO public.rate_limit_deltas (node_id, bucket_key, amount, expiry)
+    SELECT p_node_id, d.bucket_key, d.amount, d.expiry
+    FROM jsonb_to_recordset(COALESCE(p_deltas, '[]'::jsonb))
+        AS d(bucket_key text, amount integer, expiry double precision)
+    WHERE d.amount > 0;
+
+    SELECT COALESCE(MAX(id), 0) INTO v_cursor FROM public.rate_limit_deltas;
+
+    IF p_after_id IS NULL THEN
+        -- First call: start from now rather than replaying history
+        v_deltas := '[]'::jsonb;
+    ELSE
+        SELECT COALESCE(
+            jsonb_agg(jsonb_build_object(
+                'bucket_key', s.bucket_key,
+                'amount', s.amount,
+                'expiry', s.expiry
+            )),
+            '[]'::jsonb
+        )
+        INTO v_deltas
+        FROM (
+            SELECT bucket_key, SUM(amount) AS amount, MAX(expiry) AS expiry
+            FROM public.rate_limit_deltas
+            WHERE id > p_after_id
+              AND id <= v_cursor
+              AND node_id <> p_node_id
+            GROUP BY bucket_key
+        ) AS s;
+    END IF;
+
+    -- Nothing older than the longest window is needed
+    DELETE FROM public.rate_limit_deltas
+    WHERE created_at < NOW() - INTERVAL '5 minutes';
+
+    RETURN jsonb_build_object('cursor', v_cursor, 'deltas', v_deltas);
+END;
+$$;
+
+ALTER FUNCTION public.exchange_rate_limit_deltas(text, bigint, jsonb) OWNER TO postgres;
+
+GRANT ALL ON FUNCTION public.exchange_rate_limit_deltas(text, bigint, jsonb) TO service_role;
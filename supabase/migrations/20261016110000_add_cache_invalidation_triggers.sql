@@ -0,0 +1,72 @@
+-- Publish row changes on cached tables so every API replica can update its
+-- in-memory caches incrementally (LISTEN cache_invalidation).
+--
+-- Payloads carry only the table, operation and key columns of the old/new
+-- row; listeners re-read the row themselves. This keeps every payload far
+-- below the 8000 byte NOTIFY limit regardless of row size.
+--
+-- Trigger arguments list bookkeeping columns to ignore: updates that only
+-- touch those (usage counters, last_used_at) do not notify.
+
+CREATE OR REPLACE FUNCTION public.notify_cache_invalidation()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_key_columns text[] := ARRAY['id', 'infinitive', 'auxiliary', 'reflexive', 'tense'];
+    v_old jsonb;
+    v_new jsonb;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_old := to_jsonb(OLD);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_new := to_jsonb(NEW);
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND (v_old - TG_ARGV) = (v_new - TG_ARGV) THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM pg_notify('cache_invalidation', jsonb_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'old', (SELECT jsonb_object_agg(k, v_old -> k) FROM unnest(v_key_columns) AS k WHERE v_old ? k),
+        'new', (SELECT jsonb_object_agg(k, v_new -> k) FROM unnest(v_key_columns) AS k WHERE v_new ? k)
+    )::text);
+
+    RETURN NULL;
+END;
+$$;
+
+ALTER FUNCTION public.notify_cache_invalidation() OWNER TO postgres;
+
+DROP TRIGGER IF EXISTS verbs_cache_invalidation ON public.verbs;
+CREATE TRIGGER verbs_cache_invalidation
+    AFTER INSERT OR UPDATE OR DELETE ON public.verbs
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation('updated_at', 'last_used_at');
+
+DROP TRIGGER IF EXISTS verbs_cache_invalidation_truncate ON public.verbs;
+CREATE TRIGGER verbs_cache_invalidation_truncate
+    AFTER TRUNCATE ON public.verbs
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS conjugations_cache_invalidation ON public.conjugations;
+CREATE TRIGGER conjugations_cache_invalidation
+    AFTER INSERT OR UPDATE OR DELETE ON public.conjugations
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation('updated_at');
+
+DROP TRIGGER IF EXISTS conjugations_cache_invalidation_truncate ON public.conjugations;
+CREATE TRIGGER conjugations_cache_invalidation_truncate
+    AFTER TRUNCATE ON public.conjugations
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
+
+DROP TRIGGER IF EXISTS api_keys_cache_invalidation ON public.api_keys;
+CREATE TRIGGER api_keys_cache_invalidation
+    AFTER INSERT OR UPDATE OR DELETE ON public.api_keys
+    FOR EACH ROW EXECUTE FUNCTION public.notify_cache_invalidation('updated_at', 'last_used_at', 'usage_count');
+
+DROP TRIGGER IF EXISTS api_keys_cache_invalidation_truncate ON public.api_keys;
+CREATE TRIGGER api_keys_cache_invalidation_truncate
+    AFTER TRUNCATE ON public.api_keys
+    FOR EACH STATEMENT EXECUTE FUNCTION public.notify_cache_invalidation();
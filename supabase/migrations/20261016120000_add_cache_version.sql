@@ -0,0 +1,62 @@
+-- Cheap version stamp for the cached tables (verbs, conjugations, api_keys)
+--
+-- Every change that publishes a cache invalidation also advances
+-- cache_version_seq, so an on-disk cache snapshot taken at version N is
+-- current exactly while get_cache_version() still returns N. Sequences are
+-- not transactional: a rolled back change still advances the version, which
+-- only costs a needless snapshot refresh.
+
+CREATE SEQUENCE IF NOT EXISTS public.cache_version_seq;
+
+GRANT USAGE, SELECT ON SEQUENCE public.cache_version_seq TO service_role;
+
+CREATE OR REPLACE FUNCTION public.notify_cache_invalidation()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_key_columns text[] := ARRAY['id', 'infinitive', 'auxiliary', 'reflexive', 'tense'];
+    v_old jsonb;
+    v_new jsonb;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        v_old := to_jsonb(OLD);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        v_new := to_jsonb(NEW);
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND (v_old - TG_ARGV) = (v_new - TG_ARGV) THEN
+        RETURN NULL;
+    END IF;
+
+    PERFORM nextval('public.cache_version_seq');
+
+    PERFORM pg_notify('cache_invalidation', jsonb_build_object(
+        'table', TG_TABLE_NAME,
+        'op', TG_OP,
+        'old', (SELECT jsonb_object_agg(k, v_old -> k) FROM unnest(v_key_columns) AS k WHERE v_old ? k),
+        'new', (SELECT jsonb_object_agg(k, v_new -> k) FROM unnest(v_key_columns) AS k WHERE v_new ? k)
+    )::text);
+
+    RETURN NULL;
+END;
+$$;
+
+ALTER FUNCTION public.notify_cache_invalidation() OWNER TO postgres;
+
+-- Current version of the cached tables. A fresh sequence already reports
+-- last_value = 1 before the first nextval(), so report 0 until it is called;
+-- otherwise a snapshot taken before the first change would still match after it.
+CREATE OR REPLACE FUNCTION public.get_cache_version()
+RETURNS bigint
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT CASE WHEN is_called THEN last_value ELSE 0 END
+    FROM public.cache_version_seq;
+$$;
+
+ALTER FUNCTION public.get_cache_version() OWNER TO postgres;
+
+GRANT ALL ON FUNCTION public.get_cache_version() TO service_role;
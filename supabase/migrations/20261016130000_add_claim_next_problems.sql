@@ -0,0 +1,36 @@
+-- Claim the least recently served problems in one statement
+-- Replaces SELECT ... ORDER BY last_served_at NULLS FIRST LIMIT 1 followed by a
+-- separate UPDATE of last_served_at: one round trip instead of two, and rows
+-- locked by a concurrent claim are skipped, so concurrent callers never
+-- receive the same problem.
+--
+-- Rows are returned in LRU order (never served first, then oldest served,
+-- then oldest created), using the idx_problems_lru index.
+
+CREATE OR REPLACE FUNCTION public.claim_next_problems(p_count integer DEFAULT 1)
+RETURNS SETOF public.problems
+LANGUAGE sql
+AS $$
+    WITH next AS (
+        SELECT id, last_served_at, created_at
+        FROM public.problems
+        ORDER BY last_served_at ASC NULLS FIRST, created_at ASC
+        LIMIT GREATEST(p_count, 0)
+        FOR UPDATE SKIP LOCKED
+    ),
+    claimed AS (
+        UPDATE public.problems AS p
+        SET last_served_at = now()
+        FROM next
+        WHERE p.id = next.id
+        RETURNING p.*
+    )
+    SELECT claimed.*
+    FROM claimed
+    JOIN next ON next.id = claimed.id
+    ORDER BY next.last_served_at ASC NULLS FIRST, next.created_at ASC;
+$$;
+
+ALTER FUNCTION public.claim_next_problems(integer) OWNER TO postgres;
+
+GRANT ALL ON FUNCTION public.claim_next_problems(integer) TO service_role;
@@ -208,32 +208,45 @@ class MockProblemService:
     Configure behavior by setting attributes:
     - problems: Dict mapping problem_id -> problem object
     - return_none: If True, return None for lookups
+
+    The projection of each lookup is recorded in `projections`.
     """
 
     def __init__(self):
         self.problems = {}
         self.return_none = False
+        self.projections = []
 
-    async def get_random_problem(self, filters=None):
+    async def get_random_problem(self, filters=None, projection=None):
         """Mock get random problem."""
+        self.projections.append(projection)
         if self.return_none or not self.problems:
             return None
         return list(self.problems.values())[0]
 
-    async def get_least_recently_served_problem(self, filters=None):
+    async def get_least_recently_served_problem(self, projection=None):
         """Mock get LRU problem for /random endpoint."""
+        self.projections.append(projection)
         if self.return_none or not self.problems:
             return None
         return list(self.problems.values())[0]
 
-    async def get_problem_by_id(self, problem_id):
+    async def get_least_recently_served_problems(self, count, projection=None):
+        """Mock get LRU problems for /random?count=N."""
+        self.projections.append(projection)
+        if self.return_none:
+            return []
+        return list(self.problems.values())[:count]
+
+    async def get_problem_by_id(self, problem_id, projection=None):
         """Mock get problem by ID.
 
         Returns None for not found (API will convert to 404).
         """
+        self.projections.append(projection)
         return self.problems.get(problem_id)
 
-    async def get_problems(self, filters, include_statements=True):
+    async def get_problems(self, filters, include_statements=True, projection=None):
         """Mock get problems list."""
         return list(self.problems.values()), len(self.problems)
 
@@ -142,3 +142,34 @@ class TestApiKeyRepository:
         updated_key = await self.repository.get_api_key(created_key.id)
         assert updated_key.usage_count == 1
         assert updated_key.last_used_at is not None
+
+    async def test_increment_usage_bulk_success(self):
+        """Test adding accumulated usage for several keys in one call."""
+        from datetime import UTC, datetime
+
+        keys = [
+            await self.repository.create_api_key(
+                ApiKeyCreate(
+                    name=f"bulk-usage-test-{uuid.uuid4()}", permissions_scope=["read"]
+                ),
+                f"hash-{uuid.uuid4()}",
+                f"prefix-{uuid.uuid4()}",
+            )
+            for _ in range(2)
+        ]
+        now = datetime.now(UTC)
+
+        result = await self.repository.increment_usage_bulk(
+            {keys[0].id: (5, now), keys[1].id: (2, now)}
+        )
+
+        assert result is True
+        first = await self.repository.get_api_key(keys[0].id)
+        second = await self.repository.get_api_key(keys[1].id)
+        assert first.usage_count == 5
+        assert second.usage_count == 2
+        assert first.last_used_at is not None
+
+    async def test_increment_usage_bulk_empty(self):
+        """Test that an empty batch is a no-op."""
+        assert await self.repository.increment_usage_bulk({}) is True
@@ -1,5 +1,6 @@
 """Comprehensive tests for API key schemas and utilities."""
 
+import ipaddress
 from datetime import UTC, datetime, timezone
 from unittest.mock import patch
 from uuid import uuid4
@@ -14,6 +15,7 @@ from src.schemas.api_keys import (
     ApiKeyStats,
     ApiKeyUpdate,
     ApiKeyWithPlainText,
+    IpAllowlist,
     check_ip_allowed,
     generate_api_key,
     hash_api_key,
@@ -399,6 +401,52 @@ class TestIpAllowlistChecking:
         assert check_ip_allowed("192.168.1.1", allowed_ips) is False
 
 
+@pytest.mark.unit
+class TestIpAllowlist:
+    """Unit tests for the precompiled IP allowlist."""
+
+    def test_merges_overlapping_and_adjacent_ranges(self):
+        """Overlapping and adjacent CIDRs should collapse into one range."""
+        allowlist = IpAllowlist(["10.0.0.0/25", "10.0.0.128/25", "10.0.0.64/26"])
+
+        assert allowlist._starts[4] == [int(ipaddress.ip_address("10.0.0.0"))]
+        assert allowlist.allows("10.0.0.0") is True
+        assert allowlist.allows("10.0.0.255") is True
+        assert allowlist.allows("10.0.1.0") is False
+
+    def test_boundaries_between_ranges(self):
+        """Addresses just outside each range should be rejected."""
+        allowlist = IpAllowlist(["192.168.1.0/24", "192.168.3.0/24"])
+
+        assert allowlist.allows("192.168.0.255") is False
+        assert allowlist.allows("192.168.1.0") is True
+        assert allowlist.allows("192.168.2.0") is False
+        assert allowlist.allows("192.168.3.255") is True
+        assert allowlist.allows("192.168.4.0") is False
+
+    def test_ip_versions_are_separate(self):
+        """IPv4 ranges should never match IPv6 clients and vice versa."""
+        allowlist = IpAllowlist(["0.0.0.0/0"])
+
+        assert allowlist.allows("8.8.8.8") is True
+        assert allowlist.allows("::1") is False
+
+    def test_large_allowlist(self):
+        """A 1k-entry allowlist should match the linear definition."""
+        allowed_ips = [f"10.{i // 256}.{i % 256}.0/24" for i in range(0, 2000, 2)]
+        allowlist = IpAllowlist(allowed_ips)
+
+        assert allowlist.allows("10.0.0.1") is True
+        assert allowlist.allows("10.0.1.1") is False
+        assert allowlist.allows("10.7.206.9") is True
+        assert allowlist.allows("10.7.207.9") is False
+
+    def test_unrestricted(self):
+        """None or empty allowlists should allow everything."""
+        assert IpAllowlist(None).allows("anything") is True
+        assert IpAllowlist([]).allows("1.2.3.4") is True
+
+
 @pytest.mark.unit
 class TestApiKeyUtilities:
     """Unit tests for API key utility functions."""
@@ -1,5 +1,6 @@
 """Tests for ApiKeyCache."""
 
+import asyncio
 from datetime import UTC, datetime, timezone
 
 import pytest
@@ -283,3 +284,348 @@ class TestApiKeyCache:
         stats = cache.get_stats()
         assert stats["misses"] == 1
         assert stats["loaded"] is False
+
+
+@pytest.mark.asyncio
+class TestVerifiedCredentialCache:
+    """Test the verified-credential cache in front of bcrypt."""
+
+    async def test_mark_verified_then_hit(self, mock_repository, sample_api_keys):
+        """A key marked as verified should be recognized on the next call."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        assert await cache.is_verified("sk_live_abc1_plain", key) is False
+        await cache.mark_verified("sk_live_abc1_plain", key)
+        assert await cache.is_verified("sk_live_abc1_plain", key) is True
+
+        stats = cache.get_stats()
+        assert stats["verified_entries"] == 1
+        assert stats["verified_hits"] == 1
+        assert stats["verified_misses"] == 1
+
+    async def test_different_plain_key_misses(self, mock_repository):
+        """A different presented key should not match a verified entry."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        await cache.mark_verified("sk_live_abc1_plain", key)
+        assert await cache.is_verified("sk_live_abc1_other", key) is False
+
+    async def test_entry_does_not_store_plain_key(self, mock_repository):
+        """Entries should be keyed by digest, never by the plain text key."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        await cache.mark_verified("sk_live_abc1_plain", key)
+        assert "sk_live_abc1_plain" not in cache._verified
+        assert all(isinstance(d, bytes) for d in cache._verified)
+
+    async def test_entry_expires(self, mock_repository):
+        """Entries should expire after the TTL."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache(verified_ttl_seconds=0)
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        await cache.mark_verified("sk_live_abc1_plain", key)
+        assert await cache.is_verified("sk_live_abc1_plain", key) is False
+        assert cache.get_stats()["verified_entries"] == 0
+
+    async def test_bounded_size(self, mock_repository):
+        """Least recently used entries should be evicted past the bound."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache(verified_max_entries=2)
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        for i in range(3):
+            await cache.mark_verified(f"sk_live_abc1_{i}", key)
+
+        assert cache.get_stats()["verified_entries"] == 2
+        assert await cache.is_verified("sk_live_abc1_0", key) is False
+        assert await cache.is_verified("sk_live_abc1_2", key) is True
+
+    async def test_refresh_key_evicts(self, mock_repository, sample_api_keys):
+        """Refreshing a key (update) should evict its verified credentials."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+        await cache.mark_verified("sk_live_abc1_plain", key)
+
+        updated = key.model_copy(update={"name": "Renamed"})
+        await cache.refresh_key(updated)
+
+        assert await cache.is_verified("sk_live_abc1_plain", updated) is False
+        assert cache.get_stats()["verified_entries"] == 0
+
+    async def test_invalidate_key_evicts(self, mock_repository, sample_api_keys):
+        """Invalidating a key (revoke) should evict its verified credentials."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+        await cache.mark_verified("sk_live_abc1_plain", key)
+
+        await cache.invalidate_key(key.id)
+
+        assert await cache.is_verified("sk_live_abc1_plain", key) is False
+        assert cache.get_stats()["verified_entries"] == 0
+
+    async def test_mark_verified_skips_stale_key(self, mock_repository):
+        """A key superseded while bcrypt was running should not be cached."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        await cache.refresh_key(key.model_copy(update={"name": "Renamed"}))
+        await cache.mark_verified("sk_live_abc1_plain", key)
+
+        assert cache.get_stats()["verified_entries"] == 0
+
+
+@pytest.mark.asyncio
+class TestCompiledIpAllowlist:
+    """Test IP allowlists compiled alongside cached API keys."""
+
+    async def test_allowlist_compiled_on_load(self, sample_api_keys):
+        """Allowlists should be compiled once when keys are loaded."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        restricted = sample_api_keys[0].model_copy(
+            update={"allowed_ips": ["10.0.0.0/8", "testclient"]}
+        )
+
+        class Repo:
+            async def get_all_api_keys(self, limit=1000, include_inactive=True):
+                return [restricted]
+
+        cache = ApiKeyCache()
+        await cache.load(Repo())
+        key = await cache.get_by_prefix(restricted.key_prefix)
+
+        allowlist = await cache.get_ip_allowlist(key)
+        assert allowlist is cache._indexes.ip_allowlists[key.id]
+        assert allowlist.allows("10.1.2.3") is True
+        assert allowlist.allows("testclient") is True
+        assert allowlist.allows("192.168.0.1") is False
+
+    async def test_allowlist_recompiled_on_refresh(self, mock_repository):
+        """Refreshing a key should recompile its allowlist."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+        assert (await cache.get_ip_allowlist(key)).allows("192.168.0.1") is True
+
+        updated = key.model_copy(update={"allowed_ips": ["10.0.0.1"]})
+        await cache.refresh_key(updated)
+
+        allowlist = await cache.get_ip_allowlist(updated)
+        assert allowlist.allows("192.168.0.1") is False
+        assert allowlist.allows("10.0.0.1") is True
+
+    async def test_uncached_key_compiled_on_demand(self, mock_repository):
+        """A key that is not the cached version should be compiled on demand."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+
+        stale = key.model_copy(update={"allowed_ips": ["10.0.0.1"]})
+        allowlist = await cache.get_ip_allowlist(stale)
+        assert allowlist.allows("10.0.0.1") is True
+        assert allowlist.allows("10.0.0.2") is False
+
+    async def test_invalidate_drops_allowlist(self, mock_repository, sample_api_keys):
+        """Invalidating a key should drop its compiled allowlist."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        await cache.invalidate_key(sample_api_keys[0].id)
+
+        assert sample_api_keys[0].id not in cache._indexes.ip_allowlists
+
+
+@pytest.mark.asyncio
+class TestNegativePrefixCache:
+    """Test the negative cache for unknown and inactive key prefixes."""
+
+    async def test_mark_invalid_then_hit(self, mock_repository):
+        """A prefix marked invalid should be recognized until it expires."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+
+        assert await cache.is_known_invalid("sk_live_nope") is False
+        await cache.mark_invalid("sk_live_nope")
+        assert await cache.is_known_invalid("sk_live_nope") is True
+
+        stats = cache.get_stats()
+        assert stats["negative_entries"] == 1
+        assert stats["negative_hits"] == 1
+        assert stats["negative_stores"] == 1
+
+    async def test_entry_expires(self, mock_repository):
+        """Entries should expire after the TTL."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache(negative_ttl_seconds=0)
+        await cache.mark_invalid("sk_live_nope")
+
+        assert await cache.is_known_invalid("sk_live_nope") is False
+        assert cache.get_stats()["negative_entries"] == 0
+
+    async def test_bounded_size(self):
+        """Oldest entries should be evicted past the bound."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache(negative_max_entries=2)
+        for i in range(3):
+            await cache.mark_invalid(f"sk_live_bad{i}")
+
+        stats = cache.get_stats()
+        assert stats["negative_entries"] == 2
+        assert stats["negative_evictions"] == 1
+        assert await cache.is_known_invalid("sk_live_bad0") is False
+        assert await cache.is_known_invalid("sk_live_bad2") is True
+
+    async def test_refresh_key_clears_entry(self, mock_repository, sample_api_keys):
+        """Refreshing a key with a negatively cached prefix should clear it."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.mark_invalid("sk_live_new9")
+
+        new_key = sample_api_keys[0].model_copy(
+            update={
+                "id": "00000000-0000-0000-0000-000000000009",
+                "key_prefix": "sk_live_new9",
+            }
+        )
+        await cache.refresh_key(new_key)
+
+        assert await cache.is_known_invalid("sk_live_new9") is False
+
+    async def test_active_cached_prefix_not_marked(self, mock_repository):
+        """A prefix with an active cached key should never be marked invalid."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        await cache.mark_invalid("sk_live_abc1")
+        await cache.mark_invalid("sk_live_old3")  # inactive key
+
+        assert await cache.is_known_invalid("sk_live_abc1") is False
+        assert await cache.is_known_invalid("sk_live_old3") is True
+
+    async def test_load_clears_entries(self, mock_repository):
+        """Reloading from the database should drop all negative entries."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.mark_invalid("sk_live_nope")
+        await cache.load(mock_repository)
+
+        assert cache.get_stats()["negative_entries"] == 0
+
+    async def test_authenticate_skips_database_for_known_invalid(self):
+        """Repeated unknown prefixes should hit the database only once."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from src.cache.api_key_cache import ApiKeyCache
+        from src.services.api_key_service import ApiKeyService
+
+        cache = ApiKeyCache()
+        repo = MagicMock()
+        repo.get_api_key_by_prefix = AsyncMock(return_value=None)
+        service = ApiKeyService(api_key_repository=repo)
+
+        with patch("src.services.api_key_service.api_key_cache", cache):
+            for _ in range(3):
+                assert await service.authenticate_api_key("sk_live_nope123") is None
+
+        repo.get_api_key_by_prefix.assert_awaited_once_with("sk_live_nope")
+        assert cache.get_stats()["negative_hits"] == 2
+
+
+@pytest.mark.asyncio
+class TestReloadSwap:
+    """Test that reloads publish a complete new generation."""
+
+    async def test_authentication_during_reload(
+        self, mock_repository, sample_api_keys, monkeypatch
+    ):
+        """Keys should stay resolvable while a reload builds new indexes."""
+        from src.cache import paged_loader
+        from src.cache.api_key_cache import ApiKeyCache
+
+        monkeypatch.setattr(paged_loader, "INDEX_BATCH_SIZE", 1)
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+
+        reload = asyncio.create_task(cache.reload(mock_repository))
+        checks = 0
+        while not reload.done():
+            assert await cache.get_by_prefix("sk_live_abc1") is not None
+            assert await cache.get_by_prefix("sk_live_xyz2") is not None
+            checks += 1
+            await asyncio.sleep(0)
+        await reload
+
+        assert checks > 1
+        assert await cache.get_by_prefix("sk_live_xyz2") is not None
+
+    async def test_verified_survives_reload(self, mock_repository):
+        """Reloading unchanged keys should keep verified credentials."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        key = await cache.get_by_prefix("sk_live_abc1")
+        await cache.mark_verified("sk_live_abc1_plain", key)
+
+        await cache.reload(mock_repository)
+
+        reloaded = await cache.get_by_prefix("sk_live_abc1")
+        assert await cache.is_verified("sk_live_abc1_plain", reloaded) is True
+
+    async def test_reload_drops_verified_for_changed_keys(
+        self, mock_repository, sample_api_keys
+    ):
+        """Rotated or revoked keys should lose their verified credentials."""
+        from src.cache.api_key_cache import ApiKeyCache
+
+        cache = ApiKeyCache()
+        await cache.load(mock_repository)
+        for prefix in ("sk_live_abc1", "sk_live_xyz2"):
+            key = await cache.get_by_prefix(prefix)
+            await cache.mark_verified(f"{prefix}_plain", key)
+
+        sample_api_keys[0] = sample_api_keys[0].model_copy(
+            update={"key_hash": "$2b$12$rotated"}
+        )
+        sample_api_keys[1] = sample_api_keys[1].model_copy(update={"is_active": False})
+        await cache.reload(mock_repository)
+
+        assert cache.get_stats()["verified_entries"] == 0
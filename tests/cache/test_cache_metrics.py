@@ -0,0 +1,165 @@
+"""Tests for cache metrics."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.cache import metrics as metrics_module
+from src.cache.api_key_cache import ApiKeyCache
+from src.cache.metrics import CacheLookups, estimate_memory, timed_load
+from src.cache.verb_cache import VerbCache
+from src.schemas.verbs import AuxiliaryType, Verb
+
+
+def make_verb(infinitive: str) -> Verb:
+    now = datetime.now(UTC)
+    return Verb(
+        id=uuid4(),
+        infinitive=infinitive,
+        auxiliary=AuxiliaryType.AVOIR,
+        reflexive=False,
+        target_language_code="eng",
+        translation=f"to {infinitive}",
+        past_participle=f"{infinitive}é",
+        present_participle=f"{infinitive}ant",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def verbs():
+    return [make_verb(f"verbe{i}") for i in range(50)]
+
+
+@pytest.fixture
+def verb_repository(verbs):
+    class MockVerbRepository:
+        async def get_all_verbs(self, limit=10000):
+            return verbs
+
+    return MockVerbRepository()
+
+
+@pytest.mark.unit
+class TestCacheLookups:
+    def test_counts_by_pattern(self):
+        lookups = CacheLookups()
+        lookups.hit("by_id")
+        lookups.hit("by_id")
+        lookups.miss("by_id")
+        lookups.miss("random")
+
+        assert lookups.hits == 2
+        assert lookups.misses == 2
+        assert lookups.by_pattern() == {
+            "by_id": {"hits": 2, "misses": 1},
+            "random": {"hits": 0, "misses": 1},
+        }
+
+    def test_empty(self):
+        lookups = CacheLookups()
+
+        assert lookups.hits == lookups.misses == 0
+        assert lookups.by_pattern() == {}
+
+
+@pytest.mark.unit
+class TestEstimateMemory:
+    def test_scales_sample_to_count(self, verbs, monkeypatch):
+        monkeypatch.setattr(metrics_module, "MEMORY_SAMPLE_SIZE", 10)
+
+        sampled = estimate_memory(verbs, 10, [])
+        scaled = estimate_memory(verbs, 1000, [])
+
+        assert sampled > 0
+        assert scaled == sampled * 100
+
+    def test_counts_nested_index_containers(self, verbs):
+        flat = {v.id: v for v in verbs}
+        nested = {"eng": dict(flat)}
+
+        assert estimate_memory([], 0, [flat, nested]) > estimate_memory([], 0, [flat])
+
+    def test_empty(self):
+        assert estimate_memory([], 0, []) == 0
+
+
+@pytest.mark.unit
+class TestTimedLoad:
+    def test_records_success(self, monkeypatch):
+        histogram = MagicMock()
+        monkeypatch.setattr(metrics_module, "load_duration_histogram", histogram)
+
+        with timed_load("verbs"):
+            pass
+
+        seconds, attributes = histogram.record.call_args.args
+        assert seconds >= 0
+        assert attributes == {"cache": "verbs", "outcome": "success"}
+
+    def test_records_error(self, monkeypatch):
+        histogram = MagicMock()
+        monkeypatch.setattr(metrics_module, "load_duration_histogram", histogram)
+
+        with pytest.raises(ConnectionError), timed_load("api_keys"):
+            raise ConnectionError("database down")
+
+        assert histogram.record.call_args.args[1] == {
+            "cache": "api_keys",
+            "outcome": "error",
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCacheStatsMetrics:
+    async def test_verb_lookups_by_pattern(self, verbs, verb_repository):
+        cache = VerbCache()
+        await cache.load(verb_repository)
+
+        await cache.get_by_id(verbs[0].id)
+        await cache.get_by_id(uuid4())
+        await cache.get_random_verb()
+        await cache.get_by_infinitive_simple("inconnu")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["lookups"] == {
+            "by_id": {"hits": 1, "misses": 1},
+            "by_infinitive": {"hits": 0, "misses": 1},
+            "random": {"hits": 1, "misses": 0},
+        }
+
+    async def test_memory_grows_with_entries(self, verbs, verb_repository):
+        cache = VerbCache()
+        empty = cache.get_stats()["memory_bytes"]
+
+        await cache.load(verb_repository)
+
+        # Each verb holds at least its UUID, strings and timestamps
+        assert cache.get_stats()["memory_bytes"] > empty + len(verbs) * 500
+
+    async def test_load_is_timed(self, verb_repository, monkeypatch):
+        histogram = MagicMock()
+        monkeypatch.setattr(metrics_module, "load_duration_histogram", histogram)
+
+        await VerbCache().load(verb_repository)
+
+        assert histogram.record.call_args.args[1] == {
+            "cache": "verbs",
+            "outcome": "success",
+        }
+
+    async def test_api_key_lookups_include_verified(self):
+        cache = ApiKeyCache()
+
+        await cache.get_by_prefix("sk_live_none")
+
+        assert cache.get_stats()["lookups"] == {
+            "by_prefix": {"hits": 0, "misses": 1},
+            "verified": {"hits": 0, "misses": 0},
+        }
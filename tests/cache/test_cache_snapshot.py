@@ -0,0 +1,425 @@
+"""Tests for on-disk cache snapshots."""
+
+import asyncio
+import os
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+import pytest
+
+from src.cache import snapshot as snapshot_module
+from src.cache.api_key_cache import ApiKeyCache
+from src.cache.conjugation_cache import ConjugationCache
+from src.cache.records import ConjugationRecord
+from src.cache.snapshot import (
+    CacheSnapshot,
+    CacheWarmup,
+    SnapshotError,
+    write_snapshot,
+)
+from src.cache.verb_cache import VerbCache
+from src.schemas.api_keys import ApiKey
+from src.schemas.verbs import AuxiliaryType, Conjugation, Tense, Verb
+
+
+@pytest.fixture
+def sample_verbs():
+    """Create sample verbs for testing."""
+    now = datetime.now(UTC)
+    return [
+        Verb(
+            id=f"00000000-0000-0000-0000-00000000000{i}",
+            infinitive=infinitive,
+            auxiliary=AuxiliaryType.AVOIR,
+            reflexive=False,
+            target_language_code="eng",
+            translation=translation,
+            past_participle="parlé",
+            present_participle="parlant",
+            can_have_cod=True,
+            can_have_coi=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for i, (infinitive, translation) in enumerate(
+            [("parler", "to speak"), ("être", "to be")], start=1
+        )
+    ]
+
+
+@pytest.fixture
+def sample_conjugations():
+    """Create sample conjugations for testing."""
+    now = datetime.now(UTC)
+    return [
+        Conjugation(
+            id="00000000-0000-0000-0000-000000000101",
+            infinitive="parler",
+            auxiliary=AuxiliaryType.AVOIR,
+            reflexive=False,
+            tense=Tense.PRESENT,
+            first_person_singular="parle",
+            second_person_singular="parles",
+            third_person_singular="parle",
+            first_person_plural="parlons",
+            second_person_plural="parlez",
+            third_person_plural="parlent",
+            created_at=now,
+            updated_at=now,
+        ),
+        Conjugation(
+            id="00000000-0000-0000-0000-000000000102",
+            infinitive="parler",
+            auxiliary=AuxiliaryType.AVOIR,
+            reflexive=False,
+            tense=Tense.IMPERATIF,
+            first_person_singular=None,
+            second_person_singular="parle",
+            third_person_singular=None,
+            first_person_plural="parlons",
+            second_person_plural="parlez",
+            third_person_plural=None,
+            created_at=now,
+            updated_at=now,
+        ),
+    ]
+
+
+@pytest.fixture
+def sample_api_keys():
+    """Create sample API keys for testing."""
+    now = datetime.now(UTC)
+    return [
+        ApiKey(
+            id="00000000-0000-0000-0000-000000000201",
+            key_hash="$2b$12$test_hash_1",
+            key_prefix="sk_live_abc1",
+            name="Test Key",
+            permissions_scope=["read", "write"],
+            allowed_ips=["10.0.0.0/8"],
+            created_at=now,
+            updated_at=now,
+        ),
+        ApiKey(
+            id="00000000-0000-0000-0000-000000000202",
+            key_hash="$2b$12$test_hash_2",
+            key_prefix="sk_live_old2",
+            name="Revoked Key",
+            is_active=False,
+            created_at=now,
+            updated_at=now,
+        ),
+    ]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, sample_verbs, sample_conjugations, sample_api_keys):
+    """A snapshot of the sample rows at cache version 7."""
+    path = tmp_path / "cache.snapshot"
+    write_snapshot(path, 7, sample_verbs, sample_conjugations, sample_api_keys)
+    return path
+
+
+@pytest.fixture
+def database(sample_verbs, sample_conjugations, sample_api_keys):
+    """Repositories standing in for the database."""
+
+    class MockVerbRepository:
+        async def get_all_verbs(self, limit=10000):
+            return sample_verbs
+
+        async def get_all_conjugations(self, limit=10000):
+            return sample_conjugations
+
+    class MockApiKeyRepository:
+        async def get_all_api_keys(self, limit=1000, include_inactive=True):
+            return sample_api_keys
+
+    return MockVerbRepository(), MockApiKeyRepository()
+
+
+@pytest.fixture
+def caches(monkeypatch):
+    """Fresh caches in place of the global ones."""
+    verb_cache, conjugation_cache, api_key_cache = (
+        VerbCache(),
+        ConjugationCache(),
+        ApiKeyCache(),
+    )
+    monkeypatch.setattr(snapshot_module, "verb_cache", verb_cache)
+    monkeypatch.setattr(snapshot_module, "conjugation_cache", conjugation_cache)
+    monkeypatch.setattr(snapshot_module, "api_key_cache", api_key_cache)
+    return verb_cache, conjugation_cache, api_key_cache
+
+
+def set_database_version(monkeypatch, version):
+    """Make get_cache_version() return `version`."""
+    monkeypatch.setattr(
+        snapshot_module, "fetch_cache_version", AsyncMock(return_value=version)
+    )
+
+
+@pytest.mark.unit
+class TestCacheSnapshotFile:
+    def test_round_trip(
+        self, snapshot_path, sample_verbs, sample_conjugations, sample_api_keys
+    ):
+        with CacheSnapshot(snapshot_path) as snapshot:
+            assert snapshot.cache_version == 7
+            assert snapshot.row_counts() == {
+                "verbs": 2,
+                "conjugations": 2,
+                "api_keys": 2,
+            }
+            assert snapshot.verbs() == sample_verbs
+            assert snapshot.api_keys() == sample_api_keys
+
+            conjugations = snapshot.conjugations()
+            assert all(isinstance(c, ConjugationRecord) for c in conjugations)
+            assert [c.to_model() for c in conjugations] == sample_conjugations
+
+    def test_accepts_cache_records(self, tmp_path, sample_conjugations):
+        records = [ConjugationRecord.from_model(c) for c in sample_conjugations]
+        path = tmp_path / "cache.snapshot"
+        write_snapshot(path, 1, [], records, [])
+
+        with CacheSnapshot(path) as snapshot:
+            assert [c.to_model() for c in snapshot.conjugations()] == (
+                sample_conjugations
+            )
+
+    def test_distinct_values_are_stored_once(self, tmp_path, sample_conjugations):
+        path = tmp_path / "cache.snapshot"
+        summary = write_snapshot(path, 1, [], sample_conjugations * 50, [])
+
+        with CacheSnapshot(path) as snapshot:
+            conjugations = snapshot.conjugations()
+        assert len(conjugations) == 100
+        assert summary["strings"] < 30
+
+    def test_empty_snapshot(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        write_snapshot(path, 0, [], [], [])
+
+        with CacheSnapshot(path) as snapshot:
+            assert snapshot.verbs() == []
+            assert snapshot.conjugations() == []
+            assert snapshot.api_keys() == []
+
+    def test_owner_only_permissions(self, snapshot_path):
+        assert os.stat(snapshot_path).st_mode & 0o777 == 0o600
+
+    def test_rejects_corruption(self, snapshot_path):
+        data = bytearray(snapshot_path.read_bytes())
+        data[-1] ^= 0xFF
+        snapshot_path.write_bytes(bytes(data))
+
+        with pytest.raises(SnapshotError, match="checksum"):
+            CacheSnapshot(snapshot_path)
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"not a snapshot at all")
+
+        with pytest.raises(SnapshotError, match="not a cache snapshot"):
+            CacheSnapshot(path)
+
+        path.write_bytes(b"")
+        with pytest.raises(SnapshotError, match="empty"):
+            CacheSnapshot(path)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCacheWarmup:
+    async def test_caches_load_from_snapshot(self, snapshot_path, caches):
+        verb_cache, conjugation_cache, api_key_cache = caches
+
+        with CacheSnapshot(snapshot_path) as snapshot:
+            await verb_cache.load(snapshot)
+            await conjugation_cache.load(snapshot)
+            await api_key_cache.load(snapshot)
+
+        assert (await verb_cache.get_by_infinitive_simple("être")).translation == (
+            "to be"
+        )
+        assert len(await conjugation_cache.get_all()) == 2
+        revoked = await api_key_cache.get_by_id(
+            UUID("00000000-0000-0000-0000-000000000202")
+        )
+        assert revoked.is_active is False
+
+    async def test_current_snapshot_skips_database(
+        self, snapshot_path, caches, monkeypatch
+    ):
+        set_database_version(monkeypatch, 7)
+        verb_repository = AsyncMock()
+        api_key_repository = AsyncMock()
+
+        warmup = CacheWarmup()
+        source = await warmup.load(
+            None, verb_repository, api_key_repository, str(snapshot_path)
+        )
+
+        assert source == "snapshot"
+        assert caches[0].get_stats()["total_verbs"] == 2
+        assert caches[1].get_stats()["total_conjugations"] == 2
+        assert caches[2].get_stats()["total_keys"] == 2
+        assert not verb_repository.mock_calls
+        assert not api_key_repository.mock_calls
+
+    async def test_stale_snapshot_refreshes_in_background(
+        self, snapshot_path, caches, database, monkeypatch, sample_verbs
+    ):
+        set_database_version(monkeypatch, 9)
+        verb_repository, api_key_repository = database
+        # The database has moved on: one verb was deleted
+        verb_repository.get_all_verbs = AsyncMock(return_value=sample_verbs[:1])
+
+        warmup = CacheWarmup()
+        source = await warmup.load(
+            None, verb_repository, api_key_repository, snapshot_path
+        )
+
+        assert source == "stale snapshot"
+        assert caches[0].get_stats()["total_verbs"] == 2
+
+        await warmup._refresh_task
+        assert caches[0].get_stats()["total_verbs"] == 1
+        assert warmup.get_stats()["snapshot_version"] == 9
+        with CacheSnapshot(snapshot_path) as snapshot:
+            assert snapshot.cache_version == 9
+            assert snapshot.row_counts()["verbs"] == 1
+
+    async def test_missing_snapshot_is_written(
+        self, tmp_path, caches, database, monkeypatch
+    ):
+        set_database_version(monkeypatch, 3)
+        path = tmp_path / "cache.snapshot"
+
+        warmup = CacheWarmup()
+        source = await warmup.load(None, *database, path)
+
+        assert source == "database"
+        assert caches[0].get_stats()["total_verbs"] == 2
+        with CacheSnapshot(path) as snapshot:
+            assert snapshot.cache_version == 3
+            assert snapshot.row_counts() == {
+                "verbs": 2,
+                "conjugations": 2,
+                "api_keys": 2,
+            }
+
+    async def test_corrupt_snapshot_falls_back_to_database(
+        self, snapshot_path, caches, database, monkeypatch
+    ):
+        set_database_version(monkeypatch, 7)
+        snapshot_path.write_bytes(b"garbage")
+
+        source = await CacheWarmup().load(None, *database, snapshot_path)
+
+        assert source == "database"
+        assert caches[2].get_stats()["total_keys"] == 2
+        with CacheSnapshot(snapshot_path) as snapshot:
+            assert snapshot.cache_version == 7
+
+    async def test_api_keys_load_first(self, caches, database, monkeypatch):
+        order = []
+        for name, cache in zip(("verbs", "conjugations", "api_keys"), caches):
+
+            async def load(repository, name=name):
+                order.append(name)
+
+            monkeypatch.setattr(cache, "load", load)
+
+        await CacheWarmup().load(None, *database, None)
+
+        assert order[0] == "api_keys"
+        assert sorted(order[1:]) == ["conjugations", "verbs"]
+
+    async def test_disabled_without_path(self, caches, database, monkeypatch):
+        fetch_cache_version = AsyncMock()
+        monkeypatch.setattr(snapshot_module, "fetch_cache_version", fetch_cache_version)
+
+        source = await CacheWarmup().load(None, *database, None)
+
+        assert source == "database"
+        assert caches[0].get_stats()["loaded"] is True
+        fetch_cache_version.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBackgroundWarmup:
+    async def test_ready_once_hot_caches_load(self, caches, database):
+        warmup = CacheWarmup()
+        assert warmup.readiness()["ready"] is False
+
+        warmup.start(None, *database, None)
+        assert warmup.warming
+        await warmup._warmup_task
+
+        readiness = warmup.readiness()
+        assert readiness["ready"] is True
+        assert readiness["caches"] == {
+            "api_keys": True,
+            "verbs": True,
+            "conjugations": True,
+        }
+        assert warmup.get_stats()["source"] == "database"
+        assert not warmup.warming
+
+    async def test_retries_until_loaded(
+        self, caches, database, monkeypatch, sample_verbs
+    ):
+        monkeypatch.setattr(snapshot_module, "WARMUP_RETRY_SECONDS", 0)
+        verb_repository, api_key_repository = database
+        verb_repository.get_all_verbs = AsyncMock(
+            side_effect=[ConnectionError("database down"), sample_verbs]
+        )
+
+        warmup = CacheWarmup()
+        warmup.start(None, verb_repository, api_key_repository, None)
+        await warmup._warmup_task
+
+        assert verb_repository.get_all_verbs.await_count == 2
+        assert warmup.readiness()["ready"] is True
+        assert warmup.error is None
+
+    async def test_not_ready_while_failing(self, caches, database):
+        verb_repository, api_key_repository = database
+        verb_repository.get_all_verbs = AsyncMock(
+            side_effect=ConnectionError("database down")
+        )
+
+        warmup = CacheWarmup()
+        warmup.start(None, verb_repository, api_key_repository, None)
+        await asyncio.sleep(0.01)
+
+        readiness = warmup.readiness()
+        assert readiness["ready"] is False
+        assert readiness["caches"]["api_keys"] is True
+        assert readiness["warming"] is True
+        assert "database down" in readiness["error"]
+
+        await warmup.stop()
+        assert not warmup.warming
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCacheVersion:
+    async def test_advances_on_first_change(self, test_supabase_client):
+        """Every verb change, including the first, moves the version on."""
+        from src.repositories.verb_repository import VerbRepository
+        from src.schemas.verbs import VerbCreate
+        from tests.verbs.fixtures import generate_random_verb_data
+
+        before = await snapshot_module.fetch_cache_version(test_supabase_client)
+        await VerbRepository(client=test_supabase_client).create_verb(
+            VerbCreate(**generate_random_verb_data())
+        )
+        after = await snapshot_module.fetch_cache_version(test_supabase_client)
+
+        assert after > before
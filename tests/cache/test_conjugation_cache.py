@@ -5,12 +5,14 @@ from datetime import UTC, datetime, timezone
 import pytest
 
 from src.cache.conjugation_cache import ConjugationCache
+from src.cache.records import ConjugationRecord
 from src.schemas.verbs import (
     AuxiliaryType,
     Conjugation,
     Tense,
     Verb,
     VerbClassification,
+    VerbWithConjugations,
 )
 
 
@@ -270,6 +272,19 @@ class TestConjugationCache:
         )
         assert len(conjs) == 0
 
+    async def test_invalidate_conjugation(self, mock_repository):
+        """Should remove only the given tense for a verb."""
+        cache = ConjugationCache()
+        await cache.load(mock_repository)
+
+        await cache.invalidate_conjugation("parler", "avoir", False, Tense.PRESENT)
+
+        assert (
+            await cache.get_conjugation("parler", "avoir", False, Tense.PRESENT)
+        ) is None
+        conjs = await cache.get_conjugations_for_verb("parler", "avoir", False)
+        assert [c.tense for c in conjs] == [Tense.PASSE_COMPOSE]
+
     async def test_hit_rate_calculation(self, mock_repository):
         """Should calculate hit rate correctly."""
         cache = ConjugationCache()
@@ -285,16 +300,67 @@ class TestConjugationCache:
         assert stats["misses"] == 1
         assert stats["hit_rate"] == "66.67%"
 
-    async def test_cache_returns_copy(self, mock_repository):
-        """Should return a copy of list to prevent external modification."""
+    async def test_cache_returns_immutable_view(self, mock_repository):
+        """Should return a shared tuple that callers cannot modify."""
         cache = ConjugationCache()
         await cache.load(mock_repository)
 
         conjs1 = await cache.get_conjugations_for_verb("parler", "avoir", False)
         conjs2 = await cache.get_conjugations_for_verb("parler", "avoir", False)
 
-        # Modify one list
-        conjs1.append(None)
+        assert isinstance(conjs1, tuple)
+        assert conjs1 is conjs2
+        with pytest.raises(AttributeError):
+            conjs1.append(None)
+
+    async def test_refresh_keeps_tense_order(self, mock_repository):
+        """Replacing a tense should keep its position and update the view."""
+        cache = ConjugationCache()
+        await cache.load(mock_repository)
+
+        before = await cache.get_conjugations_for_verb("parler", "avoir", False)
+        updated = (
+            before[0]
+            .to_model()
+            .model_copy(update={"first_person_singular": "je parle bien"})
+        )
+        await cache.refresh_conjugation(updated)
+
+        after = await cache.get_conjugations_for_verb("parler", "avoir", False)
+        assert [c.tense for c in after] == [c.tense for c in before]
+        assert after[0].first_person_singular == "je parle bien"
+        assert before[0].first_person_singular != "je parle bien"
+
+    async def test_cache_holds_compact_records(
+        self, mock_repository, sample_conjugations
+    ):
+        """Cached rows should be slot records that materialize the same model."""
+        cache = ConjugationCache()
+        await cache.load(mock_repository)
+
+        record = await cache.get_conjugation("parler", "avoir", False, Tense.PRESENT)
+
+        assert isinstance(record, ConjugationRecord)
+        assert not hasattr(record, "__dict__")
+        assert record.to_model() == sample_conjugations[0]
+        assert record.model_dump() == sample_conjugations[0].model_dump()
+        assert record.forms[1] == "tu parles"
+
+    async def test_records_intern_strings(self, mock_repository):
+        """Infinitives are shared across tenses."""
+        cache = ConjugationCache()
+        await cache.load(mock_repository)
+
+        present, passe = await cache.get_conjugations_for_verb("parler", "avoir", False)
+        assert present.infinitive is passe.infinitive
+
+    async def test_records_validate_into_models(self, mock_repository, sample_verbs):
+        """Records can be passed where API models expect Conjugation."""
+        cache = ConjugationCache()
+        await cache.load(mock_repository)
+
+        conjs = await cache.get_conjugations_for_verb("parler", "avoir", False)
+        verb = VerbWithConjugations(**sample_verbs[0].model_dump(), conjugations=conjs)
 
-        # Other list should be unaffected
-        assert len(conjs2) == 2
+        assert all(isinstance(c, Conjugation) for c in verb.conjugations)
+        assert verb.conjugations[0].first_person_singular == "je parle"
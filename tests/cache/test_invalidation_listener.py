@@ -0,0 +1,249 @@
+"""Tests for LISTEN/NOTIFY driven cache invalidation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.cache.invalidation_listener import CacheInvalidationListener
+from src.schemas.verbs import Tense
+
+
+@pytest.fixture
+def caches():
+    """Mock verb, conjugation and API key caches."""
+    return AsyncMock(), AsyncMock(), AsyncMock()
+
+
+@pytest.fixture
+def repositories():
+    """Mock verb and API key repositories."""
+    return AsyncMock(), AsyncMock()
+
+
+@pytest.fixture
+def listener(caches, repositories):
+    """Listener wired to mocks, without a database connection."""
+    listener = CacheInvalidationListener(*caches)
+    listener._verb_repository, listener._api_key_repository = repositories
+    return listener
+
+
+def conjugation_row(tense: str = "present", infinitive: str = "parler") -> dict:
+    return {
+        "id": str(uuid4()),
+        "infinitive": infinitive,
+        "auxiliary": "avoir",
+        "reflexive": False,
+        "tense": tense,
+    }
+
+
+@pytest.mark.asyncio
+class TestApplyChanges:
+    """Test applying single row changes to the caches."""
+
+    async def test_verb_update_refreshes_from_repository(
+        self, listener, caches, repositories
+    ):
+        verb_cache, _, _ = caches
+        verb_repo, _ = repositories
+        verb_id = uuid4()
+        verb_repo.get_verb.return_value = "fresh verb"
+
+        await listener.apply(
+            {"table": "verbs", "op": "UPDATE", "new": {"id": str(verb_id)}}
+        )
+
+        verb_repo.get_verb.assert_awaited_once_with(verb_id)
+        verb_cache.refresh_verb.assert_awaited_once_with("fresh verb")
+
+    async def test_verb_delete_invalidates(self, listener, caches, repositories):
+        verb_cache, _, _ = caches
+        verb_repo, _ = repositories
+        verb_id = uuid4()
+
+        await listener.apply(
+            {"table": "verbs", "op": "DELETE", "old": {"id": str(verb_id)}}
+        )
+
+        verb_repo.get_verb.assert_not_awaited()
+        verb_cache.invalidate_verb.assert_awaited_once_with(verb_id)
+
+    async def test_missing_verb_row_invalidates(self, listener, caches, repositories):
+        verb_cache, _, _ = caches
+        verb_repo, _ = repositories
+        verb_repo.get_verb.return_value = None
+        verb_id = uuid4()
+
+        await listener.apply(
+            {"table": "verbs", "op": "INSERT", "new": {"id": str(verb_id)}}
+        )
+
+        verb_cache.invalidate_verb.assert_awaited_once_with(verb_id)
+
+    async def test_conjugation_insert_refreshes(self, listener, caches, repositories):
+        _, conjugation_cache, _ = caches
+        verb_repo, _ = repositories
+        verb_repo.get_conjugation.return_value = "fresh conjugation"
+
+        await listener.apply(
+            {"table": "conjugations", "op": "INSERT", "new": conjugation_row()}
+        )
+
+        verb_repo.get_conjugation.assert_awaited_once_with(
+            "parler", "avoir", False, Tense.PRESENT
+        )
+        conjugation_cache.refresh_conjugation.assert_awaited_once_with(
+            "fresh conjugation"
+        )
+        conjugation_cache.invalidate_conjugation.assert_not_awaited()
+
+    async def test_conjugation_rekey_drops_old_version(
+        self, listener, caches, repositories
+    ):
+        _, conjugation_cache, _ = caches
+        verb_repo, _ = repositories
+        verb_repo.get_conjugation.return_value = "fresh conjugation"
+
+        await listener.apply(
+            {
+                "table": "conjugations",
+                "op": "UPDATE",
+                "old": conjugation_row("present"),
+                "new": conjugation_row("passe_compose"),
+            }
+        )
+
+        conjugation_cache.invalidate_conjugation.assert_awaited_once_with(
+            "parler", "avoir", False, Tense.PRESENT
+        )
+        conjugation_cache.refresh_conjugation.assert_awaited_once()
+
+    async def test_conjugation_delete_invalidates(self, listener, caches):
+        _, conjugation_cache, _ = caches
+
+        await listener.apply(
+            {"table": "conjugations", "op": "DELETE", "old": conjugation_row()}
+        )
+
+        conjugation_cache.invalidate_conjugation.assert_awaited_once_with(
+            "parler", "avoir", False, Tense.PRESENT
+        )
+        conjugation_cache.refresh_conjugation.assert_not_awaited()
+
+    async def test_api_key_update_refreshes(self, listener, caches, repositories):
+        _, _, api_key_cache = caches
+        _, api_key_repo = repositories
+        key_id = uuid4()
+        api_key_repo.get_api_key.return_value = "revoked key"
+
+        await listener.apply(
+            {"table": "api_keys", "op": "UPDATE", "new": {"id": str(key_id)}}
+        )
+
+        api_key_cache.refresh_key.assert_awaited_once_with("revoked key")
+
+    async def test_api_key_delete_invalidates(self, listener, caches):
+        _, _, api_key_cache = caches
+        key_id = uuid4()
+
+        await listener.apply(
+            {"table": "api_keys", "op": "DELETE", "old": {"id": str(key_id)}}
+        )
+
+        api_key_cache.invalidate_key.assert_awaited_once_with(key_id)
+
+
+@pytest.mark.asyncio
+class TestResyncFallback:
+    """Test falling back to full reloads when changes may have been missed."""
+
+    async def _run_apply_loop(self, listener):
+        task = asyncio.create_task(listener._apply_loop())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    async def test_notifications_applied_in_order(self, listener, caches, repositories):
+        verb_cache, _, _ = caches
+        verb_repo, _ = repositories
+        verb_repo.get_verb.side_effect = ["first", "second"]
+
+        for _ in range(2):
+            listener._on_notification(
+                None,
+                1,
+                "cache_invalidation",
+                json.dumps(
+                    {"table": "verbs", "op": "UPDATE", "new": {"id": str(uuid4())}}
+                ),
+            )
+        await self._run_apply_loop(listener)
+
+        assert [c.args[0] for c in verb_cache.refresh_verb.await_args_list] == [
+            "first",
+            "second",
+        ]
+        assert listener.get_stats()["applied"] == 2
+
+    async def test_failed_change_triggers_resync(self, listener, caches, repositories):
+        verb_cache, conjugation_cache, api_key_cache = caches
+        verb_repo, api_key_repo = repositories
+        verb_repo.get_verb.side_effect = RuntimeError("db down")
+
+        listener._on_notification(
+            None,
+            1,
+            "cache_invalidation",
+            json.dumps({"table": "verbs", "op": "UPDATE", "new": {"id": str(uuid4())}}),
+        )
+        await self._run_apply_loop(listener)
+
+        verb_cache.reload.assert_awaited_once_with(verb_repo)
+        conjugation_cache.reload.assert_awaited_once_with(verb_repo)
+        api_key_cache.reload.assert_awaited_once_with(api_key_repo)
+        assert listener.get_stats()["failed"] == 1
+        assert listener.get_stats()["resyncs"] == 1
+
+    async def test_truncate_triggers_resync(self, listener, caches):
+        verb_cache, _, _ = caches
+
+        listener._on_notification(
+            None,
+            1,
+            "cache_invalidation",
+            json.dumps({"table": "verbs", "op": "TRUNCATE"}),
+        )
+        await self._run_apply_loop(listener)
+
+        verb_cache.reload.assert_awaited_once()
+
+    async def test_malformed_payload_triggers_resync(self, listener, caches):
+        verb_cache, _, _ = caches
+
+        listener._on_notification(None, 1, "cache_invalidation", "not json")
+        await self._run_apply_loop(listener)
+
+        verb_cache.reload.assert_awaited_once()
+
+    async def test_queue_overflow_resyncs_once(self, caches, repositories):
+        verb_cache, _, _ = caches
+        listener = CacheInvalidationListener(*caches, max_pending=2)
+        listener._verb_repository, listener._api_key_repository = repositories
+
+        for _ in range(5):
+            listener._on_notification(
+                None,
+                1,
+                "cache_invalidation",
+                json.dumps(
+                    {"table": "verbs", "op": "UPDATE", "new": {"id": str(uuid4())}}
+                ),
+            )
+        await self._run_apply_loop(listener)
+
+        verb_cache.reload.assert_awaited_once()
+        verb_cache.refresh_verb.assert_not_awaited()
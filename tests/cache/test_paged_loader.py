@@ -0,0 +1,164 @@
+"""Tests for paged cache loading."""
+
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from src.cache import paged_loader
+from src.cache.paged_loader import load_paged
+from src.core.exceptions import RepositoryError
+from src.repositories.pagination import UUID_SPACE, split_uuid_range
+
+
+class FakePagedTable:
+    """In-memory table answering keyset page and count queries."""
+
+    def __init__(self, size: int, max_rows: int | None = None):
+        self.rows = sorted(
+            (SimpleNamespace(id=uuid.uuid4()) for _ in range(size)),
+            key=lambda r: r.id,
+        )
+        self.max_rows = max_rows
+        self.page_calls = 0
+        self.count_offset = 0
+        self.failures = 0
+
+    async def fetch_page(self, after=None, until=None, limit=1000):
+        self.page_calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection reset")
+        if self.max_rows is not None:
+            limit = min(limit, self.max_rows)
+        rows = [
+            r
+            for r in self.rows
+            if (after is None or r.id > after) and (until is None or r.id <= until)
+        ]
+        return rows[:limit]
+
+    async def count(self):
+        return len(self.rows) + self.count_offset
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(paged_loader, "RETRY_DELAY_SECONDS", 0)
+
+
+@pytest.mark.unit
+class TestSplitUuidRange:
+    def test_single_range_is_unbounded(self):
+        assert split_uuid_range(1) == [(None, None)]
+
+    def test_ranges_are_contiguous(self):
+        ranges = split_uuid_range(4)
+
+        assert len(ranges) == 4
+        assert ranges[0][0] is None
+        assert ranges[-1][1] is None
+        for (_, until), (after, _) in zip(ranges, ranges[1:], strict=False):
+            assert until == after
+        assert ranges[1][0] == uuid.UUID(int=UUID_SPACE // 4)
+
+    def test_rejects_zero_parts(self):
+        with pytest.raises(ValueError):
+            split_uuid_range(0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLoadPaged:
+    async def test_loads_every_row_once(self):
+        table = FakePagedTable(250)
+
+        rows, stats = await load_paged(
+            "rows", table.fetch_page, table.count, page_size=20, parallelism=4
+        )
+
+        assert sorted(r.id for r in rows) == [r.id for r in table.rows]
+        assert stats["rows"] == 250
+        assert stats["pages"] == table.page_calls
+        assert stats["pages"] >= 250 // 20
+        assert stats["attempts"] == 1
+        assert stats["rows_per_second"] > 0
+        assert stats["pages_per_second"] > 0
+
+    async def test_empty_table(self):
+        table = FakePagedTable(0)
+
+        rows, stats = await load_paged(
+            "rows", table.fetch_page, table.count, page_size=10, parallelism=3
+        )
+
+        assert rows == []
+        assert stats["pages"] == 3
+
+    async def test_retries_transient_errors(self):
+        table = FakePagedTable(50)
+        table.failures = 1
+
+        rows, stats = await load_paged(
+            "rows",
+            table.fetch_page,
+            table.count,
+            page_size=10,
+            parallelism=2,
+            max_attempts=3,
+        )
+
+        assert len(rows) == 50
+        assert stats["attempts"] == 2
+
+    async def test_count_mismatch_fails_loudly(self):
+        table = FakePagedTable(50)
+        table.count_offset = 1
+
+        with pytest.raises(RepositoryError, match="count query returned 51"):
+            await load_paged(
+                "rows",
+                table.fetch_page,
+                table.count,
+                page_size=10,
+                parallelism=2,
+                max_attempts=2,
+            )
+
+    async def test_server_row_cap_is_detected(self):
+        """A page size above PostgREST max_rows must not silently truncate."""
+        table = FakePagedTable(50, max_rows=5)
+
+        with pytest.raises(RepositoryError, match="loaded 10 rows"):
+            await load_paged(
+                "rows",
+                table.fetch_page,
+                table.count,
+                page_size=10,
+                parallelism=2,
+                max_attempts=1,
+            )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCacheLoadPaged:
+    async def test_verb_cache_prefers_pages(self, monkeypatch):
+        from src.cache.verb_cache import VerbCache
+
+        verbs = FakePagedTable(0)
+
+        class PagedRepository:
+            get_verbs_page = verbs.fetch_page
+            count_verbs = verbs.count
+
+            async def get_all_verbs(self, limit=10000):
+                raise AssertionError("should not fall back to get_all_verbs")
+
+        cache = VerbCache()
+        await cache.load(PagedRepository())
+
+        stats = cache.get_stats()
+        assert stats["loaded"] is True
+        assert stats["last_load"]["rows"] == 0
+        assert stats["last_load"]["pages"] >= 1
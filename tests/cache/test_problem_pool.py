@@ -0,0 +1,194 @@
+"""Tests for the prefetched problem serving pool."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.cache.problem_pool import ProblemPool
+from src.schemas.problems import ProblemProjection
+
+
+class FakeProblemRepository:
+    """Claims stand-in problems with sequential integer ids."""
+
+    def __init__(self, available: int = 1000):
+        self.available = available
+        self.claims: list[int] = []
+        self.projections: list[ProblemProjection] = []
+        self._next = 0
+
+    async def claim_next_problems(
+        self, count: int = 1, projection: ProblemProjection = ProblemProjection.SERVING
+    ):
+        self.claims.append(count)
+        self.projections.append(projection)
+        count = min(count, self.available - self._next)
+        problems = [
+            SimpleNamespace(id=i) for i in range(self._next, self._next + count)
+        ]
+        self._next += count
+        return problems
+
+
+class SmallProblemRepository:
+    """A table of `available` problems: every claim returns all of them again."""
+
+    def __init__(self, available: int):
+        self.available = available
+        self.claims: list[int] = []
+
+    async def claim_next_problems(
+        self, count: int = 1, projection: ProblemProjection = ProblemProjection.SERVING
+    ):
+        self.claims.append(count)
+        return [SimpleNamespace(id=i) for i in range(min(count, self.available))]
+
+
+async def settle():
+    """Let the refiller run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def pool():
+    pool = ProblemPool(size=10, refill_batch=4, max_age=60.0)
+    yield pool
+    await pool.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProblemPool:
+    async def test_take_without_start_falls_through(self, pool):
+        assert pool.take() is None
+        assert pool.get_stats()["fallbacks"] == 0
+
+    async def test_refill_claims_batches_until_full(self, pool):
+        repository = FakeProblemRepository()
+        pool._repository = repository
+
+        assert await pool.refill() == 10
+        assert repository.claims == [4, 4, 2]
+        assert pool.depth == 10
+
+    async def test_refill_leaves_out_generation_trace(self, pool):
+        repository = FakeProblemRepository()
+        pool._repository = repository
+
+        await pool.refill()
+
+        assert set(repository.projections) == {ProblemProjection.SERVING}
+
+    async def test_refill_stops_on_short_batch(self, pool):
+        repository = FakeProblemRepository(available=5)
+        pool._repository = repository
+
+        assert await pool.refill() == 5
+        assert repository.claims == [4, 4]
+
+    async def test_refill_skips_problems_already_held(self, pool):
+        repository = SmallProblemRepository(available=3)
+        pool._repository = repository
+
+        assert await pool.refill() == 3
+        assert await pool.refill() == 0
+        assert [pooled.problem.id for pooled in pool._buffer] == [0, 1, 2]
+
+    async def test_small_table_does_not_refill_per_request(self, pool):
+        repository = SmallProblemRepository(available=3)
+        await pool.start(repository)
+        await settle()
+        assert repository.claims == [4]
+
+        served = []
+        for _ in range(5):
+            pooled = pool.take()
+            served.append(pooled.problem.id if pooled else None)
+            await settle()
+
+        assert served == [0, 1, 2, None, None]
+        assert repository.claims == [4]
+
+    async def test_serves_in_claim_order(self, pool):
+        await pool.start(FakeProblemRepository())
+        await settle()
+
+        assert [pool.take().problem.id for _ in range(3)] == [0, 1, 2]
+        assert pool.get_stats()["served"] == 3
+
+    async def test_refills_below_low_water(self, pool):
+        repository = FakeProblemRepository()
+        await pool.start(repository)
+        await settle()
+
+        # Down to 5 of 10 (not below half): no refill yet
+        for _ in range(5):
+            pool.take()
+        await settle()
+        assert pool.depth == 5
+
+        pool.take()
+        await settle()
+        assert pool.depth == 10
+        assert repository.claims == [4, 4, 2, 4, 2]
+
+    async def test_falls_back_when_empty(self, pool):
+        await pool.start(FakeProblemRepository(available=0))
+        await settle()
+
+        assert pool.take() is None
+        stats = pool.get_stats()
+        assert stats["fallbacks"] == 1
+        assert stats["served_rate"] == "0.00%"
+
+    async def test_drops_stale_problems(self, pool):
+        await pool.start(FakeProblemRepository(available=10))
+        await settle()
+
+        # Age the first half past max_age
+        for i in range(5):
+            pool._buffer[i].claimed_at -= 61
+
+        assert pool.take().problem.id == 5
+        assert pool.get_stats()["expired"] == 5
+
+    async def test_renders_payload_on_refill(self, pool):
+        pool.render = lambda problem: f"problem {problem.id}".encode()
+        await pool.start(FakeProblemRepository())
+        await settle()
+
+        assert pool.take().payload == b"problem 0"
+
+    async def test_render_error_leaves_payload_unset(self, pool):
+        def render(problem):
+            raise ValueError("bad problem")
+
+        pool.render = render
+        await pool.start(FakeProblemRepository())
+        await settle()
+
+        pooled = pool.take()
+        assert pooled.problem.id == 0
+        assert pooled.payload is None
+        assert pool.get_stats()["render_errors"] == 10
+
+    async def test_failed_refill_is_counted(self, pool):
+        repository = AsyncMock()
+        repository.claim_next_problems.side_effect = ConnectionError("down")
+        pool._repository = repository
+
+        assert await pool.refill() == 0
+        assert pool.get_stats()["failed_refills"] == 1
+
+    async def test_stop_drops_pool(self, pool):
+        await pool.start(FakeProblemRepository())
+        await settle()
+
+        await pool.stop()
+
+        assert not pool.running
+        assert pool.depth == 0
+        assert pool.take() is None
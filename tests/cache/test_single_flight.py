@@ -0,0 +1,217 @@
+"""Tests for single-flight load coalescing."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.cache.conjugation_cache import ConjugationCache
+from src.cache.single_flight import SingleFlight
+from src.cache.verb_cache import VerbCache
+from src.core.exceptions import ServiceUnavailableError
+from src.schemas.verbs import AuxiliaryType, Verb
+from src.services.verb_service import VerbService
+
+
+class SlowLoad:
+    """Load function that counts calls and finishes when released."""
+
+    def __init__(self, result=None, error: Exception | None = None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+async def settle():
+    """Let pending tasks run up to their next suspension point."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_load(self):
+        flight = SingleFlight("test")
+        load = SlowLoad(result=["row"])
+
+        callers = [asyncio.create_task(flight.do("key", load)) for _ in range(5)]
+        await settle()
+        assert flight.get_stats()["in_flight"] == 1
+        load.release.set()
+        results = await asyncio.gather(*callers)
+
+        assert load.calls == 1
+        assert all(r is results[0] for r in results)
+        stats = flight.get_stats()
+        assert stats["loads"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["in_flight"] == 0
+        assert stats["coalesced_rate"] == "80.00%"
+
+    async def test_different_keys_load_separately(self):
+        flight = SingleFlight("test")
+        load_a, load_b = SlowLoad(result="a"), SlowLoad(result="b")
+
+        callers = [
+            asyncio.create_task(flight.do("a", load_a)),
+            asyncio.create_task(flight.do("b", load_b)),
+        ]
+        await settle()
+        load_a.release.set()
+        load_b.release.set()
+
+        assert await asyncio.gather(*callers) == ["a", "b"]
+        assert flight.get_stats()["coalesced"] == 0
+
+    async def test_finished_loads_are_not_remembered(self):
+        flight = SingleFlight("test")
+        load = SlowLoad(result="value")
+        load.release.set()
+
+        await flight.do("key", load)
+        await flight.do("key", load)
+
+        assert load.calls == 2
+
+    async def test_errors_reach_every_waiter(self):
+        flight = SingleFlight("test")
+        load = SlowLoad(error=ConnectionError("database down"))
+
+        callers = [asyncio.create_task(flight.do("key", load)) for _ in range(3)]
+        await settle()
+        load.release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert load.calls == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert flight.get_stats()["errors"] == 1
+        assert flight.get_stats()["in_flight"] == 0
+
+    async def test_rejects_loads_beyond_bound(self):
+        flight = SingleFlight("test", max_in_flight=1)
+        load_a, load_b = SlowLoad(result="a"), SlowLoad(result="b")
+
+        first = asyncio.create_task(flight.do("a", load_a))
+        same_key = asyncio.create_task(flight.do("a", load_a))
+        await settle()
+        with pytest.raises(ServiceUnavailableError) as exc_info:
+            await flight.do("b", load_b)
+        load_a.release.set()
+
+        assert await asyncio.gather(first, same_key) == ["a", "a"]
+        assert exc_info.value.retry_after == 1
+        assert load_b.calls == 0
+        assert flight.get_stats()["rejected"] == 1
+
+        # Capacity is back once the load finishes
+        load_b.release.set()
+        assert await flight.do("b", load_b) == "b"
+
+    async def test_cancelled_waiter_does_not_cancel_load(self):
+        flight = SingleFlight("test")
+        load = SlowLoad(result="value")
+
+        first = asyncio.create_task(flight.do("key", load))
+        second = asyncio.create_task(flight.do("key", load))
+        await settle()
+        first.cancel()
+        await settle()
+        load.release.set()
+
+        assert await second == "value"
+        assert first.cancelled()
+
+
+@pytest.fixture
+def sample_verb():
+    """Create a sample verb for testing."""
+    now = datetime.now(UTC)
+    return Verb(
+        id=uuid4(),
+        infinitive="parler",
+        auxiliary=AuxiliaryType.AVOIR,
+        reflexive=False,
+        target_language_code="eng",
+        translation="to speak",
+        past_participle="parlé",
+        present_participle="parlant",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVerbServiceCoalescing:
+    """Concurrent cache misses in VerbService should query the database once."""
+
+    @pytest.fixture(autouse=True)
+    def empty_caches(self):
+        with (
+            patch("src.services.verb_service.verb_cache", VerbCache()),
+            patch("src.services.verb_service.conjugation_cache", ConjugationCache()),
+            patch(
+                "src.services.verb_service.verb_loads", SingleFlight("verbs")
+            ) as verb_loads,
+            patch(
+                "src.services.verb_service.conjugation_loads",
+                SingleFlight("conjugations"),
+            ) as conjugation_loads,
+        ):
+            yield verb_loads, conjugation_loads
+
+    @staticmethod
+    def slow(result):
+        async def query(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return result
+
+        return AsyncMock(side_effect=query)
+
+    async def test_get_verb(self, sample_verb, empty_caches):
+        repo = MagicMock()
+        repo.get_verb = self.slow(sample_verb)
+        service = VerbService(llm_client=MagicMock(), verb_repository=repo)
+
+        verbs = await asyncio.gather(
+            *(service.get_verb(sample_verb.id) for _ in range(10))
+        )
+
+        assert all(v == sample_verb for v in verbs)
+        repo.get_verb.assert_awaited_once()
+        assert empty_caches[0].get_stats()["coalesced"] == 9
+
+    async def test_get_verb_by_infinitive(self, sample_verb):
+        repo = MagicMock()
+        repo.get_verb_by_infinitive = self.slow(sample_verb)
+        service = VerbService(llm_client=MagicMock(), verb_repository=repo)
+
+        await asyncio.gather(
+            *(service.get_verb_by_infinitive("parler") for _ in range(5)),
+            service.get_verb_by_infinitive("parler", target_language_code="fra"),
+        )
+
+        assert repo.get_verb_by_infinitive.await_count == 2
+
+    async def test_get_conjugations(self, empty_caches):
+        repo = MagicMock()
+        repo.get_conjugations = self.slow([])
+        service = VerbService(llm_client=MagicMock(), verb_repository=repo)
+
+        await asyncio.gather(
+            *(service.get_conjugations("parler", "avoir", False) for _ in range(5))
+        )
+
+        repo.get_conjugations.assert_awaited_once()
+        assert empty_caches[1].get_stats()["coalesced"] == 4
@@ -1,9 +1,11 @@
 """Tests for VerbCache."""
 
+import asyncio
 from datetime import UTC, datetime, timezone
 
 import pytest
 
+from src.cache import paged_loader
 from src.cache.verb_cache import VerbCache
 from src.schemas.verbs import AuxiliaryType, Verb, VerbClassification
 
@@ -346,3 +348,224 @@ class TestVerbCache:
         # Should have gotten different verbs (with high probability)
         # With 3 verbs and 20 selections, we should see at least 2 different ones
         assert len(selected_verbs) >= 2
+
+    async def test_get_random_verb_excludes_test_verbs(
+        self, mock_repository, sample_verbs
+    ):
+        """Test verbs should never be selected."""
+        for verb in sample_verbs[1:]:
+            verb.is_test = True
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        for _ in range(20):
+            verb = await cache.get_random_verb("eng")
+            assert verb.infinitive == "parler"
+
+    async def test_get_random_verb_requires_cod_coi(self, mock_repository):
+        """Should only select verbs supporting the required objects."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        for flags in [(True, False), (False, True), (True, True)]:
+            verb = await cache.get_random_verb("eng", *flags)
+            assert verb.infinitive == "parler"
+
+    async def test_get_random_verb_after_invalidate(
+        self, mock_repository, sample_verbs
+    ):
+        """Invalidated verbs should leave the random selection pools."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        await cache.invalidate_verb(sample_verbs[0].id)
+
+        assert await cache.get_random_verb("eng", requires_cod=True) is None
+        for _ in range(20):
+            verb = await cache.get_random_verb("eng")
+            assert verb.infinitive in ("être", "se laver")
+
+    async def test_get_random_verb_duplicate_row(self, mock_repository, sample_verbs):
+        """A verb loaded twice holds one slot and leaves the pools in one removal."""
+        sample_verbs.append(sample_verbs[0])
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        pool = cache._indexes.random_pools[("eng", True, True)]
+        assert [v.id for v in pool.verbs] == [sample_verbs[0].id]
+
+        await cache.invalidate_verb(sample_verbs[0].id)
+
+        assert await cache.get_random_verb("eng", requires_cod=True) is None
+        for _ in range(20):
+            verb = await cache.get_random_verb("eng")
+            assert verb.infinitive in ("être", "se laver")
+
+    async def test_get_random_verb_after_refresh(self, mock_repository, sample_verbs):
+        """Refreshed verbs should move between random selection pools."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        updated = sample_verbs[1].model_copy(update={"can_have_cod": True})
+        await cache.refresh_verb(updated)
+        selected = {
+            (await cache.get_random_verb("eng", requires_cod=True)).infinitive
+            for _ in range(30)
+        }
+        assert selected == {"parler", "être"}
+
+        updated = sample_verbs[0].model_copy(update={"is_test": True})
+        await cache.refresh_verb(updated)
+        for _ in range(20):
+            verb = await cache.get_random_verb("eng", requires_cod=True)
+            assert verb.infinitive == "être"
+
+    async def test_get_by_infinitive_simple(self, mock_repository, sample_verbs):
+        """Should find verbs by infinitive alone."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        verb = await cache.get_by_infinitive_simple("parler")
+        assert verb.id == sample_verbs[0].id
+
+        assert await cache.get_by_infinitive_simple("se parler") is None
+        assert await cache.get_by_infinitive_simple("parler", "fra") is None
+        assert await cache.get_by_infinitive_simple("Parler") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    async def test_get_by_infinitive_simple_reflexive(
+        self, mock_repository, sample_verbs
+    ):
+        """The "se " prefix should select the reflexive form."""
+        reflexive = sample_verbs[0].model_copy(
+            update={
+                "id": "00000000-0000-0000-0000-000000000004",
+                "reflexive": True,
+                "auxiliary": AuxiliaryType.ETRE,
+            }
+        )
+        sample_verbs.append(reflexive)
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        assert (await cache.get_by_infinitive_simple("parler")).reflexive is False
+        assert (await cache.get_by_infinitive_simple("se parler")).id == reflexive.id
+
+    async def test_get_by_infinitive_simple_prefers_newest(
+        self, mock_repository, sample_verbs
+    ):
+        """Variants sharing an infinitive resolve to the newest, like the database."""
+        older = sample_verbs[0].model_copy(
+            update={
+                "id": "ffffffff-0000-0000-0000-000000000004",
+                "auxiliary": AuxiliaryType.ETRE,
+                "created_at": datetime(2020, 1, 1, tzinfo=UTC),
+            }
+        )
+        sample_verbs.insert(0, older)
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        assert (await cache.get_by_infinitive_simple("parler")).id == sample_verbs[1].id
+
+        # A newer variant refreshed in later takes over
+        newer = older.model_copy(
+            update={
+                "id": "00000000-0000-0000-0000-000000000005",
+                "created_at": datetime.now(UTC),
+            }
+        )
+        await cache.refresh_verb(newer)
+        assert (await cache.get_by_infinitive_simple("parler")).id == newer.id
+
+    async def test_get_all_by_language_sorted_by_infinitive(
+        self, mock_repository, sample_verbs
+    ):
+        """Verbs are listed by infinitive whatever order the pages arrive in."""
+        sample_verbs.reverse()
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        infinitives = [v.infinitive for v in await cache.get_all_by_language("eng")]
+        assert infinitives == sorted(infinitives)
+
+    async def test_get_by_infinitive_simple_after_invalidate(
+        self, mock_repository, sample_verbs
+    ):
+        """Invalidated verbs should no longer be found by infinitive."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        await cache.invalidate_verb(sample_verbs[0].id)
+
+        assert await cache.get_by_infinitive_simple("parler") is None
+        assert len(await cache.get_all_by_language("eng")) == 2
+
+    async def test_get_by_infinitive_simple_after_rename(
+        self, mock_repository, sample_verbs
+    ):
+        """Refreshing a verb with a new infinitive should re-key it."""
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        renamed = sample_verbs[0].model_copy(update={"infinitive": "causer"})
+        await cache.refresh_verb(renamed)
+
+        assert await cache.get_by_infinitive_simple("parler") is None
+        assert (await cache.get_by_infinitive_simple("causer")).id == renamed.id
+
+    async def test_get_by_infinitive_simple_is_accent_sensitive(
+        self, mock_repository, sample_verbs
+    ):
+        """Infinitives differing only in accents are distinct verbs."""
+        now = datetime.now(UTC)
+        for verb_id, infinitive in [
+            ("00000000-0000-0000-0000-000000000005", "pécher"),
+            ("00000000-0000-0000-0000-000000000006", "pêcher"),
+        ]:
+            sample_verbs.append(
+                sample_verbs[0].model_copy(
+                    update={
+                        "id": verb_id,
+                        "infinitive": infinitive,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+            )
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        assert (await cache.get_by_infinitive_simple("pécher")).infinitive == "pécher"
+        assert (await cache.get_by_infinitive_simple("pêcher")).infinitive == "pêcher"
+        assert await cache.get_by_infinitive_simple("pecher") is None
+
+    async def test_reload_swaps_generation(
+        self, mock_repository, sample_verbs, monkeypatch
+    ):
+        """Reads during a reload should see the previous cache in full."""
+        monkeypatch.setattr(paged_loader, "INDEX_BATCH_SIZE", 1)
+        cache = VerbCache()
+        await cache.load(mock_repository)
+
+        renamed = sample_verbs[1].model_copy(update={"translation": "to exist"})
+
+        class NewRepository:
+            async def get_all_verbs(self, limit=10000):
+                return [renamed]
+
+        reload = asyncio.create_task(cache.reload(NewRepository()))
+        seen = set()
+        while not reload.done():
+            verb = await cache.get_by_id(sample_verbs[1].id)
+            seen.add(verb.translation)
+            assert cache.get_stats()["total_verbs"] == len(sample_verbs)
+            await asyncio.sleep(0)
+        await reload
+
+        assert seen == {"to be"}
+        assert cache.get_stats()["total_verbs"] == 1
+        assert (await cache.get_by_id(sample_verbs[1].id)).translation == "to exist"
@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from asyncclick.testing import CliRunner
 
-from src.cli.cache.commands import cache_stats, reload_cache
+from src.cache.snapshot import write_snapshot
+from src.cli.cache.commands import (
+    cache_stats,
+    reload_cache,
+    snapshot_build,
+    snapshot_inspect,
+)
 
 
 @pytest.fixture
@@ -254,3 +260,93 @@ class TestReloadCache:
         mock_verb_cache.reload.assert_called_once()
         mock_conj_cache.reload.assert_called_once()
         mock_api_cache.reload.assert_called_once()
+
+
+@pytest.mark.unit
+class TestCacheSnapshot:
+    """Test cache snapshot commands."""
+
+    @patch("src.cli.cache.commands.save_snapshot")
+    @patch("src.cli.cache.commands.fetch_cache_version")
+    @patch("src.cli.cache.commands.get_supabase_client")
+    @patch("src.cli.cache.commands.api_key_cache")
+    @patch("src.cli.cache.commands.conjugation_cache")
+    @patch("src.cli.cache.commands.verb_cache")
+    @patch("src.cli.cache.commands.VerbRepository")
+    @patch("src.cli.cache.commands.ApiKeyRepository")
+    async def test_build_stamps_version_before_loading(
+        self,
+        mock_api_repo_class,
+        mock_verb_repo_class,
+        mock_verb_cache,
+        mock_conj_cache,
+        mock_api_cache,
+        mock_get_client,
+        mock_fetch_version,
+        mock_save,
+        tmp_path,
+    ):
+        """Test that build loads all caches and saves them with the version."""
+        calls = []
+        mock_get_client.return_value = MagicMock()
+        mock_fetch_version.side_effect = lambda client: calls.append("version") or 12
+        mock_verb_cache.load = AsyncMock(side_effect=lambda repo: calls.append("load"))
+        mock_conj_cache.load = AsyncMock()
+        mock_api_cache.load = AsyncMock()
+        mock_save.return_value = {
+            "path": str(tmp_path / "cache.snapshot"),
+            "cache_version": 12,
+            "bytes": 2048,
+            "rows": {"verbs": 100, "conjugations": 900, "api_keys": 3},
+        }
+
+        runner = CliRunner()
+        result = await runner.invoke(
+            snapshot_build, ["--path", str(tmp_path / "cache.snapshot")]
+        )
+
+        assert result.exit_code == 0
+        assert calls == ["version", "load"]
+        mock_save.assert_called_once_with(str(tmp_path / "cache.snapshot"), 12)
+        assert "Cache Version: 12" in result.output
+        assert "900" in result.output
+
+    async def test_inspect_shows_stamp_and_rows(self, tmp_path):
+        """Test that inspect prints the snapshot header."""
+        path = tmp_path / "cache.snapshot"
+        write_snapshot(path, 5, [], [], [])
+
+        runner = CliRunner()
+        result = await runner.invoke(
+            snapshot_inspect, ["--path", str(path), "--no-check"]
+        )
+
+        assert result.exit_code == 0
+        assert "Cache Version: 5" in result.output
+        assert "verbs:" in result.output
+
+    @patch("src.cli.cache.commands.fetch_cache_version")
+    @patch("src.cli.cache.commands.get_supabase_client")
+    async def test_inspect_reports_stale(
+        self, mock_get_client, mock_fetch_version, tmp_path
+    ):
+        """Test that inspect compares the stamp with the database."""
+        path = tmp_path / "cache.snapshot"
+        write_snapshot(path, 5, [], [], [])
+        mock_fetch_version.return_value = 8
+
+        runner = CliRunner()
+        result = await runner.invoke(snapshot_inspect, ["--path", str(path)])
+
+        assert result.exit_code == 0
+        assert "stale (database: 8)" in result.output
+
+    async def test_inspect_missing_file(self, tmp_path):
+        """Test that inspect reports a missing snapshot."""
+        runner = CliRunner()
+        result = await runner.invoke(
+            snapshot_inspect, ["--path", str(tmp_path / "missing"), "--no-check"]
+        )
+
+        assert result.exit_code == 0
+        assert "No snapshot" in result.output
@@ -0,0 +1,61 @@
+"""Tests for the pooled Supabase client."""
+
+import asyncio
+
+import pytest
+
+from src.clients.supabase import close_supabase_client, get_supabase_client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPooledSupabaseClient:
+    """Test per-event-loop Supabase client pooling."""
+
+    async def test_reuses_client_on_same_loop(self):
+        """Repeated calls on one loop should return the same client."""
+        try:
+            first = await get_supabase_client()
+            second = await get_supabase_client()
+            assert first is second
+        finally:
+            await close_supabase_client()
+
+    async def test_uses_shared_http_client(self):
+        """The client should be built on the tuned shared httpx pool."""
+        from src.clients.supabase import _clients
+
+        try:
+            client = await get_supabase_client()
+            pooled = _clients[asyncio.get_running_loop()]
+            assert client.options.httpx_client is pooled.http_client
+        finally:
+            await close_supabase_client()
+
+    async def test_close_releases_client(self):
+        """Closing should drop the client so the next call builds a new one."""
+        first = await get_supabase_client()
+        await close_supabase_client()
+        try:
+            second = await get_supabase_client()
+            assert second is not first
+        finally:
+            await close_supabase_client()
+
+    async def test_close_without_client_is_noop(self):
+        """Closing when nothing was created should not fail."""
+        await close_supabase_client()
+
+    async def test_settings_change_rebuilds_client(self, monkeypatch):
+        """A changed SUPABASE_URL should rebuild the pooled client."""
+        from src.core.config import get_settings
+
+        try:
+            first = await get_supabase_client()
+            monkeypatch.setattr(
+                get_settings(), "supabase_url", "http://127.0.0.1:54322"
+            )
+            second = await get_supabase_client()
+            assert second is not first
+        finally:
+            await close_supabase_client()
@@ -0,0 +1,79 @@
+"""Tests for the bounded password-hash executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.core.exceptions import ServiceUnavailableError
+from src.core.hashing import HashExecutor
+from src.schemas.api_keys import hash_api_key, verify_api_key
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHashExecutor:
+    """Test the HashExecutor."""
+
+    async def test_run_returns_result(self):
+        """Should run work on the pool and return its result."""
+        executor = HashExecutor(max_workers=2, max_queue=2)
+        try:
+            result = await executor.run(lambda a, b: a + b, 2, 3)
+            assert result == 5
+            assert executor.get_stats()["completed"] == 1
+            assert executor.in_flight == 0
+        finally:
+            executor.shutdown()
+
+    async def test_runs_off_event_loop_thread(self):
+        """Work should execute on a worker thread, not the loop thread."""
+        executor = HashExecutor(max_workers=1, max_queue=0)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+            assert thread_name.startswith("hash-worker")
+        finally:
+            executor.shutdown()
+
+    async def test_verify_bcrypt_on_pool(self):
+        """Should verify a bcrypt hash on the pool."""
+        executor = HashExecutor(max_workers=1, max_queue=1)
+        try:
+            hashed = await executor.run(hash_api_key, "sk_live_test")
+            assert await executor.run(verify_api_key, "sk_live_test", hashed) is True
+            assert await executor.run(verify_api_key, "sk_live_nope", hashed) is False
+        finally:
+            executor.shutdown()
+
+    async def test_rejects_when_saturated(self):
+        """Should fast-reject once workers and queue are full."""
+        executor = HashExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            running = asyncio.ensure_future(executor.run(release.wait, 5))
+            queued = asyncio.ensure_future(executor.run(release.wait, 5))
+            await asyncio.sleep(0)
+
+            assert executor.in_flight == 2
+            assert executor.queue_depth == 1
+
+            with pytest.raises(ServiceUnavailableError) as exc_info:
+                await executor.run(release.wait, 5)
+            assert exc_info.value.status_code == 503
+            assert exc_info.value.retry_after == 1
+            assert executor.get_stats()["rejected"] == 1
+
+            release.set()
+            await asyncio.gather(running, queued)
+            assert executor.in_flight == 0
+            assert executor.queue_depth == 0
+        finally:
+            release.set()
+            executor.shutdown()
+
+    async def test_invalid_configuration(self):
+        """Should reject nonsensical pool sizes."""
+        with pytest.raises(ValueError):
+            HashExecutor(max_workers=0, max_queue=1)
+        with pytest.raises(ValueError):
+            HashExecutor(max_workers=1, max_queue=-1)
@@ -0,0 +1,55 @@
+"""Tests for precompiled path rules."""
+
+import pytest
+
+from src.core.path_matching import PathPrefixMatcher
+
+
+@pytest.mark.unit
+class TestPathPrefixMatcher:
+    """Test prefix trie matching against str.startswith semantics."""
+
+    def test_matches_prefixes(self):
+        matcher = PathPrefixMatcher(["/health", "/metrics"])
+
+        assert matcher.matches("/health") is True
+        assert matcher.matches("/health/ready") is True
+        assert matcher.matches("/healthz") is True
+        assert matcher.matches("/metrics") is True
+        assert matcher.matches("/heal") is False
+        assert matcher.matches("/api/v1/problems") is False
+        assert matcher.matches("") is False
+
+    def test_exact_rules_do_not_match_as_prefix(self):
+        matcher = PathPrefixMatcher(["/health"], exact=["/"])
+
+        assert matcher.matches("/") is True
+        assert matcher.matches("/api") is False
+
+    def test_root_prefix_matches_everything(self):
+        matcher = PathPrefixMatcher(["/"])
+
+        assert matcher.matches("/") is True
+        assert matcher.matches("/api/v1/verbs") is True
+
+    def test_overlapping_prefixes(self):
+        matcher = PathPrefixMatcher(["/docs", "/docs/oauth2-redirect", "/do"])
+
+        assert matcher.matches("/do") is True
+        assert matcher.matches("/docs") is True
+        assert matcher.matches("/d") is False
+
+    def test_empty_rules_match_nothing(self):
+        matcher = PathPrefixMatcher([])
+
+        assert matcher.matches("/") is False
+
+    @pytest.mark.parametrize(
+        "path",
+        ["/", "/api/v1/problems/random", "/api/v1/verbs", "/docs", "/openapi.json"],
+    )
+    def test_agrees_with_startswith(self, path):
+        rules = ["/api/v1/problems/random", "/health", "/docs", "/openapi.json"]
+        matcher = PathPrefixMatcher(rules)
+
+        assert matcher.matches(path) == any(path.startswith(r) for r in rules)
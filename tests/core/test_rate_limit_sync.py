@@ -0,0 +1,178 @@
+"""Tests for cluster-wide rate limit synchronization."""
+
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from limits import parse
+from limits.strategies import FixedWindowRateLimiter
+
+from src.core.rate_limit_sync import (
+    InMemoryRateLimitStore,
+    PostgresRateLimitStore,
+    RateLimitSync,
+    SyncedMemoryStorage,
+)
+from src.core.rate_limiting import ApiKeyRateLimiter
+
+
+def make_node(store_sources: dict, node_id: str) -> RateLimitSync:
+    """Create an unstarted coordinator with the given sources."""
+    sync = RateLimitSync()
+    sync.node_id = node_id
+    for namespace, source in store_sources.items():
+        sync.register(namespace, source)
+    return sync
+
+
+@pytest.mark.asyncio
+class TestInMemoryRateLimitStore:
+    """Test the local stand-in store."""
+
+    async def test_deltas_reach_other_nodes_only(self):
+        store = InMemoryRateLimitStore()
+        await store.exchange("a", {})
+        await store.exchange("b", {})
+
+        assert await store.exchange("a", {"k": (3, 60.0)}) == {}
+        assert await store.exchange("b", {"k": (1, 60.0)}) == {"k": (3, 60.0)}
+        assert await store.exchange("a", {}) == {"k": (1, 60.0)}
+        assert await store.exchange("b", {}) == {}
+
+    async def test_deltas_are_summed(self):
+        store = InMemoryRateLimitStore()
+        await store.exchange("b", {})
+        await store.exchange("a", {"k": (2, 60.0)})
+        await store.exchange("a", {"k": (5, 60.0)})
+
+        assert await store.exchange("b", {}) == {"k": (7, 60.0)}
+
+
+@pytest.mark.asyncio
+class TestRateLimitSync:
+    """Test exchanging limiter state between coordinators."""
+
+    async def test_api_key_buckets_share_consumption(self):
+        store = InMemoryRateLimitStore()
+        key_id = uuid4()
+        limiter_a, limiter_b = ApiKeyRateLimiter(), ApiKeyRateLimiter()
+        limiter_a.enable_sync()
+        limiter_b.enable_sync()
+        node_a = make_node({"api_key": limiter_a}, "a")
+        node_b = make_node({"api_key": limiter_b}, "b")
+        node_a._store = node_b._store = store
+
+        await node_a.sync_once()
+        await node_b.sync_once()
+
+        limiter_b.acquire(key_id, 10)
+        for _ in range(8):
+            limiter_a.acquire(key_id, 10)
+
+        await node_a.sync_once()
+        await node_b.sync_once()
+
+        # 1 local + 8 remote requests leave about one of ten
+        assert limiter_b.acquire(key_id, 10).allowed is True
+        assert limiter_b.acquire(key_id, 10).allowed is False
+
+    async def test_ip_counters_share_consumption(self):
+        store = InMemoryRateLimitStore()
+        storage_a, storage_b = SyncedMemoryStorage(), SyncedMemoryStorage()
+        node_a = make_node({"ip": storage_a}, "a")
+        node_b = make_node({"ip": storage_b}, "b")
+        node_a._store = node_b._store = store
+        await node_a.sync_once()
+        await node_b.sync_once()
+
+        item = parse("3/minute")
+        hits_a = FixedWindowRateLimiter(storage_a)
+        hits_b = FixedWindowRateLimiter(storage_b)
+        assert hits_a.hit(item, "203.0.113.7") is True
+        assert hits_a.hit(item, "203.0.113.7") is True
+
+        await node_a.sync_once()
+        await node_b.sync_once()
+
+        assert hits_b.hit(item, "203.0.113.7") is True
+        assert hits_b.hit(item, "203.0.113.7") is False
+
+    async def test_remote_updates_are_not_republished(self):
+        store = InMemoryRateLimitStore()
+        storage_a, storage_b = SyncedMemoryStorage(), SyncedMemoryStorage()
+        node_a = make_node({"ip": storage_a}, "a")
+        node_b = make_node({"ip": storage_b}, "b")
+        node_a._store = node_b._store = store
+        await node_a.sync_once()
+        await node_b.sync_once()
+
+        storage_a.incr("key", 60, 2)
+        await node_a.sync_once()
+        await node_b.sync_once()
+        await node_b.sync_once()
+
+        assert await node_a.sync_once() == 0
+        assert storage_a.get("key") == 2
+        assert storage_b.get("key") == 2
+
+    async def test_failed_exchange_resends_deltas(self):
+        limiter = ApiKeyRateLimiter()
+        limiter.enable_sync()
+        key_id = uuid4()
+        limiter.acquire(key_id, 10)
+
+        store = MagicMock()
+        store.exchange = AsyncMock(side_effect=[RuntimeError("db down"), {}])
+        node = make_node({"api_key": limiter}, "a")
+        node._store = store
+
+        assert await node.sync_once() == 0
+        limiter.acquire(key_id, 10)
+        await node.sync_once()
+
+        sent = store.exchange.await_args_list[1].args[1]
+        assert sent == {f"api_key:{key_id}": (2, 60.0)}
+        assert node.get_stats()["failed_syncs"] == 1
+
+    async def test_start_and_stop(self):
+        store = InMemoryRateLimitStore()
+        node = make_node({}, "a")
+
+        await node.start(store, interval=0.01)
+        assert node.running is True
+        await node.stop()
+        assert node.running is False
+
+
+@pytest.mark.asyncio
+class TestPostgresRateLimitStore:
+    """Test the Postgres-backed store against a mocked RPC."""
+
+    async def test_exchange_sends_deltas_and_tracks_cursor(self):
+        client = MagicMock()
+        client.rpc.return_value.execute = AsyncMock(
+            side_effect=[
+                MagicMock(data={"cursor": 10, "deltas": []}),
+                MagicMock(
+                    data={
+                        "cursor": 15,
+                        "deltas": [{"bucket_key": "ip:k", "amount": 4, "expiry": 60}],
+                    }
+                ),
+            ]
+        )
+        store = PostgresRateLimitStore(client)
+
+        assert await store.exchange("a", {"ip:k": (1, 60.0)}) == {}
+        assert await store.exchange("a", {}) == {"ip:k": (4, 60.0)}
+
+        first, second = client.rpc.call_args_list
+        assert first.args == (
+            "exchange_rate_limit_deltas",
+            {
+                "p_node_id": "a",
+                "p_after_id": None,
+                "p_deltas": [{"bucket_key": "ip:k", "amount": 1, "expiry": 60.0}],
+            },
+        )
+        assert second.args[1]["p_after_id"] == 10
@@ -0,0 +1,121 @@
+"""Tests for per-API-key token-bucket rate limiting."""
+
+from uuid import uuid4
+
+import pytest
+
+from src.core.rate_limiting import ApiKeyRateLimiter, TokenBucket
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test token bucket arithmetic with an explicit clock."""
+
+    def test_starts_full_and_drains(self):
+        bucket = TokenBucket(limit=3, now=0.0)
+
+        assert [bucket.acquire(0.0) for _ in range(4)] == [True, True, True, False]
+        assert bucket.remaining == 0
+        assert bucket.allowed is False
+
+    def test_refills_at_limit_per_minute(self):
+        bucket = TokenBucket(limit=60, now=0.0)
+        for _ in range(60):
+            bucket.acquire(0.0)
+
+        assert bucket.acquire(0.5) is False
+        assert bucket.acquire(1.0) is True
+
+    def test_refill_capped_at_limit(self):
+        bucket = TokenBucket(limit=5, now=0.0)
+        bucket.acquire(0.0)
+
+        bucket.peek(3600.0)
+        assert bucket.remaining == 5
+
+    def test_headers(self):
+        bucket = TokenBucket(limit=60, now=0.0)
+        bucket.acquire(0.0)
+
+        assert bucket.headers() == {
+            "RateLimit-Limit": "60",
+            "RateLimit-Remaining": "59",
+            "RateLimit-Reset": "1",
+        }
+
+    def test_rejected_headers_include_retry_after(self):
+        bucket = TokenBucket(limit=2, now=0.0)
+        for _ in range(3):
+            bucket.acquire(0.0)
+
+        headers = bucket.headers()
+        assert headers["RateLimit-Remaining"] == "0"
+        assert headers["RateLimit-Reset"] == "60"
+        assert headers["Retry-After"] == "30"
+
+    def test_raising_limit_adds_tokens(self):
+        bucket = TokenBucket(limit=2, now=0.0)
+        bucket.acquire(0.0)
+        bucket.acquire(0.0)
+
+        bucket.set_limit(10)
+        assert bucket.remaining == 8
+
+    def test_lowering_limit_clamps_tokens(self):
+        bucket = TokenBucket(limit=100, now=0.0)
+
+        bucket.set_limit(5)
+        assert bucket.remaining == 5
+
+
+@pytest.mark.unit
+class TestApiKeyRateLimiter:
+    """Test the per-key limiter."""
+
+    def test_keys_are_limited_independently(self):
+        limiter = ApiKeyRateLimiter()
+        noisy, quiet = uuid4(), uuid4()
+
+        for _ in range(2):
+            assert limiter.acquire(noisy, 2).allowed is True
+        assert limiter.acquire(noisy, 2).allowed is False
+        assert limiter.acquire(quiet, 2).allowed is True
+
+        assert limiter.get_stats() == {
+            "tracked_keys": 2,
+            "allowed": 3,
+            "rejected": 1,
+        }
+
+    def test_changed_limit_applies_on_next_acquire(self):
+        limiter = ApiKeyRateLimiter()
+        key_id = uuid4()
+
+        limiter.acquire(key_id, 1)
+        assert limiter.acquire(key_id, 1).allowed is False
+        assert limiter.acquire(key_id, 5).allowed is True
+
+    def test_set_limit_updates_existing_bucket(self):
+        limiter = ApiKeyRateLimiter()
+        key_id = uuid4()
+
+        limiter.acquire(key_id, 1)
+        limiter.set_limit(key_id, 3)
+        assert limiter.acquire(key_id, 3).remaining == 1
+
+    def test_peek_does_not_consume(self):
+        limiter = ApiKeyRateLimiter()
+        key_id = uuid4()
+
+        assert limiter.peek(key_id, 1) is True
+        limiter.acquire(key_id, 1)
+        assert limiter.peek(key_id, 1) is False
+        assert limiter.get_stats()["allowed"] == 1
+
+    def test_forget_resets_bucket(self):
+        limiter = ApiKeyRateLimiter()
+        key_id = uuid4()
+
+        limiter.acquire(key_id, 1)
+        limiter.forget(key_id)
+        assert limiter.acquire(key_id, 1).allowed is True
@@ -34,3 +34,202 @@ class TestApiKeyAuthMiddleware:
         response = client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
+
+    def test_root_exempt_only_exactly(self, test_app):
+        """Root path is exempt, but not as a prefix for everything else."""
+
+        @test_app.get("/")
+        def root():
+            return {"status": "root"}
+
+        @test_app.get("/protected")
+        def protected():
+            return {"status": "ok"}
+
+        client = TestClient(test_app)
+        assert client.get("/").status_code == 200
+        assert client.get("/protected").status_code == 401
+
+    def test_missing_api_key_returns_401(self, test_app):
+        """Requests without X-API-Key get the standard 401 body."""
+
+        @test_app.get("/protected")
+        def protected():
+            return {"status": "ok"}
+
+        response = TestClient(test_app).get("/protected")
+
+        assert response.status_code == 401
+        assert response.json() == {
+            "error": True,
+            "message": "API key required. Provide Bearer: Authorization header.",
+            "status_code": 401,
+            "path": "/protected",
+        }
+
+    def test_invalid_api_key_returns_401(self, test_app):
+        """Keys the service rejects get the standard 401 body."""
+        from unittest.mock import AsyncMock, patch
+
+        @test_app.get("/protected")
+        def protected():
+            return {"status": "ok"}
+
+        service = AsyncMock()
+        service.authenticate_api_key.return_value = None
+
+        with patch(
+            "src.core.auth.create_api_key_service",
+            AsyncMock(return_value=service),
+        ):
+            response = TestClient(test_app).get(
+                "/protected", headers={"X-API-Key": "sk_live_bad"}
+            )
+
+        assert response.status_code == 401
+        assert response.json()["message"] == "Invalid API key"
+
+    def test_valid_api_key_sets_request_state(self, test_app):
+        """Authenticated requests expose key info and client IP downstream."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from fastapi import Request
+
+        @test_app.get("/protected")
+        def protected(request: Request):
+            return {
+                "name": request.state.api_key_info["name"],
+                "client_ip": request.state.client_ip,
+            }
+
+        key = MagicMock()
+        key.model_dump.return_value = {"name": "test-key"}
+        service = AsyncMock()
+        service.authenticate_api_key.return_value = key
+
+        with patch(
+            "src.core.auth.create_api_key_service",
+            AsyncMock(return_value=service),
+        ):
+            response = TestClient(test_app).get(
+                "/protected",
+                headers={
+                    "X-API-Key": "sk_live_test",
+                    "X-Forwarded-For": "203.0.113.7, 10.0.0.1",
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.json() == {"name": "test-key", "client_ip": "203.0.113.7"}
+        service.authenticate_api_key.assert_awaited_once_with(
+            "sk_live_test", "203.0.113.7"
+        )
+
+    def test_downstream_error_returns_500(self, test_app):
+        """Unhandled errors before the response starts keep the auth 500 body."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        @test_app.get("/broken")
+        def broken():
+            raise RuntimeError("boom")
+
+        key = MagicMock()
+        key.model_dump.return_value = {"name": "test-key"}
+        service = AsyncMock()
+        service.authenticate_api_key.return_value = key
+
+        with patch(
+            "src.core.auth.create_api_key_service",
+            AsyncMock(return_value=service),
+        ):
+            response = TestClient(test_app).get(
+                "/broken", headers={"X-API-Key": "sk_live_test"}
+            )
+
+        assert response.status_code == 500
+        assert response.json() == {
+            "error": True,
+            "message": "Authentication service error",
+            "status_code": 500,
+            "path": "/broken",
+        }
+
+    def test_rate_limit_per_api_key(self, test_app):
+        """Keys are held to their own rate_limit_rpm with RateLimit-* headers."""
+        from unittest.mock import AsyncMock, MagicMock, patch
+        from uuid import uuid4
+
+        from src.core.rate_limiting import ApiKeyRateLimiter
+
+        @test_app.get("/protected")
+        def protected():
+            return {"status": "ok"}
+
+        key = MagicMock()
+        key.model_dump.return_value = {
+            "id": uuid4(),
+            "name": "test-key",
+            "rate_limit_rpm": 2,
+        }
+        service = AsyncMock()
+        service.authenticate_api_key.return_value = key
+
+        with (
+            patch(
+                "src.core.auth.create_api_key_service",
+                AsyncMock(return_value=service),
+            ),
+            patch("src.core.auth.api_key_rate_limiter", ApiKeyRateLimiter()),
+        ):
+            client = TestClient(test_app)
+            headers = {"X-API-Key": "sk_live_test"}
+            first = client.get("/protected", headers=headers)
+            client.get("/protected", headers=headers)
+            limited = client.get("/protected", headers=headers)
+
+        assert first.status_code == 200
+        assert first.headers["RateLimit-Limit"] == "2"
+        assert first.headers["RateLimit-Remaining"] == "1"
+
+        assert limited.status_code == 429
+        assert limited.headers["RateLimit-Remaining"] == "0"
+        assert int(limited.headers["Retry-After"]) >= 1
+        assert limited.json() == {
+            "error": True,
+            "message": "Rate limit exceeded for this API key",
+            "status_code": 429,
+            "path": "/protected",
+        }
+
+    def test_saturated_hash_executor_returns_503(self, test_app):
+        """Saturated auth capacity should fast-reject with 503 and Retry-After."""
+        from unittest.mock import AsyncMock, patch
+
+        from src.core.exceptions import ServiceUnavailableError
+
+        @test_app.get("/protected")
+        def protected():
+            return {"status": "ok"}
+
+        service = AsyncMock()
+        service.authenticate_api_key.side_effect = ServiceUnavailableError(
+            "Authentication is temporarily overloaded, please retry",
+            retry_after=1,
+        )
+
+        with patch(
+            "src.core.auth.create_api_key_service",
+            AsyncMock(return_value=service),
+        ):
+            response = TestClient(test_app).get(
+                "/protected", headers={"X-API-Key": "sk_live_test"}
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert response.json() == {
+            "error": True,
+            "message": "Authentication is temporarily overloaded, please retry",
+            "status_code": 503,
+            "path": "/protected",
+        }
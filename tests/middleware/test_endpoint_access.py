@@ -1,8 +1,13 @@
 """Tests for endpoint access control middleware."""
 
+from unittest.mock import patch
+
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from src.core.config import Settings
+from src.core.endpoint_access import EndpointAccessMiddleware
 
 # Test constants
 TEST_CORS_ORIGIN = "https://example.com"
@@ -56,3 +61,56 @@ class TestEndpointAccessControl:
 
         # should_require_auth should override and return True for production
         assert settings.should_require_auth is True
+
+
+class TestEndpointAccessMiddleware:
+    """Test the endpoint access middleware on a minimal app."""
+
+    @staticmethod
+    def _make_client(environment: str, public_endpoints=None) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(EndpointAccessMiddleware, public_endpoints=public_endpoints)
+
+        @app.get("/api/v1/problems/random")
+        def random_problem():
+            return {"status": "ok"}
+
+        @app.get("/api/v1/verbs/random")
+        def random_verb():
+            return {"status": "ok"}
+
+        settings = Settings(environment=environment, cors_origins=[TEST_CORS_ORIGIN])
+        patch("src.core.endpoint_access.get_settings", return_value=settings).start()
+        return TestClient(app)
+
+    @pytest.fixture(autouse=True)
+    def _stop_patches(self):
+        yield
+        patch.stopall()
+
+    def test_development_allows_all(self):
+        client = self._make_client("development", public_endpoints=[])
+
+        assert client.get("/api/v1/verbs/random").status_code == 200
+
+    def test_staging_blocks_non_public_endpoint(self):
+        client = self._make_client(
+            "staging", public_endpoints=["/api/v1/problems/random", "/health"]
+        )
+
+        assert client.get("/api/v1/problems/random").status_code == 200
+
+        response = client.get("/api/v1/verbs/random")
+        assert response.status_code == 403
+        assert response.json() == {
+            "error": "Forbidden",
+            "message": "This endpoint is not publicly accessible",
+            "detail": "Access to this endpoint is restricted in production/staging environments",
+        }
+
+    def test_default_public_endpoints_include_root_prefix(self):
+        """The "/" entry matches by prefix, so every path stays reachable."""
+        client = self._make_client("production")
+
+        assert client.get("/api/v1/problems/random").status_code == 200
+        assert client.get("/api/v1/verbs/random").status_code == 200
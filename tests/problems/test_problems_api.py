@@ -9,17 +9,39 @@ Test Categories:
 - Validation tests (@pytest.mark.unit): Mock services, test parameter validation
 """
 
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.models.problems import ProblemResponse
 from src.api.problems import API_PREFIX, get_queue_service
+from src.cache.problem_pool import PooledProblem
+from src.core.dependencies import get_problem_service
 from src.main import ROUTER_PREFIX, app
+from src.schemas.problems import Problem, ProblemProjection
+from tests.problems.fixtures import (
+    generate_random_problem_data,
+    sample_problem,  # noqa: F401
+)
 
 PROBLEMS_PREFIX = f"{ROUTER_PREFIX}{API_PREFIX}"
 
 
+def make_problem() -> Problem:
+    """A stored problem with random content."""
+    now = datetime.now()
+    return Problem(
+        **generate_random_problem_data(),
+        id=uuid4(),
+        created_at=now,
+        updated_at=now,
+    )
+
+
 # =============================================================================
 # Test Client Fixtures with Dependency Overrides
 # =============================================================================
@@ -241,6 +263,135 @@ class TestProblemsAPIContracts:
         assert response.status_code == 404
         assert "not found" in response.json()["message"].lower()
 
+    @pytest.mark.parametrize(
+        "include_metadata,projection",
+        [(False, ProblemProjection.SERVING), (True, ProblemProjection.FULL)],
+    )
+    def test_get_problem_by_id_projection(
+        self, client, sample_problem, include_metadata, projection
+    ):
+        """The generation trace is only read when metadata is requested."""
+        test_client, _ = client
+        service = app.dependency_overrides[get_problem_service]()
+        service.problems = {sample_problem.id: sample_problem}
+
+        response = test_client.get(
+            f"{PROBLEMS_PREFIX}/{sample_problem.id}",
+            params={"include_metadata": include_metadata},
+        )
+
+        assert response.status_code == 200
+        assert service.projections == [projection]
+
+
+@pytest.mark.integration
+class TestRandomProblemServing:
+    """Test /random serving from the problem pool and the database."""
+
+    def test_random_problem_from_pool_sends_rendered_body(
+        self, client, sample_problem, monkeypatch
+    ):
+        """A pooled problem's pre-rendered body should be sent unchanged."""
+        test_client, _ = client
+        body = ProblemResponse.render(sample_problem)
+        pool = MagicMock()
+        pool.take.return_value = PooledProblem(sample_problem, 0.0, body)
+        monkeypatch.setattr("src.api.problems.problem_pool", pool)
+
+        response = test_client.get(f"{PROBLEMS_PREFIX}/random")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == body
+
+    def test_random_problem_with_metadata_reads_full_problem(
+        self, client, sample_problem, monkeypatch
+    ):
+        """Pooled problems have no generation trace, so metadata skips the pool."""
+        test_client, _ = client
+        pool = MagicMock()
+        monkeypatch.setattr("src.api.problems.problem_pool", pool)
+        service = app.dependency_overrides[get_problem_service]()
+        service.problems = {sample_problem.id: sample_problem}
+
+        response = test_client.get(
+            f"{PROBLEMS_PREFIX}/random", params={"include_metadata": "true"}
+        )
+
+        assert response.status_code == 200
+        pool.take.assert_not_called()
+        assert service.projections == [ProblemProjection.FULL]
+
+    def test_random_problem_from_database(self, client, sample_problem):
+        """Without the pool, the problem is rendered on request."""
+        test_client, _ = client
+        app.dependency_overrides[get_problem_service]().problems = {
+            sample_problem.id: sample_problem
+        }
+
+        service = app.dependency_overrides[get_problem_service]()
+
+        response = test_client.get(f"{PROBLEMS_PREFIX}/random")
+
+        assert response.status_code == 200
+        assert response.json() == json.loads(ProblemResponse.render(sample_problem))
+        assert response.json()["metadata"] is None
+        assert service.projections == [ProblemProjection.SERVING]
+
+    def test_random_problems_batch(self, client):
+        """count=N should return a list of distinct problems."""
+        test_client, _ = client
+        problems = [make_problem() for _ in range(5)]
+        app.dependency_overrides[get_problem_service]().problems = {
+            p.id: p for p in problems
+        }
+
+        response = test_client.get(
+            f"{PROBLEMS_PREFIX}/random",
+            params={"count": 3, "include_metadata": "true"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [p["id"] for p in data] == [str(p.id) for p in problems[:3]]
+        assert data[0]["metadata"] == problems[0].metadata
+
+    def test_random_problems_batch_pool_then_database(
+        self, client, sample_problem, monkeypatch
+    ):
+        """The pool is drained first, the database fills the rest without duplicates."""
+        test_client, _ = client
+        other = sample_problem.model_copy(update={"id": uuid4()})
+        pool = MagicMock()
+        pool.take.side_effect = [PooledProblem(sample_problem, 0.0), None]
+        monkeypatch.setattr("src.api.problems.problem_pool", pool)
+        app.dependency_overrides[get_problem_service]().problems = {
+            sample_problem.id: sample_problem,
+            other.id: other,
+        }
+
+        response = test_client.get(f"{PROBLEMS_PREFIX}/random", params={"count": 2})
+
+        assert response.status_code == 200
+        assert [p["id"] for p in response.json()] == [str(sample_problem.id)]
+
+    def test_random_problems_batch_not_found(self, client):
+        """An empty batch should be a 404 like the single problem."""
+        test_client, _ = client
+
+        response = test_client.get(f"{PROBLEMS_PREFIX}/random", params={"count": 5})
+
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("count", [0, 51])
+    def test_random_problems_count_bounds(self, client, count):
+        """count must be between 1 and the server-side cap."""
+        test_client, _ = client
+
+        response = test_client.get(f"{PROBLEMS_PREFIX}/random", params={"count": count})
+
+        assert response.status_code == 422
+
 
 # =============================================================================
 # Topic Tags Contract Tests
@@ -26,13 +26,13 @@ class ErrorRaisingProblemService:
     def __init__(self, error: Exception = None):
         self.error = error
 
-    async def get_least_recently_served_problem(self, filters=None):
+    async def get_least_recently_served_problem(self, projection=None):
         """Mock that raises the configured error."""
         if self.error:
             raise self.error
         return None  # No problems found
 
-    async def get_problem_by_id(self, problem_id):
+    async def get_problem_by_id(self, problem_id, projection=None):
         """Mock get problem by ID."""
         if self.error:
             raise self.error
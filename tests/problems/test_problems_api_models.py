@@ -1,10 +1,14 @@
 """Unit tests for Problem API models."""
 
+import json
+
 import pytest
+from fastapi.encoders import jsonable_encoder
 from pydantic import ValidationError
 
-from src.api.models.problems import ProblemRandomRequest
+from src.api.models.problems import ProblemRandomRequest, ProblemResponse
 from src.schemas.problems import GrammarProblemConstraints
+from tests.problems.fixtures import sample_problem  # noqa: F401
 
 
 @pytest.mark.unit
@@ -118,3 +122,28 @@ class TestProblemRandomRequest:
         assert "test_data" in request.topic_tags
         assert request.constraints.includes_negation is True
         assert len(request.constraints.verb_infinitives) == 2
+
+
+@pytest.mark.unit
+class TestProblemResponseRender:
+    """Test pre-rendered problem response bodies."""
+
+    @pytest.mark.parametrize("include_metadata", [False, True])
+    def test_render_matches_model_serialization(self, sample_problem, include_metadata):
+        """Rendered bytes should decode to what FastAPI sends for the model."""
+        sample_problem.metadata = {"grammatical_focus": ["négation"]}
+
+        body = ProblemResponse.render(sample_problem, include_metadata)
+
+        expected = jsonable_encoder(
+            ProblemResponse.from_problem(sample_problem, include_metadata)
+        )
+        assert json.loads(body) == expected
+
+    def test_render_omits_metadata_by_default(self, sample_problem):
+        """Metadata fields should be null unless requested."""
+        data = json.loads(ProblemResponse.render(sample_problem))
+
+        assert data["metadata"] is None
+        assert data["source_statement_ids"] is None
+        assert data["generation_trace"] is None
@@ -1,14 +1,18 @@
 """Test cases for problem repository using Supabase client only."""
 
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
 from src.core.exceptions import RepositoryError
+from src.repositories.problem_repository import PROJECTION_COLUMNS, ProblemRepository
 from src.schemas.problems import (
     Problem,
     ProblemCreate,
     ProblemFilters,
+    ProblemProjection,
     ProblemType,
     ProblemUpdate,
 )
@@ -87,6 +91,30 @@ class TestProblemRepository:
         assert result.id == created_problem.id
         assert result.title == problem_data["title"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_generation_trace_only_read_when_requested(self, problem_repository):
+        """Test that the default projection leaves out the generation trace."""
+        problem_data = generate_random_problem_data()
+        problem_data["generation_trace"] = {"sentences": [{"reasoning": "..."}]}
+        created_problem = await problem_repository.create_problem(
+            ProblemCreate(**problem_data)
+        )
+
+        try:
+            serving = await problem_repository.get_problem(created_problem.id)
+            full = await problem_repository.get_problem(
+                created_problem.id, ProblemProjection.FULL
+            )
+            trace = await problem_repository.get_problem_trace(created_problem.id)
+
+            assert serving.generation_trace is None
+            assert serving.statements == full.statements
+            assert full.generation_trace == problem_data["generation_trace"]
+            assert trace == problem_data["generation_trace"]
+        finally:
+            await problem_repository.delete_problem(created_problem.id)
+
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_problem_crud_operations_update(self, problem_repository):
@@ -306,3 +334,59 @@ class TestProblemRepository:
         finally:
             # Cleanup
             await problem_repository.delete_problem(created.id)
+
+
+def mock_client(data=None) -> MagicMock:
+    """A Supabase client whose queries return `data`."""
+    client = MagicMock()
+    query = MagicMock()
+    query.execute = AsyncMock(return_value=SimpleNamespace(data=data or []))
+    for method in ("select", "eq", "limit", "order"):
+        getattr(query, method).return_value = query
+    client.table.return_value = query
+    client.rpc.return_value = query
+    return client
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProblemProjections:
+    """Test which columns the repository reads."""
+
+    async def test_get_problem_leaves_out_generation_trace(self):
+        client = mock_client()
+
+        await ProblemRepository(client).get_problem(uuid4())
+
+        columns = client.table.return_value.select.call_args.args[0]
+        assert columns == PROJECTION_COLUMNS[ProblemProjection.SERVING]
+        assert "generation_trace" not in columns
+        assert "statements" in columns
+
+    async def test_get_problem_full(self):
+        client = mock_client()
+
+        await ProblemRepository(client).get_problem(uuid4(), ProblemProjection.FULL)
+
+        client.table.return_value.select.assert_called_once_with("*")
+
+    async def test_claim_next_problems_selects_projection(self):
+        client = mock_client()
+
+        await ProblemRepository(client).claim_next_problems(5)
+
+        client.rpc.assert_called_once_with("claim_next_problems", {"p_count": 5})
+        client.rpc.return_value.select.assert_called_once_with(
+            PROJECTION_COLUMNS[ProblemProjection.SERVING]
+        )
+
+    async def test_get_problem_trace(self):
+        problem_id = uuid4()
+        trace = {"sentences": []}
+        client = mock_client([{"id": str(problem_id), "generation_trace": trace}])
+
+        assert await ProblemRepository(client).get_problem_trace(problem_id) == trace
+        client.table.return_value.select.assert_called_once_with("id, generation_trace")
+
+    async def test_get_problem_trace_missing(self):
+        assert await ProblemRepository(mock_client()).get_problem_trace(uuid4()) is None
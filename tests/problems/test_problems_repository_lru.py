@@ -113,3 +113,45 @@ class TestProblemRepositoryLRU:
         updated_problem = await problem_repository.get_problem(problem.id)
         assert updated_problem is not None
         assert updated_problem.last_served_at is not None
+
+    async def test_claim_next_problems_stamps_last_served(self, problem_repository):
+        """Test that claiming returns problems already marked as served."""
+        claimed = await problem_repository.claim_next_problems(2)
+
+        assert 0 < len(claimed) <= 2
+        for problem in claimed:
+            assert problem.last_served_at is not None
+            stored = await problem_repository.get_problem(problem.id)
+            assert stored.last_served_at == problem.last_served_at
+
+    async def test_claim_next_problems_prioritizes_unserved(self, problem_repository):
+        """Test that a never-served problem is claimed before served ones."""
+        problem_data = generate_random_problem_data(
+            topic_tags=["test_data", "claim_unserved_test"]
+        )
+        problem = await problem_repository.create_problem(ProblemCreate(**problem_data))
+
+        # Anything created earlier and still unserved comes first, so claim
+        # until we reach the new problem
+        for _ in range(100):
+            claimed = await problem_repository.claim_next_problems(10)
+            assert claimed
+            if problem.id in {p.id for p in claimed}:
+                break
+        else:
+            pytest.fail("New problem was never claimed")
+
+    async def test_concurrent_claims_are_distinct(self, problem_repository):
+        """Test that concurrent callers never receive the same problem."""
+        for i in range(4):
+            problem_data = generate_random_problem_data(
+                topic_tags=["test_data", f"claim_concurrent_test_{i}"]
+            )
+            await problem_repository.create_problem(ProblemCreate(**problem_data))
+
+        results = await asyncio.gather(
+            *(problem_repository.claim_next_problems(1) for _ in range(4))
+        )
+
+        ids = [p.id for claimed in results for p in claimed]
+        assert len(ids) == len(set(ids))
@@ -15,6 +15,7 @@ from src.schemas.problems import (
     GrammarProblemConstraints,
     ProblemCreate,
     ProblemFilters,
+    ProblemProjection,
     ProblemType,
     ProblemUpdate,
 )
@@ -333,6 +334,68 @@ class TestProblemServiceAnalytics:
         assert unique_focus in random_problem.metadata.get("grammatical_focus", [])
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestProblemServiceLRU:
+    """Test LRU serving goes through the atomic claim."""
+
+    async def test_least_recently_served_problem_claims_one(self):
+        problem = object()
+        repository = AsyncMock()
+        repository.claim_next_problems.return_value = [problem]
+        service = ProblemService(problem_repository=repository)
+
+        assert await service.get_least_recently_served_problem() is problem
+        repository.claim_next_problems.assert_awaited_once_with(
+            1, ProblemProjection.SERVING
+        )
+        repository.update_problem_last_served.assert_not_called()
+
+    async def test_least_recently_served_problem_none_when_empty(self):
+        repository = AsyncMock()
+        repository.claim_next_problems.return_value = []
+        service = ProblemService(problem_repository=repository)
+
+        assert await service.get_least_recently_served_problem() is None
+
+    async def test_least_recently_served_problems(self):
+        problems = [object(), object(), object()]
+        repository = AsyncMock()
+        repository.claim_next_problems.return_value = problems
+        service = ProblemService(problem_repository=repository)
+
+        assert await service.get_least_recently_served_problems(3) == problems
+        repository.claim_next_problems.assert_awaited_once_with(
+            3, ProblemProjection.SERVING
+        )
+
+    async def test_least_recently_served_problems_with_projection(self):
+        repository = AsyncMock()
+        repository.claim_next_problems.return_value = []
+        service = ProblemService(problem_repository=repository)
+
+        await service.get_least_recently_served_problems(2, ProblemProjection.FULL)
+
+        repository.claim_next_problems.assert_awaited_once_with(
+            2, ProblemProjection.FULL
+        )
+
+    async def test_get_problem_by_id_with_projection(self):
+        problem = object()
+        repository = AsyncMock()
+        repository.get_problem.return_value = problem
+        service = ProblemService(problem_repository=repository)
+        problem_id = uuid4()
+
+        assert (
+            await service.get_problem_by_id(problem_id, ProblemProjection.FULL)
+            is problem
+        )
+        repository.get_problem.assert_awaited_once_with(
+            problem_id, ProblemProjection.FULL
+        )
+
+
 class TestProblemServiceParameterGeneration:
     """Test static methods for generating problem parameters."""
 
@@ -0,0 +1,98 @@
+"""Tests for sentence prompt helpers."""
+
+import uuid
+from datetime import datetime
+
+import pytest
+
+from src.cache.records import ConjugationRecord
+from src.prompts.sentences.helpers import get_conjugation_pair
+from src.schemas.sentences import Pronoun
+from src.schemas.verbs import AuxiliaryType, Conjugation, Tense, Verb
+
+
+@pytest.fixture
+def sample_verb():
+    """Create a sample verb for testing."""
+    return Verb(
+        id=uuid.uuid4(),
+        infinitive="parler",
+        translation="to speak",
+        past_participle="parlé",
+        present_participle="parlant",
+        auxiliary=AuxiliaryType.AVOIR,
+        reflexive=False,
+        target_language_code="eng",
+        can_have_cod=True,
+        can_have_coi=True,
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+@pytest.fixture
+def present_conjugation():
+    """Present tense of parler."""
+    return Conjugation(
+        id=uuid.uuid4(),
+        infinitive="parler",
+        auxiliary=AuxiliaryType.AVOIR,
+        reflexive=False,
+        tense=Tense.PRESENT,
+        first_person_singular="parle",
+        second_person_singular="parles",
+        third_person_singular="parle",
+        first_person_plural="parlons",
+        second_person_plural="parlez",
+        third_person_plural="parlent",
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+    )
+
+
+class TestGetConjugationPair:
+    """Tests for get_conjugation_pair."""
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_correct_form(self, sample_verb, present_conjugation, compact):
+        """Models and cache records give the same form."""
+        conjugation = (
+            ConjugationRecord.from_model(present_conjugation)
+            if compact
+            else present_conjugation
+        )
+
+        _, form, _ = get_conjugation_pair(
+            Pronoun.FIRST_PERSON_PLURAL, Tense.PRESENT, sample_verb, [conjugation]
+        )
+
+        assert form == "parlons"
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_wrong_form_differs(self, sample_verb, present_conjugation, compact):
+        """An incorrect form never matches the pronoun's form."""
+        conjugation = (
+            ConjugationRecord.from_model(present_conjugation)
+            if compact
+            else present_conjugation
+        )
+
+        for _ in range(20):
+            _, form, _ = get_conjugation_pair(
+                Pronoun.FIRST_PERSON,
+                Tense.PRESENT,
+                sample_verb,
+                [conjugation],
+                correct=False,
+            )
+            assert form in {"parles", "parlons", "parlez", "parlent"}
+
+    def test_missing_tense(self, sample_verb, present_conjugation):
+        """A tense without a conjugation is an error."""
+        with pytest.raises(ValueError, match="No conjugation found"):
+            get_conjugation_pair(
+                Pronoun.FIRST_PERSON,
+                Tense.IMPARFAIT,
+                sample_verb,
+                [present_conjugation],
+            )
@@ -0,0 +1,125 @@
+"""Tests for the batched API key usage accumulator."""
+
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.services.api_key_usage_service import ApiKeyUsageAccumulator
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestApiKeyUsageAccumulator:
+    """Test coalescing and flushing of API key usage."""
+
+    async def test_record_coalesces_per_key(self):
+        """Repeated uses of a key should collapse into one pending entry."""
+        accumulator = ApiKeyUsageAccumulator()
+        key_a, key_b = uuid4(), uuid4()
+
+        for _ in range(3):
+            accumulator.record(key_a)
+        accumulator.record(key_b)
+
+        stats = accumulator.get_stats()
+        assert stats["pending_keys"] == 2
+        assert stats["pending_increments"] == 4
+
+    async def test_flush_writes_one_bulk_call(self):
+        """Flushing should send all keys in a single repository call."""
+        repository = AsyncMock()
+        repository.increment_usage_bulk.return_value = True
+        accumulator = ApiKeyUsageAccumulator()
+        accumulator._repository = repository
+        key_a, key_b = uuid4(), uuid4()
+
+        for _ in range(5):
+            accumulator.record(key_a)
+        accumulator.record(key_b)
+
+        written = await accumulator.flush()
+
+        assert written == 6
+        repository.increment_usage_bulk.assert_awaited_once()
+        usage = repository.increment_usage_bulk.call_args.args[0]
+        assert usage[key_a][0] == 5
+        assert usage[key_b][0] == 1
+        assert usage[key_a][1].tzinfo is not None
+        assert accumulator.get_stats()["pending_keys"] == 0
+
+    async def test_failed_flush_keeps_counts(self):
+        """Counts should be retried on the next flush if a write fails."""
+        repository = AsyncMock()
+        repository.increment_usage_bulk.return_value = False
+        accumulator = ApiKeyUsageAccumulator()
+        accumulator._repository = repository
+        key = uuid4()
+
+        accumulator.record(key)
+        accumulator.record(key)
+        assert await accumulator.flush() == 0
+        accumulator.record(key)
+
+        stats = accumulator.get_stats()
+        assert stats["pending_increments"] == 3
+        assert stats["failed_flushes"] == 1
+
+        repository.increment_usage_bulk.return_value = True
+        assert await accumulator.flush() == 3
+        assert repository.increment_usage_bulk.call_args.args[0][key][0] == 3
+
+    async def test_flush_without_pending_is_noop(self):
+        """Nothing should be written when there is no pending usage."""
+        repository = AsyncMock()
+        accumulator = ApiKeyUsageAccumulator()
+        accumulator._repository = repository
+
+        assert await accumulator.flush() == 0
+        repository.increment_usage_bulk.assert_not_awaited()
+
+    async def test_threshold_triggers_early_flush(self):
+        """Reaching the size threshold should flush before the interval."""
+        repository = AsyncMock()
+        repository.increment_usage_bulk.return_value = True
+        accumulator = ApiKeyUsageAccumulator()
+        await accumulator.start(repository, flush_interval=60, flush_threshold=3)
+        try:
+            key = uuid4()
+            for _ in range(3):
+                accumulator.record(key)
+            await asyncio.sleep(0.01)
+
+            repository.increment_usage_bulk.assert_awaited_once()
+            assert accumulator.get_stats()["flushed_increments"] == 3
+        finally:
+            await accumulator.stop()
+
+    async def test_interval_flush(self):
+        """Pending usage should be flushed on the interval."""
+        repository = AsyncMock()
+        repository.increment_usage_bulk.return_value = True
+        accumulator = ApiKeyUsageAccumulator()
+        await accumulator.start(repository, flush_interval=0.01, flush_threshold=100)
+        try:
+            accumulator.record(uuid4())
+            await asyncio.sleep(0.05)
+
+            repository.increment_usage_bulk.assert_awaited_once()
+        finally:
+            await accumulator.stop()
+
+    async def test_stop_flushes_pending(self):
+        """Stopping should write out pending usage (shutdown)."""
+        repository = AsyncMock()
+        repository.increment_usage_bulk.return_value = True
+        accumulator = ApiKeyUsageAccumulator()
+        await accumulator.start(repository, flush_interval=60, flush_threshold=100)
+
+        accumulator.record(uuid4())
+        await accumulator.stop()
+
+        assert accumulator.running is False
+        repository.increment_usage_bulk.assert_awaited_once()
+        assert accumulator.get_stats()["pending_increments"] == 0
@@ -40,6 +40,37 @@ class TestMainApp:
         assert "version" in data
         assert "environment" in data
 
+    def test_readiness_endpoint_when_warm(self, client: TestClient, monkeypatch):
+        """Test the readiness endpoint once the hot caches are loaded."""
+        from src.api import health
+
+        readiness = {"ready": True, "caches": {}, "warming": False, "error": None}
+        monkeypatch.setattr(health.cache_warmup, "readiness", lambda: readiness)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+    def test_readiness_endpoint_while_warming(self, client: TestClient, monkeypatch):
+        """Test that the readiness endpoint returns 503 until the caches are warm."""
+        from src.api import health
+
+        readiness = {
+            "ready": False,
+            "caches": {"api_keys": True, "verbs": False, "conjugations": False},
+            "warming": True,
+            "error": None,
+        }
+        monkeypatch.setattr(health.cache_warmup, "readiness", lambda: readiness)
+
+        response = client.get("/health/ready")
+
+        assert response.status_code == 503
+        data = response.json()
+        assert data["status"] == "warming"
+        assert data["caches"]["verbs"] is False
+
     def test_cors_headers(self, client: TestClient):
         """Test that CORS headers are properly set."""
         # Test that a simple request works and has CORS headers
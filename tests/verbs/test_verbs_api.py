@@ -237,3 +237,33 @@ class TestVerbsAPIContracts:
 
         app.dependency_overrides.clear()
         reset_settings()
+
+    @pytest.mark.parametrize(
+        "path", [f"{VERBS_PREFIX}/parler", f"{VERBS_PREFIX}/parler/conjugations"]
+    )
+    def test_saturated_fallback_returns_503(self, client: TestClient, path):
+        """A rejected database fallback surfaces as 503 with Retry-After."""
+        from src.cache.single_flight import SingleFlight
+        from src.core.dependencies import get_verb_service
+        from tests.api.conftest import MockVerbService
+
+        saturated = SingleFlight("verbs", max_in_flight=0)
+
+        async def load():
+            pytest.fail("Rejected lookups must not reach the database")
+
+        class SaturatedVerbService(MockVerbService):
+            async def get_verb_by_infinitive(self, infinitive, **kwargs):
+                return await saturated.do(infinitive, load)
+
+            async def get_verb_with_conjugations(self, infinitive, **kwargs):
+                return await saturated.do(infinitive, load)
+
+        app.dependency_overrides[get_verb_service] = lambda: SaturatedVerbService()
+
+        response = client.get(path)
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert "retry" in response.json()["message"].lower()
+        assert saturated.get_stats()["rejected"] == 1
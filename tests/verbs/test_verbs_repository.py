@@ -226,6 +226,31 @@ class TestVerbRepository:
 
         assert created_infinitives.issubset(fetched_infinitives)
 
+    @pytest.mark.asyncio
+    @pytest.mark.integration
+    async def test_get_conjugations_page(self, verb_repository):
+        """Test keyset pages cover every conjugation exactly once."""
+        created = [
+            await verb_repository.upsert_conjugation(
+                ConjugationCreate(**generate_random_conjugation_data())
+            )
+            for _ in range(3)
+        ]
+
+        seen = []
+        after = None
+        while True:
+            page = await verb_repository.get_conjugations_page(after=after, limit=2)
+            seen.extend(c.id for c in page)
+            if len(page) < 2:
+                break
+            after = page[-1].id
+
+        assert seen == sorted(seen)
+        assert len(seen) == len(set(seen))
+        assert {c.id for c in created}.issubset(seen)
+        assert await verb_repository.count_conjugations() >= len(created)
+
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_search_verbs(self, verb_repository):